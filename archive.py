@@ -0,0 +1,110 @@
+from typing import Dict, List, Tuple
+from courses import Section
+
+
+class EliteArchive:
+
+    def __init__(self, size=5, min_distance=1) -> None:
+        """
+        Keeps the size most fitted distinct schedules seen across the generations of the genetic algorithm.
+        Any two archived schedules differ by at least min_distance genes (see `distance()`): a schedule
+        closer than that to an archived one only replaces it when it is more fitted.
+
+        Schedules are identified by a canonical key, the set of their (course, section number, section type),
+        so the same schedule in another gene order is only archived once.
+        """
+        assert size > 0 and min_distance > 0
+
+        self.__size = size
+        self.__min_distance = min_distance
+        self.__entries: Dict[frozenset, Tuple[ List[Tuple[str, Section]], int ]] = {}
+        self.__offers = 0
+
+
+    @staticmethod
+    def make_key(chromosome: List[ Tuple[str, Section] ]) -> frozenset:
+        return frozenset( (course, section.get_number(), section.get_type()) for course, section in chromosome )
+
+
+    @staticmethod
+    def distance(first_key: frozenset, second_key: frozenset):
+        """
+        Returns the number of genes of the longer schedule that are not in the other one.
+        """
+        return max( len(first_key - second_key), len(second_key - first_key) )
+
+
+    def get_threshold(self):
+        """
+        Returns the fitness a schedule must exceed to be archived, None while the archive is not full.
+        """
+        if len(self.__entries) < self.__size:
+            return None
+
+        return min( score for _, score in self.__entries.values() )
+
+
+    def offer(self, chromosome: List[ Tuple[str, Section] ], score):
+        """
+        Archives the chromosome if it is among the most fitted distinct schedules.
+
+        Returns:
+            True if it was archived, False if not.
+        """
+        self.__offers += 1
+
+        if (threshold := self.get_threshold()) is not None and score <= threshold:
+            return False
+
+        key = self.make_key(chromosome)
+
+        if key in self.__entries:
+            return False
+
+        # The archived schedules too close to this one, it must be more fitted than all of them
+        neighbours = [
+            other_key for other_key in self.__entries if self.distance(key, other_key) < self.__min_distance
+        ]
+
+        if any( self.__entries[other_key][1] >= score for other_key in neighbours ):
+            return False
+
+        for other_key in neighbours:
+            del self.__entries[other_key]
+
+        self.__entries[key] = ( list(chromosome), score )
+
+        if len(self.__entries) > self.__size:
+            del self.__entries[ min( self.__entries, key=lambda k: self.__entries[k][1] ) ]
+
+        return True
+
+
+    def offer_population(self, population: List[ List[Tuple[str, Section]] ], pop_fitness):
+        """
+        Offers every chromosome of the population (see `offer()`).
+        """
+        for chromosome, score in zip(population, pop_fitness):
+
+            # Cheaper than building the key of the chromosomes that cannot enter
+            if (threshold := self.get_threshold()) is None or score > threshold:
+                self.offer( chromosome, int(score) )
+
+
+    def get_schedules(self) -> List[ Tuple[ List[Tuple[str, Section]], int ] ]:
+        """
+        Returns the archived schedules and their fitness, most fitted first.
+        """
+        return sorted( self.__entries.values(), key=lambda entry: entry[1], reverse=True )
+
+
+    def get_offers(self):
+        return self.__offers
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    def __repr__(self) -> str:
+        return f'EliteArchive(size={self.__size}, min_distance={self.__min_distance}, schedules={len(self)})'
@@ -0,0 +1,315 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from courses import Section, parse_student_records
+from catalog import Catalog, read_catalog
+from catalog_cache import load_catalog_cache, load_or_compile_catalog
+from main import create_courses_pool
+from genetic import run_ga
+from archive import EliteArchive
+from result_cache import ResultCache, make_result_key
+from constraints import HardConstraints, CandidateCourses
+import argparse
+import random
+import json
+import time
+import sys
+import os
+
+
+def schedule_to_json(schedule: List[ Tuple[str, Section] ]) -> List[Dict]:
+    """
+    Converts a chromosome to a list of JSON serializable dicts, one for each course.
+    """
+    def format_time(t):
+        return f'{t.seconds // 3600:02}:{t.seconds % 3600 // 60:02}' if t is not None else None
+
+    return [
+        {
+            'course': course_code,
+            'section': section.get_number(),
+            'type': section.get_type(),
+            'instructor': section.get_instructor(),
+            'days': sorted( section.get_days() ),
+            'start': format_time( section.get_start_time() ),
+            'end': format_time( section.get_end_time() ),
+        }
+        for course_code, section in schedule
+    ]
+
+
+# State of a batch worker process, set once by `_init_batch_worker()`
+_batch_state = {}
+
+
+def check_worker_options(ga_options: Dict=None):
+    """
+    Raises ValueError if the `run_ga()` options cannot be used by the batch workers: the requests are already
+    spread over the workers, and a pool of fitness processes (workers) forked from each of them would hang
+    the worker when it exits.
+    """
+    if (ga_options or {}).get('workers', 1) > 1:
+        raise ValueError('run_ga workers cannot be used inside the batch workers, use more batch workers instead')
+
+
+def _init_batch_worker(catalog, ga_options, result_cache_options: Dict=None):
+    # A compiled catalog is loaded by each worker, so they share its memory-mapped pages
+    if isinstance(catalog, str):
+        catalog = load_catalog_cache(catalog)
+
+    _batch_state['catalog'] = catalog
+    _batch_state['ga_options'] = ga_options
+    _batch_state['result_cache'] = None
+
+    # Each worker has its own connection to the cache file
+    if result_cache_options is not None:
+        _batch_state['result_cache'] = ResultCache(**result_cache_options)
+        _batch_state['result_cache'].set_browser_version( catalog.get_browser_version() )
+
+
+def schedule_student(
+        request: Dict,
+        catalog: Catalog,
+        ga_options: Dict=None,
+        result_cache: ResultCache=None,
+        fitness_executor: ProcessPoolExecutor=None
+) -> Dict:
+    """
+    Runs the genetic algorithm for a single student request.
+
+    Args:
+        * request -- a dict with the keys:
+            - id: the student id, copied to the result.
+            - year, semester: the year and semester the student will be in.
+            - records: list of record lines (`course_code=mark`), same as the records file.
+            - preferences: (optional) dict of the `run_ga()` preferences.
+            - seed: (optional) seed of the random generator.
+            - alternatives: (optional) number of distinct schedules to return (see `EliteArchive`).
+            - constraints: (optional) dict of the `HardConstraints`, the sections that do not satisfy them
+                are pruned before the genetic algorithm (see `CandidateCourses`).
+            - required: (optional) list of the courses that must keep a candidate section, else the
+                request fails with EmptiedCourses before the genetic algorithm is run.
+                Defaults to the compulsory courses of the pool the student has not passed.
+        * catalog -- the shared Catalog (see `read_catalog()`).
+        * ga_options -- (optional) dict of `run_ga()` options, i.e. time_budget and stall_generations.
+        * result_cache -- (optional) ResultCache, set to the catalog's browser version. A request with the same
+            pool, preferences, seed and options as a cached one gets the cached result (see `make_result_key()`).
+        * fitness_executor -- (optional) started ProcessPoolExecutor, reused by `run_ga()` when ga_options has
+            workers (see `ParallelFitness`), i.e. when the requests are scheduled one after the other in this process.
+
+    Returns:
+        result -- a dict with the id, schedule, fitness, generations and latency_ms of the request (or error),
+            and the alternatives schedules with their fitness when requested. cached is True if it was cached.
+            With constraints, pruned lists the pool courses not passed and left without candidate sections.
+    """
+    start = time.perf_counter()
+
+    try:
+        courses = catalog.for_student(
+            str( request.get('year') ), str( request.get('semester') ),
+            parse_student_records( request.get('records', []) )
+        )
+
+        if request.get('constraints'):
+            courses = CandidateCourses( courses, HardConstraints.from_dict( request['constraints'] ) )
+
+        pool = create_courses_pool(courses, catalog.get_study_plan())
+        pruned = []
+
+        # The pool courses left without sections are reported, and fail the request when required.
+        # The passed courses of the pool are not scheduled, so they are neither required nor reported
+        if isinstance(courses, CandidateCourses):
+            compulsory = { code for semester in catalog.get_study_plan().get_compulsory_courses().values() for code in semester }
+            courses.check_required( request.get(
+                'required', [ code for code in pool if code in compulsory and not courses[code].is_passed() ]
+            ) )
+
+            emptied = set( courses.get_pruned() )
+            pruned = [ code for code in pool if code in emptied and not courses[code].is_passed() ]
+            pool = [ code for code in pool if code not in pruned ]
+
+        key = None
+
+        if result_cache is not None:
+            key = make_result_key(
+                catalog.get_browser_version(), request.get('year'), request.get('semester'), pool,
+                [ course_code for course_code in pool if courses[course_code].is_passed() ],
+                request.get('preferences', {}), request.get('seed'),
+                {
+                    **(ga_options or {}),
+                    'alternatives': request.get('alternatives'),
+                    'constraints': request.get('constraints'),
+                    'critical_path_priority': catalog.has_critical_path_priority()
+                }
+            )
+
+        if key is not None and (cached := result_cache.get(key)) is not None:
+            result = { 'id': request.get('id'), **cached, 'cached': True }
+
+        else:
+            if (seed := request.get('seed')) is not None:
+                random.seed(seed)
+
+            archive = EliteArchive( request['alternatives'] ) if request.get('alternatives') else None
+
+            best_schedule, best_fitness, generations = run_ga(
+                pool, courses,
+                section_index=catalog.get_section_index(),
+                archive=archive,
+                executor=fitness_executor,
+                **(ga_options or {}),
+                **request.get('preferences', {})
+            )
+            result = {
+                'schedule': schedule_to_json(best_schedule),
+                'fitness': best_fitness,
+                'generations': generations
+            }
+
+            if archive is not None:
+                result['alternatives'] = [
+                    { 'schedule': schedule_to_json(schedule), 'fitness': score } for schedule, score in archive.get_schedules()
+                ]
+
+            if key is not None:
+                result_cache.put(key, result)
+
+            result = { 'id': request.get('id'), **result, 'cached': False }
+
+        if isinstance(courses, CandidateCourses):
+            result['pruned'] = pruned
+
+    except Exception as e:
+        result = { 'id': request.get('id'), 'error': f'{type(e).__name__}: {e}' }
+
+    result['latency_ms'] = (time.perf_counter() - start) * 1000
+
+    return result
+
+
+def _schedule_student_worker(request: Dict) -> Dict:
+    return schedule_student( request, _batch_state['catalog'], _batch_state['ga_options'], _batch_state['result_cache'] )
+
+
+def run_batch(
+        requests: Iterable[Dict],
+        catalog,
+        workers=None,
+        max_pending=None,
+        ga_options: Dict=None,
+        result_cache_options: Dict=None
+) -> Iterator[Dict]:
+    """
+    Schedules a stream of student requests on a pool of worker processes.
+    The catalog is sent once to each worker, and at most max_pending requests are in flight,
+    so the input stream is not read ahead of the workers.
+
+    Args:
+        * requests -- iterable of requests (see `schedule_student()`).
+        * catalog -- the shared Catalog (see `read_catalog()`).
+        * workers -- number of worker processes, defaults to the number of CPUs.
+        * max_pending -- maximum number of submitted requests, defaults to 4 per worker.
+        * ga_options -- (optional) dict of `run_ga()` options used for every request (see `schedule_student()`),
+            without workers (see `check_worker_options()`).
+        * result_cache_options -- (optional) dict of ResultCache arguments (filename, ttl, max_entries),
+            each worker opens the same cache file.
+
+    Yields:
+        the result of each request, in the same order as the requests.
+    """
+    check_worker_options(ga_options)
+
+    workers = workers or os.cpu_count()
+    max_pending = max_pending or 4 * workers
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=(catalog, ga_options, result_cache_options)) as executor:
+
+        for request in requests:
+            pending.append( executor.submit(_schedule_student_worker, request) )
+
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def summarize(latencies: List[float], seconds) -> Dict:
+    """
+    Returns the throughput and latency percentiles of a batch run.
+    """
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        return latencies[ min( len(latencies) - 1, int(p / 100 * len(latencies)) ) ] if latencies else 0.0
+
+    return {
+        'students': len(latencies),
+        'seconds': seconds,
+        'students_per_second': len(latencies) / seconds if seconds else 0.0,
+        'latency_ms_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+        'latency_ms_p50': percentile(50),
+        'latency_ms_p99': percentile(99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Schedule a batch of students (JSONL in, JSONL out).')
+    parser.add_argument('input', help="JSONL file of student requests, '-' for stdin")
+    parser.add_argument('output', help="JSONL file of results, '-' for stdout")
+    parser.add_argument('--study-plan', default='CEStudyPlan.txt')
+    parser.add_argument('--electives', default='Electives.txt')
+    parser.add_argument('--browser', default='courseBrowser_1.json')
+    parser.add_argument('--cache', default=None, help='compiled catalog file, created or refreshed if stale')
+    parser.add_argument(
+        '--critical-path-priority', action='store_true',
+        help='prioritize the courses by all the courses that depend on them, directly or not'
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--time-budget', type=float, default=None, help='GA wall-clock budget per student, in seconds')
+    parser.add_argument('--stall-generations', type=int, default=None, help='stop the GA after N generations without improvement')
+    parser.add_argument('--max-generations', type=int, default=None)
+    parser.add_argument('--greedy-init', action='store_true', help='build a conflict-free first generation')
+    parser.add_argument('--result-cache', default=None, help='SQLite file caching the results across runs')
+    parser.add_argument('--result-ttl', type=float, default=None, help='seconds after which a cached result expires')
+    parser.add_argument('--result-max-entries', type=int, default=None)
+    args = parser.parse_args()
+
+    ga_options = {
+        'time_budget': args.time_budget,
+        'stall_generations': args.stall_generations,
+        'max_generations': args.max_generations,
+        'greedy_init': args.greedy_init,
+    }
+
+    result_cache_options = None
+
+    if args.result_cache:
+        result_cache_options = { 'filename': args.result_cache, 'ttl': args.result_ttl, 'max_entries': args.result_max_entries }
+
+    if args.cache:
+        load_or_compile_catalog(
+            args.cache, args.study_plan, args.electives, args.browser, critical_path_priority=args.critical_path_priority
+        )
+        catalog = args.cache
+    else:
+        catalog = read_catalog(args.study_plan, args.electives, args.browser, critical_path_priority=args.critical_path_priority)
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, 'r')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w')
+
+    requests = ( json.loads(line) for line in input_file if line.strip() )
+    latencies = []
+    start = time.perf_counter()
+
+    with input_file, output_file:
+        for result in run_batch(requests, catalog, args.workers, ga_options=ga_options, result_cache_options=result_cache_options):
+            latencies.append( result['latency_ms'] )
+            output_file.write( json.dumps(result) + '\n' )
+
+    print( json.dumps( summarize(latencies, time.perf_counter() - start) ), file=sys.stderr )
+
+
+if __name__ == '__main__':
+    main()
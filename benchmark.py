@@ -0,0 +1,454 @@
+from studyplan import read_study_plan, read_electives
+from courses import SectionIndex, read_sections, read_sections_streaming, parse_student_records
+from synthetic import (
+    generate_course_browser, generate_study_plan, generate_electives, generate_records
+)
+from catalog import read_catalog
+from catalog_cache import compile_catalog, load_catalog_cache
+from main import create_courses_pool
+from solver import ENGINES, solve
+from exact import NODE_LIMIT, TIME_LIMIT
+from mutation import MutationOperator
+from selection import Selection
+from concurrent.futures import ProcessPoolExecutor
+import genetic
+import numpy as np
+import platform
+import datetime
+import json
+import sys
+import multiprocessing
+import tempfile
+import argparse
+import resource
+import random
+import time
+import os
+
+
+def load_sample_catalog(browser_file, student_year='3', student_semester='1'):
+    """
+    Reads the repository's study plan and electives, with the sections from browser_file.
+
+    Returns:
+        study_plan, college_courses, section_index
+    """
+    study_plan, college_courses = read_study_plan(
+        'CEStudyPlan.txt', 'Computer Engineering', 158, student_year, student_semester
+    )
+    college_courses = read_electives('Electives.txt', study_plan, college_courses)
+    college_courses = read_sections(browser_file, college_courses)
+
+    return study_plan, college_courses, SectionIndex(college_courses)
+
+
+def benchmark_workers(max_workers, population=1000, seed=0):
+    """
+    Times run_ga with 1 to max_workers fitness processes on a synthetic course browser.
+    The pool of each number of workers is started before the run is timed, and reused by it (see `ParallelFitness`).
+    The chromosomes are scored by `fitness()` in the workers: the speedup needs a free CPU for each worker,
+    and a population large enough to outweigh sending the chunks to the workers and back every generation.
+
+    Returns:
+        results -- a list of dicts (workers, cpus, seconds, speedup, fitness), one for each number of workers.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        browser_file = os.path.join(tmp_dir, 'courseBrowser.json')
+
+        study_plan, college_courses = read_study_plan('CEStudyPlan.txt', 'Computer Engineering', 158, None, None)
+        college_courses = read_electives('Electives.txt', study_plan, college_courses)
+        generate_course_browser(browser_file, list(college_courses), seed=seed)
+
+        study_plan, college_courses, section_index = load_sample_catalog(browser_file)
+
+    pool = create_courses_pool(college_courses, study_plan)
+    results = []
+
+    # run_ga reads the population size from the module, it is restored for the later runs of this process
+    default_population, genetic.MAX_POPULATION = genetic.MAX_POPULATION, population
+
+    try:
+        for workers in range(1, max_workers + 1):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                executor.submit(os.getpid).result()
+                random.seed(seed)
+
+                start = time.perf_counter()
+                _, best_fitness, _ = genetic.run_ga(
+                    pool, college_courses, section_index=section_index, workers=workers, executor=executor, days_off=1
+                )
+                seconds = time.perf_counter() - start
+
+            results.append({
+                'workers': workers,
+                'cpus': os.cpu_count(),
+                'seconds': seconds,
+                'speedup': results[0]['seconds'] / seconds if results else 1.0,
+                'fitness': best_fitness,
+            })
+
+    finally:
+        genetic.MAX_POPULATION = default_population
+
+    return results
+
+
+def _measure_parser(parser, browser_file):
+    """
+    Runs in a fresh process, so the peak RSS only includes this parser.
+    """
+    study_plan, college_courses = read_study_plan('CEStudyPlan.txt', 'Computer Engineering', 158, None, None)
+    college_courses = read_electives('Electives.txt', study_plan, college_courses)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    college_courses = parser(browser_file, college_courses)
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': seconds,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'peak_rss_increase_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024,
+        'sections': sum( len( course.get_sections() ) for course in college_courses.values() ),
+    }
+
+
+def benchmark_parsing(num_sections=100_000, seed=0):
+    """
+    Compares `read_sections()` with `read_sections_streaming()` on a synthetic course browser,
+    where most of the sections belong to courses outside the study plan.
+
+    Returns:
+        results -- a dict with the parse time and peak RSS (MB) of each parser.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        browser_file = os.path.join(tmp_dir, 'courseBrowser.json')
+
+        study_plan, college_courses = read_study_plan('CEStudyPlan.txt', 'Computer Engineering', 158, None, None)
+        college_courses = read_electives('Electives.txt', study_plan, college_courses)
+
+        # 4 sections for each course, the study plan courses and many other courses of the university
+        course_codes = list(college_courses) + [ f'UNIV{i:05}' for i in range( num_sections // 4 - len(college_courses) ) ]
+        generate_course_browser(browser_file, course_codes, min_sections=4, max_sections=4, seed=seed)
+
+        results = {}
+        context = multiprocessing.get_context('spawn')
+
+        for name, parser in ( ('read_sections', read_sections), ('read_sections_streaming', read_sections_streaming) ):
+            with context.Pool(1) as pool:
+                results[name] = pool.apply(_measure_parser, (parser, browser_file))
+
+    return results
+
+
+def benchmark_catalog_cache(sections_per_course=20, repeats=5, seed=0):
+    """
+    Compares reading the catalog from the text files with loading the compiled catalog cache.
+
+    Returns:
+        results -- a dict with the best time (seconds) of each way of loading the catalog.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        browser_file = os.path.join(tmp_dir, 'courseBrowser.json')
+        cache_file = os.path.join(tmp_dir, 'catalog.bin')
+        source_files = ['CEStudyPlan.txt', 'Electives.txt', browser_file]
+
+        study_plan, college_courses = read_study_plan('CEStudyPlan.txt', 'Computer Engineering', 158, None, None)
+        college_courses = read_electives('Electives.txt', study_plan, college_courses)
+        generate_course_browser(browser_file, list(college_courses), sections_per_course, sections_per_course, seed=seed)
+
+        def best_time(load):
+            times = []
+
+            for _ in range(repeats):
+                start = time.perf_counter()
+                load()
+                times.append( time.perf_counter() - start )
+
+            return min(times)
+
+        catalog = read_catalog(*source_files)
+        compile_catalog(cache_file, catalog, source_files)
+
+        return {
+            'sections': len( catalog.get_section_index() ),
+            'text_seconds': best_time( lambda: read_catalog(*source_files) ),
+            'cache_seconds': best_time( lambda: load_catalog_cache(cache_file, source_files) ),
+        }
+
+
+ENGINE_CATALOGS = {
+    'sample': (1, 5),    # sections per course, as in the repository's course browser
+    'large': (10, 30),
+}
+
+ENGINE_PREFERENCES = [
+    {'days_off': 1},
+    {'credit_hours': 15},
+    {'instructor': 'Instructor 3', 'days_off': 2},
+]
+
+
+def benchmark_engines(node_limit=NODE_LIMIT, time_limit=TIME_LIMIT, seed=0):
+    """
+    Compares the fitness and the latency of the solver ENGINES, on a sample-size and a large synthetic
+    course browser, for a few preferences.
+
+    Returns:
+        results -- a list of dicts (catalog, sections, preferences, engine, used, seconds, fitness).
+    """
+    results = []
+
+    for catalog_name, (min_sections, max_sections) in ENGINE_CATALOGS.items():
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            browser_file = os.path.join(tmp_dir, 'courseBrowser.json')
+
+            study_plan, college_courses = read_study_plan('CEStudyPlan.txt', 'Computer Engineering', 158, None, None)
+            college_courses = read_electives('Electives.txt', study_plan, college_courses)
+            generate_course_browser(browser_file, list(college_courses), min_sections, max_sections, seed=seed)
+
+            study_plan, college_courses, section_index = load_sample_catalog(browser_file)
+
+        pool = create_courses_pool(college_courses, study_plan)
+
+        for preferences in ENGINE_PREFERENCES:
+            for engine in ENGINES:
+                random.seed(seed)
+
+                start = time.perf_counter()
+                _, best_fitness, used = solve(
+                    pool, college_courses, section_index, engine,
+                    node_limit=node_limit, time_limit=time_limit, **preferences
+                )
+                seconds = time.perf_counter() - start
+
+                results.append({
+                    'catalog': catalog_name,
+                    'sections': len(section_index),
+                    'preferences': preferences,
+                    'engine': engine,
+                    'used': used,
+                    'seconds': seconds,
+                    'fitness': best_fitness,
+                })
+
+    return results
+
+
+def benchmark_suite(
+        num_courses=60,
+        num_electives=20,
+        min_sections=1,
+        max_sections=5,
+        num_students=20,
+        population=100,
+        seed=0
+):
+    """
+    Times every stage of the schedule generation on a seeded synthetic catalog (see `synthetic.py`):
+    parsing the files, creating each student's pool, the initial population, the fitness (scalar and
+    vectorized), the crossover, the mutation, the selection, and whole run_ga runs.
+
+    Args:
+        * num_courses, num_electives -- the number of compulsory and elective courses.
+        * min_sections, max_sections -- range of the number of sections of each course.
+        * num_students -- the number of students, each one in a random semester with its own records.
+        * population -- the population size of the genetic algorithm (MAX_POPULATION).
+        * seed -- seed of the generated files and of the genetic algorithm.
+
+    Returns:
+        results -- a JSON serializable dict with the configuration, the environment, the seconds and
+            throughput of each stage, the run_ga results, and the peak RSS.
+    """
+    config = {
+        'num_courses': num_courses,
+        'num_electives': num_electives,
+        'min_sections': min_sections,
+        'max_sections': max_sections,
+        'num_students': num_students,
+        'population': population,
+        'seed': seed,
+    }
+    stages = { name: 0.0 for name in ['parse', 'pool', 'populate', 'fitness', 'batch_fitness', 'crossover', 'mutation', 'selection'] }
+    evaluations = 0
+    runs = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = [ os.path.join(tmp_dir, name) for name in ['studyPlan.txt', 'electives.txt', 'courseBrowser.json'] ]
+
+        plan = generate_study_plan(files[0], num_courses, seed=seed)
+        electives = generate_electives(files[1], plan, num_electives, seed=seed)
+        num_sections = generate_course_browser(
+            files[2], [course_code for _, _, course_code in plan] + electives, min_sections, max_sections, seed=seed
+        )
+
+        start = time.perf_counter()
+        catalog = read_catalog(*files)
+        stages['parse'] = time.perf_counter() - start
+
+    section_index = catalog.get_section_index()
+    semesters = sorted( { (year, semester) for year, semester, _ in plan } )
+    rng = random.Random(seed)
+
+    # run_ga reads the population size from the module, it is restored for the later runs of this process
+    default_population, genetic.MAX_POPULATION = genetic.MAX_POPULATION, population
+
+    try:
+        for _ in range(num_students):
+            year, semester = rng.choice(semesters)
+            records = parse_student_records( generate_records(plan, year, semester, rng=rng) )
+            random.seed( rng.getrandbits(32) )
+
+            start = time.perf_counter()
+            courses = catalog.for_student(year, semester, records)
+            pool = create_courses_pool(courses, catalog.get_study_plan())
+            stages['pool'] += time.perf_counter() - start
+
+            if not pool:
+                continue
+
+            start = time.perf_counter()
+            parents = genetic.populate(pool, courses)
+            stages['populate'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            pop_fitness = [ genetic.fitness(chromosome, courses, {'days_off': 1}, section_index) for chromosome in parents ]
+            stages['fitness'] += time.perf_counter() - start
+
+            batch_fitness = genetic.BatchFitness(courses, section_index, {'days_off': 1})
+            start = time.perf_counter()
+            batch_fitness.evaluate_population(parents)
+            stages['batch_fitness'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            offsprings = [ child for i in range(0, len(parents), 2) for child in genetic.crossover(parents[i], parents[i + 1]) ]
+            stages['crossover'] += time.perf_counter() - start
+
+            mutation_operator = MutationOperator(pool, courses, section_index)
+            start = time.perf_counter()
+            genetic.mutate(offsprings, mutation_operator)
+            stages['mutation'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            Selection().select( np.array(pop_fitness + pop_fitness), population )
+            stages['selection'] += time.perf_counter() - start
+
+            evaluations += len(parents)
+
+            start = time.perf_counter()
+            _, best_fitness, generations = genetic.run_ga(pool, courses, section_index=section_index, vectorized=True, days_off=1)
+            runs.append( { 'seconds': time.perf_counter() - start, 'fitness': best_fitness, 'generations': generations } )
+
+    finally:
+        genetic.MAX_POPULATION = default_population
+
+    ga_seconds = sum( run['seconds'] for run in runs )
+    ga_evaluations = sum( (2 * run['generations'] + 1) * population for run in runs )
+
+    return {
+        'config': config,
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        },
+        'catalog': { 'courses': len( catalog.get_courses() ), 'sections': num_sections },
+        'stages': stages,
+        'throughput': {
+            'fitness_evals_per_second': evaluations / stages['fitness'] if stages['fitness'] else 0.0,
+            'batch_fitness_evals_per_second': evaluations / stages['batch_fitness'] if stages['batch_fitness'] else 0.0,
+            'run_ga_evals_per_second': ga_evaluations / ga_seconds if ga_seconds else 0.0,
+        },
+        'run_ga': {
+            'students': len(runs),
+            'seconds_mean': ga_seconds / len(runs) if runs else 0.0,
+            'generations_mean': sum( run['generations'] for run in runs ) / len(runs) if runs else 0.0,
+            'fitness_mean': sum( run['fitness'] for run in runs ) / len(runs) if runs else 0.0,
+        },
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of the schedule generation.')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    workers_parser = subparsers.add_parser('workers', help='fitness evaluation scaling with the number of workers')
+    workers_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    workers_parser.add_argument('--population', type=int, default=1000)
+
+    parse_parser = subparsers.add_parser('parse', help='course browser parsing time and peak memory')
+    parse_parser.add_argument('--sections', type=int, default=100_000)
+
+    catalog_parser = subparsers.add_parser('catalog', help='text parsing compared with the compiled catalog cache')
+    catalog_parser.add_argument('--sections-per-course', type=int, default=20)
+
+    engines_parser = subparsers.add_parser('engines', help='fitness and latency of the genetic and exact engines')
+    engines_parser.add_argument('--node-limit', type=int, default=NODE_LIMIT)
+    engines_parser.add_argument('--time-limit', type=float, default=TIME_LIMIT)
+
+    suite_parser = subparsers.add_parser('suite', help='timings of every stage on a synthetic catalog, as JSON')
+    suite_parser.add_argument('--courses', type=int, default=60)
+    suite_parser.add_argument('--electives', type=int, default=20)
+    suite_parser.add_argument('--min-sections', type=int, default=1)
+    suite_parser.add_argument('--max-sections', type=int, default=5)
+    suite_parser.add_argument('--students', type=int, default=20)
+    suite_parser.add_argument('--population', type=int, default=100)
+    suite_parser.add_argument('--seed', type=int, default=0)
+    suite_parser.add_argument('--output', default='-', help="JSON file of the results, '-' for stdout")
+
+    args = parser.parse_args()
+
+    if args.benchmark == 'workers':
+        print(f'{"workers":>8} {"seconds":>10} {"speedup":>8} {"fitness":>8}')
+
+        for result in benchmark_workers(args.workers, args.population):
+            print(f'{result["workers"]:>8} {result["seconds"]:>10.3f} {result["speedup"]:>8.2f} {result["fitness"]:>8}')
+
+        if args.workers > os.cpu_count():
+            print(f'{os.cpu_count()} CPUs: the runs with more workers share them, and cannot be faster')
+
+    elif args.benchmark == 'parse':
+        print(f'{"parser":>24} {"seconds":>10} {"peak RSS MB":>12} {"increase MB":>12} {"sections":>9}')
+
+        for name, result in benchmark_parsing(args.sections).items():
+            print(
+                f'{name:>24} {result["seconds"]:>10.3f} {result["peak_rss_mb"]:>12.1f} '
+                f'{result["peak_rss_increase_mb"]:>12.1f} {result["sections"]:>9}'
+            )
+
+    elif args.benchmark == 'catalog':
+        result = benchmark_catalog_cache(args.sections_per_course)
+
+        print(f'sections: {result["sections"]}')
+        print(f'text files: {result["text_seconds"] * 1000:.1f} ms')
+        print(f'compiled cache: {result["cache_seconds"] * 1000:.1f} ms')
+
+    elif args.benchmark == 'engines':
+        print(f'{"catalog":>8} {"sections":>9} {"preferences":>44} {"engine":>7} {"used":>6} {"seconds":>9} {"fitness":>8}')
+
+        for result in benchmark_engines(args.node_limit, args.time_limit):
+            print(
+                f'{result["catalog"]:>8} {result["sections"]:>9} {str(result["preferences"]):>44} {result["engine"]:>7} '
+                f'{result["used"]:>6} {result["seconds"]:>9.3f} {result["fitness"]:>8}'
+            )
+
+    elif args.benchmark == 'suite':
+        results = benchmark_suite(
+            args.courses, args.electives, args.min_sections, args.max_sections, args.students, args.population, args.seed
+        )
+
+        if args.output == '-':
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
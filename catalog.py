@@ -0,0 +1,269 @@
+from typing import Dict, Iterator, Tuple
+from collections.abc import Mapping
+from studyplan import StudyPlan, PrerequisiteGraph, read_study_plan, read_electives
+from courses import Course, Section, SectionIndex, read_sections_streaming, browser_version
+
+
+class Catalog:
+
+    def __init__(
+            self,
+            study_plan: StudyPlan,
+            college_courses: Dict[str, Course],
+            critical_path_priority=False,
+            section_index: SectionIndex=None,
+            browser_version=None
+    ) -> None:
+        """
+        Catalog of the study plan and the courses (with their sections), shared by all the students.
+        The prerequisites and sections of each course are frozen into tuples, and everything that depends
+        on the student (passed courses, remaining prerequisites, priority) lives in a `StudentCourses` overlay,
+        so scheduling a student never modifies the catalog. The catalog is not immutable though: the sections
+        of its courses and its section_index are changed in place by `reoptimize.apply_section_delta()`,
+        for all the students at once.
+        Course ids are the ids of the study plan's PrerequisiteGraph.
+
+        The courses must be read without the student's year and semester (`read_study_plan(..., None, None)`),
+        so that their priority only counts the courses they are prerequisites for. With critical_path_priority
+        the priority counts all the courses that depend on it, directly or not.
+        The section_index is built from college_courses if it is not given.
+        The browser_version identifies the course browser the sections were read from (see `browser_version()`).
+        """
+        self.__study_plan = study_plan
+        self.__browser_version = browser_version
+        self.__critical_path_priority = critical_path_priority
+        self.__courses = college_courses
+        self.__graph = study_plan.get_prerequisite_graph()
+
+        for course_code, course in college_courses.items():
+            course.set_prerequisites( tuple( course.get_prerequisites() ) )
+            course.set_sections( tuple( course.get_sections() ) )
+
+            if course_code not in self.__graph:
+                self.__graph.add_course( course_code, course.get_prerequisites() )
+
+        self.__priority: Dict[str, int] = { code: course.get_priority() for code, course in college_courses.items() }
+
+        if critical_path_priority:
+            dependents = self.__graph.count_transitive_dependents()
+
+            for course_code in college_courses:
+                self.__priority[course_code] = dependents[ self.__graph.get_id(course_code) ]
+
+        # The semester of each compulsory course, used for the year/semester priority
+        self.__semesters: Dict[str, Tuple[str, str]] = {}
+
+        for semester, semester_courses in study_plan.get_compulsory_courses().items():
+            for course_code in semester_courses:
+                self.__semesters[course_code] = tuple( semester.split('-') )
+
+        self.__section_index = section_index if section_index is not None else SectionIndex(college_courses)
+
+
+    def get_study_plan(self) -> StudyPlan:
+        return self.__study_plan
+
+
+    def get_courses(self) -> Dict[str, Course]:
+        return self.__courses
+
+
+    def get_section_index(self) -> SectionIndex:
+        return self.__section_index
+
+
+    def get_browser_version(self):
+        return self.__browser_version
+
+
+    def has_critical_path_priority(self) -> bool:
+        return self.__critical_path_priority
+
+
+    def get_prerequisite_graph(self) -> PrerequisiteGraph:
+        return self.__graph
+
+
+    def get_course_id(self, course_code) -> int:
+        return self.__graph.get_id(course_code)
+
+
+    def get_course_code(self, course_id) -> str:
+        return self.__graph.get_code(course_id)
+
+
+    def get_base_priority(self, course_code) -> int:
+        return self.__priority[course_code]
+
+
+    def get_semester(self, course_code) -> Tuple[str, str]:
+        return self.__semesters.get(course_code)
+
+
+    def for_student(self, student_year, student_semester, records: Dict[str, int]={}) -> 'StudentCourses':
+        """
+        Creates the overlay of a student on this catalog.
+
+        Args:
+            * student_year, student_semester -- the year and semester the student will be in.
+            * records -- the student records (see `parse_student_records()`).
+
+        Returns:
+            courses -- a StudentCourses, which can be used anywhere a college_courses dict is expected.
+        """
+        return StudentCourses(self, student_year, student_semester, records)
+
+
+def read_catalog(
+        study_plan_file='CEStudyPlan.txt',
+        electives_file='Electives.txt',
+        browser_file='courseBrowser_1.json',
+        spec_name='Computer Engineering',
+        total_hours=158,
+        critical_path_priority=False
+) -> Catalog:
+    """
+    Reads the study plan, electives and course browser into a Catalog shared by all the students.
+    With critical_path_priority, the priority of a course counts all the courses that depend on it (see `Catalog`).
+    """
+    study_plan, college_courses = read_study_plan(study_plan_file, spec_name, total_hours, None, None)
+    college_courses = read_electives(electives_file, study_plan, college_courses)
+    college_courses = read_sections_streaming(browser_file, college_courses, time_masks=True)
+
+    return Catalog(
+        study_plan, college_courses,
+        critical_path_priority=critical_path_priority,
+        browser_version=browser_version(browser_file)
+    )
+
+
+class StudentCourse:
+
+    __slots__ = ('__course', '__overlay', '__course_id')
+
+    def __init__(self, course: Course, overlay: 'StudentCourses', course_id) -> None:
+        """
+        View of a catalog Course for a single student, with the same getters as Course.
+        """
+        self.__course = course
+        self.__overlay = overlay
+        self.__course_id = course_id
+
+
+    def get_course_id(self):
+        return self.__course.get_course_id()
+
+
+    def get_credit_hours(self):
+        return self.__course.get_credit_hours()
+
+
+    def get_prerequisites(self) -> Tuple:
+        return tuple( pre for pre in self.__course.get_prerequisites() if not self.__overlay.has_passed(pre) )
+
+
+    def count_remaining_prerequisites(self) -> int:
+        return self.__overlay.count_remaining_prerequisites(self.__course_id)
+
+
+    def get_priority(self):
+        return self.__overlay.get_priority(self.__course_id)
+
+
+    def is_passed(self):
+        return self.__overlay.is_passed(self.__course_id)
+
+
+    def is_available(self):
+        return self.__overlay.count_remaining_prerequisites(self.__course_id) == 0
+
+
+    def get_sections(self) -> Tuple[Section]:
+        return self.__course.get_sections()
+
+
+    def __repr__(self) -> str:
+        return f'CourseCode: {self.get_course_id()} | Credit Hours: {self.get_credit_hours()} \
+            \nPreReq: {self.get_prerequisites()} | Priority: {self.get_priority()}\n \
+            Sections: {self.get_sections()}\n-----------------\n'
+
+
+class StudentCourses(Mapping):
+
+    def __init__(self, catalog: Catalog, student_year, student_semester, records: Dict[str, int]={}) -> None:
+        """
+        Per-student overlay of a Catalog: the passed courses are a bitset of catalog course ids,
+        the number of remaining prerequisites of each course is a counter updated only for the dependents
+        of the passed courses, and the priority is computed once for the student's year and semester.
+        Maps each course code to a `StudentCourse` view, the catalog itself is never modified.
+        """
+        self.__catalog = catalog
+        self.__passed = 0
+
+        graph = catalog.get_prerequisite_graph()
+        self.__remaining = graph.count_prerequisites()
+
+        for course_code, mark in records.items():
+            course_id = graph.get_id(course_code)
+
+            if mark < 60 or course_id is None or self.__passed >> course_id & 1:
+                continue
+
+            self.__passed |= 1 << course_id
+
+            for dependent in graph.get_dependents(course_id):
+                self.__remaining[dependent] -= 1
+
+        self.__views: Dict[str, StudentCourse] = {}
+        self.__priority: Dict[int, int] = {}
+
+        for course_code, course in catalog.get_courses().items():
+            course_id = catalog.get_course_id(course_code)
+            self.__views[course_code] = StudentCourse(course, self, course_id)
+
+            # Same priority as `read_study_plan()` gives to the courses of the student's year and semester
+            priority = catalog.get_base_priority(course_code)
+
+            if semester := catalog.get_semester(course_code):
+                year, sem = semester
+
+                if year == student_year and sem == student_semester:
+                    priority += 2
+                elif year == student_year:
+                    priority += 1
+
+            # no priority for finished courses
+            self.__priority[course_id] = 0 if self.is_passed(course_id) else priority
+
+
+    def is_passed(self, course_id) -> bool:
+        return bool( self.__passed >> course_id & 1 )
+
+
+    def has_passed(self, course_code) -> bool:
+        course_id = self.__catalog.get_course_id(course_code)
+        return course_id is not None and self.is_passed(course_id)
+
+
+    def count_remaining_prerequisites(self, course_id) -> int:
+        return self.__remaining[course_id]
+
+
+    def get_priority(self, course_id) -> int:
+        return self.__priority[course_id]
+
+
+    def get_catalog(self) -> Catalog:
+        return self.__catalog
+
+
+    def __getitem__(self, course_code) -> StudentCourse:
+        return self.__views[course_code]
+
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__views)
+
+
+    def __len__(self):
+        return len(self.__views)
@@ -0,0 +1,289 @@
+from typing import Dict, List
+from datetime import timedelta
+from studyplan import StudyPlan
+from courses import Course, Section, SectionIndex, encode_time_mask
+from catalog import Catalog, read_catalog
+import numpy as np
+import hashlib
+import struct
+import mmap
+import json
+import os
+
+CACHE_MAGIC = b'SACATLG\0'
+CACHE_VERSION = 2
+
+# magic, version, length of the JSON metadata
+_HEADER = struct.Struct('<8sII')
+_ALIGNMENT = 8
+
+
+def _source_fingerprint(filename) -> Dict:
+    stat = os.stat(filename)
+
+    with open(filename, 'rb') as f:
+        digest = hashlib.sha256( f.read() ).hexdigest()
+
+    return { 'path': os.path.abspath(filename), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest }
+
+
+def _is_fresh(fingerprint: Dict, filename) -> bool:
+    """
+    Returns whether the source file is unchanged since the cache was compiled.
+    The hash is only calculated when the modification time or size changed.
+    """
+    if os.path.abspath(filename) != fingerprint['path'] or not os.path.exists(filename):
+        return False
+
+    stat = os.stat(filename)
+
+    if stat.st_mtime_ns == fingerprint['mtime_ns'] and stat.st_size == fingerprint['size']:
+        return True
+
+    return _source_fingerprint(filename)['sha256'] == fingerprint['sha256']
+
+
+def compile_catalog(cache_file, catalog: Catalog, source_files: List[str]):
+    """
+    Writes the catalog to a versioned binary file, as a struct-of-arrays:
+        * courses: credit hours, priority, and the ranges of their prerequisites and sections.
+        * prerequisites: the course-id edges of the prerequisite graph, and of each course.
+        * sections: number, type, instructor, days bitmask, start and end minutes.
+        * the conflict matrix of the sections, so it is loaded instead of computed.
+    The strings (course codes, instructors, ...) and the study plan layout are kept in a JSON header.
+
+    Args:
+        * cache_file -- the file to write.
+        * catalog -- the Catalog to compile (see `read_catalog()`).
+        * source_files -- the files the catalog was read from, the cache is invalid once any of them changes.
+    """
+    study_plan = catalog.get_study_plan()
+    graph = catalog.get_prerequisite_graph()
+    courses = catalog.get_courses()
+
+    strings = { 'types': {}, 'instructors': {}, 'days': {} }
+
+    def string_id(table, value):
+        return strings[table].setdefault(value, len(strings[table]))
+
+    course_prerequisites, course_sections = [0], [0]
+    prerequisite_ids = []
+    sections: List[Section] = []
+
+    for course in courses.values():
+        prerequisite_ids.extend( graph.get_id(pre) for pre in course.get_prerequisites() )
+        course_prerequisites.append( len(prerequisite_ids) )
+
+        sections.extend( course.get_sections() )
+        course_sections.append( len(sections) )
+
+    graph_edges, graph_starts = [], [0]
+
+    for course_id in range( len(graph) ):
+        graph_edges.extend( graph.get_prerequisites(course_id) )
+        graph_starts.append( len(graph_edges) )
+
+    def minutes(t):
+        return t // timedelta(minutes=1) if t is not None else -1
+
+    arrays = {
+        'course_credit_hours': np.array( [c.get_credit_hours() for c in courses.values()], dtype=np.int32 ),
+        'course_priority': np.array( [c.get_priority() for c in courses.values()], dtype=np.int32 ),
+        'course_prerequisite_starts': np.array( course_prerequisites, dtype=np.int32 ),
+        'course_prerequisite_ids': np.array( prerequisite_ids, dtype=np.int32 ),
+        'course_section_starts': np.array( course_sections, dtype=np.int32 ),
+        'graph_prerequisite_starts': np.array( graph_starts, dtype=np.int32 ),
+        'graph_prerequisite_ids': np.array( graph_edges, dtype=np.int32 ),
+        'section_number': np.array( [s.get_number() for s in sections], dtype=np.int32 ),
+        'section_type': np.array( [string_id('types', s.get_type()) for s in sections], dtype=np.int32 ),
+        'section_instructor': np.array( [string_id('instructors', s.get_instructor()) for s in sections], dtype=np.int32 ),
+        'section_days': np.array(
+            [ sum( 1 << string_id('days', day) for day in s.get_days() ) for s in sections ], dtype=np.int64
+        ),
+        'section_start': np.array( [minutes( s.get_start_time() ) for s in sections], dtype=np.int32 ),
+        'section_end': np.array( [minutes( s.get_end_time() ) for s in sections], dtype=np.int32 ),
+        'section_has_mask': np.array( [s.get_time_mask() is not None for s in sections], dtype=bool ),
+        'conflict_matrix': np.ascontiguousarray( catalog.get_section_index().get_conflict_matrix() ),
+    }
+
+    metadata = {
+        'version': CACHE_VERSION,
+        'sources': [ _source_fingerprint(filename) for filename in source_files ],
+        'name': study_plan.get_name(),
+        'total_hours': study_plan.get_total_hours(),
+        'compulsory_courses': study_plan.get_compulsory_courses(),
+        'elective_courses': study_plan.get_elective_courses(),
+        'critical_path_priority': catalog.has_critical_path_priority(),
+        'course_codes': list(courses),
+        'graph_codes': [ graph.get_code(course_id) for course_id in range( len(graph) ) ],
+        'strings': { table: list(values) for table, values in strings.items() },
+        'arrays': {},
+    }
+
+    # The offsets of the arrays depend on the size of the metadata, which contains the offsets
+    offset = 0
+    for name, array in arrays.items():
+        metadata['arrays'][name] = { 'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape) }
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header = json.dumps(metadata).encode('utf-8')
+    header += b' ' * ( -(_HEADER.size + len(header)) % _ALIGNMENT )
+
+    tmp_file = cache_file + '.tmp'
+
+    with open(tmp_file, 'wb') as f:
+        f.write( _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(header)) )
+        f.write(header)
+
+        for array in arrays.values():
+            f.write( array.tobytes() )
+            f.write( b'\0' * ( -array.nbytes % _ALIGNMENT ) )
+
+    # Readers never see a partially written cache
+    os.replace(tmp_file, cache_file)
+
+
+def load_catalog_cache(cache_file, source_files: List[str]=None) -> Catalog:
+    """
+    Loads a catalog compiled by `compile_catalog()`. The file is memory-mapped, so the conflict matrix
+    is not copied, and processes loading the same cache share its pages.
+
+    Args:
+        * cache_file -- the compiled catalog.
+        * source_files -- (optional) the files the catalog should be read from, if the cache was compiled
+            from other files or any of them changed, the cache is stale.
+
+    Returns:
+        catalog -- the loaded Catalog, or None if the cache does not exist, has another version or is stale.
+    """
+    if not os.path.exists(cache_file):
+        return None
+
+    with open(cache_file, 'rb') as f:
+        buffer = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+
+    magic, version, header_size = _HEADER.unpack_from(buffer)
+
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+
+    metadata = json.loads( buffer[_HEADER.size : _HEADER.size + header_size] )
+
+    if source_files is not None and (
+        len(source_files) != len(metadata['sources'])
+        or not all( _is_fresh(fingerprint, f) for fingerprint, f in zip(metadata['sources'], source_files) )
+    ):
+        return None
+
+    data_start = _HEADER.size + header_size
+    arrays = {}
+
+    for name, info in metadata['arrays'].items():
+        dtype = np.dtype( info['dtype'] )
+        count = int( np.prod(info['shape']) )
+
+        arrays[name] = np.frombuffer(
+            buffer, dtype=dtype, count=count, offset=data_start + info['offset']
+        ).reshape( info['shape'] )
+
+    # Study plan and prerequisite graph, the graph nodes are added first so they keep their ids
+    study_plan = StudyPlan( name=metadata['name'], total_hours=metadata['total_hours'] )
+    study_plan.get_compulsory_courses().update( metadata['compulsory_courses'] )
+    study_plan.get_elective_courses().update( metadata['elective_courses'] )
+
+    graph = study_plan.get_prerequisite_graph()
+    graph_codes = metadata['graph_codes']
+    graph_starts = arrays['graph_prerequisite_starts'].tolist()
+    graph_edges = arrays['graph_prerequisite_ids'].tolist()
+
+    for course_code in graph_codes:
+        graph.add_course(course_code, [])
+
+    for course_id, course_code in enumerate(graph_codes):
+        graph.add_course( course_code, [ graph_codes[i] for i in graph_edges[ graph_starts[course_id] : graph_starts[course_id + 1] ] ] )
+
+    # Courses and sections
+    strings = metadata['strings']
+    days_table = strings['days']
+    columns = {
+        name: arrays[name].tolist() for name in (
+            'course_credit_hours', 'course_priority', 'course_prerequisite_starts', 'course_prerequisite_ids',
+            'course_section_starts', 'section_number', 'section_type', 'section_instructor', 'section_days',
+            'section_start', 'section_end', 'section_has_mask'
+        )
+    }
+
+    college_courses: Dict[str, Course] = {}
+
+    # Sections with the same days and times share the parsed times and time mask
+    times_cache = {}
+
+    for i, course_code in enumerate( metadata['course_codes'] ):
+        prerequisites = columns['course_prerequisite_ids'][ columns['course_prerequisite_starts'][i] : columns['course_prerequisite_starts'][i + 1] ]
+
+        course = Course(
+            course_id=course_code,
+            credit_hours=columns['course_credit_hours'][i],
+            prerequisites=[ graph_codes[pre] for pre in prerequisites ]
+        )
+        course.increase_priority( by=columns['course_priority'][i] )
+
+        for j in range( columns['course_section_starts'][i], columns['course_section_starts'][i + 1] ):
+            section = Section( number=columns['section_number'][j], sec_type=strings['types'][ columns['section_type'][j] ] )
+            section.set_instructor( strings['instructors'][ columns['section_instructor'][j] ] )
+            key = ( columns['section_days'][j], columns['section_start'][j], columns['section_end'][j] )
+
+            if (times := times_cache.get(key)) is None:
+                days = frozenset( day for bit, day in enumerate(days_table) if key[0] >> bit & 1 )
+                start_time, end_time = ( timedelta(minutes=key[1]), timedelta(minutes=key[2]) ) if key[1] >= 0 else (None, None)
+                times = times_cache[key] = ( days, start_time, end_time, encode_time_mask(days, start_time, end_time) )
+
+            days, start_time, end_time, time_mask = times
+
+            section.set_days( set(days) )
+            section.set_start_time(start_time)
+            section.set_end_time(end_time)
+
+            if columns['section_has_mask'][j]:
+                section.set_time_mask(time_mask)
+
+            course.get_sections().append(section)
+
+        college_courses[course_code] = course
+
+    section_index = SectionIndex( college_courses, conflict_matrix=arrays['conflict_matrix'] )
+
+    # The course browser is the last source file (see `load_or_compile_catalog()`)
+    version = metadata['sources'][-1]['sha256'] if metadata['sources'] else None
+
+    return Catalog(
+        study_plan, college_courses,
+        critical_path_priority=metadata['critical_path_priority'],
+        section_index=section_index,
+        browser_version=version
+    )
+
+
+def load_or_compile_catalog(
+        cache_file,
+        study_plan_file='CEStudyPlan.txt',
+        electives_file='Electives.txt',
+        browser_file='courseBrowser_1.json',
+        spec_name='Computer Engineering',
+        total_hours=158,
+        critical_path_priority=False
+) -> Catalog:
+    """
+    Loads the catalog from cache_file, or reads it from the text files (see `read_catalog()`)
+    and compiles the cache if it does not exist, is stale, or was compiled with another critical_path_priority.
+    """
+    source_files = [study_plan_file, electives_file, browser_file]
+    catalog = load_catalog_cache(cache_file, source_files)
+
+    if catalog is not None and catalog.has_critical_path_priority() == critical_path_priority:
+        return catalog
+
+    catalog = read_catalog(study_plan_file, electives_file, browser_file, spec_name, total_hours, critical_path_priority)
+    compile_catalog(cache_file, catalog, source_files)
+
+    return catalog
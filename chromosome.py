@@ -0,0 +1,182 @@
+from typing import List, Tuple
+from courses import Section, SectionIndex
+import numpy as np
+
+
+def gene_dtype(num_sections) -> np.dtype:
+    """
+    Returns the narrowest signed integer type holding the section ids and the -1 padding: 2 bytes per gene
+    for up to 32767 sections, else 4.
+    """
+    return np.dtype(np.int16) if num_sections <= np.iinfo(np.int16).max else np.dtype(np.int32)
+
+
+class GenerationBuffers:
+
+    def __init__(self, section_index: SectionIndex, population_size, capacity) -> None:
+        """
+        Preallocated, double-buffered storage of an integer-encoded population.
+        Each chromosome is a fixed-capacity row of section ids (padded with -1) plus its length, and the course
+        of each gene is tracked in a course-presence bitset (one bit per course, packed in uint64 words).
+        The genes are stored in the narrowest integer type of the section ids (see `gene_dtype()`).
+
+        Every generation uses the rows [0, population_size) for the parents and
+        [population_size, 2 * population_size) for the offsprings; the selected parents are copied
+        into the other buffer, which becomes the current one.
+
+        Args:
+            * section_index -- the SectionIndex the section ids belong to.
+            * population_size -- number of parents (even).
+            * capacity -- the maximum number of genes of a chromosome. Crossover never makes a chromosome
+                longer than its parents, so it is the length of the longest initial chromosome.
+        """
+        assert population_size % 2 == 0, 'the population size must be even'
+
+        self.__section_index = section_index
+        self.__population_size = population_size
+        self.__capacity = capacity
+
+        # Dense course id of each section
+        course_ids = {}
+        self.__section_courses = np.array(
+            [ course_ids.setdefault( section_index.get_course_code(i), len(course_ids) ) for i in range( len(section_index) ) ],
+            dtype=np.int64
+        )
+        self.__words = max( 1, -(-len(course_ids) // 64) )
+
+        self.__sections = np.full( (2, 2 * population_size, capacity), -1, dtype=gene_dtype( len(section_index) ) )
+        self.__lengths = np.zeros( (2, 2 * population_size), dtype=np.int64 )
+        self.__presence = np.zeros( (population_size // 2, self.__words), dtype=np.uint64 )
+        self.__current = 0
+
+
+    def load(self, population: List[ List[Tuple[str, Section]] ]):
+        """
+        Encodes the initial parents into the current buffer.
+        """
+        assert len(population) == self.__population_size, 'population size mismatch'
+
+        sections, lengths = self.__sections[self.__current], self.__lengths[self.__current]
+        sections[:self.__population_size] = -1
+
+        for i, chromosome in enumerate(population):
+            sections[i, :len(chromosome)] = [gene[1].get_id() for gene in chromosome]
+            lengths[i] = len(chromosome)
+
+
+    def get_parents(self) -> Tuple[np.ndarray, np.ndarray]:
+        return (
+            self.__sections[self.__current, :self.__population_size],
+            self.__lengths[self.__current, :self.__population_size]
+        )
+
+
+    def get_population(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the parents followed by the offsprings (after `crossover()`).
+        """
+        return self.__sections[self.__current], self.__lengths[self.__current]
+
+
+    def crossover(self, cross_points: np.ndarray):
+        """
+        Single point crossover of every pair of parents (0, 1), (2, 3), ..., done for all the pairs at once.
+        Same as `genetic.crossover()`: each offspring gets its parent's genes before the cross point,
+        then the other parent's genes after it whose course is not already present.
+
+        Args:
+            cross_points -- the cross point of each pair of parents.
+
+        Modifies:
+            the offspring rows of the current buffer.
+        """
+        sections, lengths = self.__sections[self.__current], self.__lengths[self.__current]
+        size, capacity = self.__population_size, self.__capacity
+        columns = np.arange(capacity)
+
+        for child in range(2):
+            # first parent of this child, and the one its tail comes from
+            first = np.arange(child, size, 2)
+            second = np.arange(1 - child, size, 2)
+
+            prefix = (columns < cross_points[:, None]) & (columns < lengths[first][:, None])
+            prefix_sections = np.where( prefix, sections[first], -1 )
+
+            # Course-presence bitset of the prefix
+            self.__presence.fill(0)
+            prefix_courses = self.__section_courses[ np.maximum(prefix_sections, 0) ]
+            rows = np.broadcast_to( np.arange(len(first))[:, None], prefix.shape )
+            np.bitwise_or.at(
+                self.__presence,
+                ( rows[prefix], prefix_courses[prefix] >> 6 ),
+                np.left_shift( np.uint64(1), (prefix_courses[prefix] & 63).astype(np.uint64) )
+            )
+
+            # Tail genes of the other parent, skipping the courses already in the prefix
+            tail_sections = sections[second]
+            tail = (columns >= cross_points[:, None]) & (columns < lengths[second][:, None])
+            tail_courses = self.__section_courses[ np.maximum(tail_sections, 0) ]
+            present = ( self.__presence[ rows, tail_courses >> 6 ] >> (tail_courses & 63).astype(np.uint64) ) & np.uint64(1)
+            tail &= present == 0
+
+            # Stable compaction of the kept genes into the offspring rows
+            keep = np.concatenate( (prefix, tail), axis=1 )
+            candidates = np.concatenate( (prefix_sections, tail_sections), axis=1 )
+            positions = np.cumsum(keep, axis=1) - 1
+
+            offspring = size + 2 * np.arange(len(first)) + child
+            sections[offspring] = -1
+            sections[ np.broadcast_to(offspring[:, None], keep.shape)[keep], positions[keep] ] = candidates[keep]
+            lengths[offspring] = keep.sum(axis=1)
+
+
+    def update_offsprings(self, update):
+        """
+        Replaces each offspring of the current buffer by `update(section_ids)` (i.e. `MutationOperator.mutate_ids`),
+        the updated chromosome must not be longer than the capacity.
+        Unlike the other operations, this is a Python loop over the offspring rows, and each row is passed to
+        `update()` as a new list.
+        """
+        sections, lengths = self.__sections[self.__current], self.__lengths[self.__current]
+
+        for row in range(self.__population_size, 2 * self.__population_size):
+            section_ids = update( sections[row, :lengths[row]].tolist() )
+
+            sections[row] = -1
+            sections[row, :len(section_ids)] = section_ids
+            lengths[row] = len(section_ids)
+
+
+    def select(self, indices: np.ndarray):
+        """
+        Copies the selected chromosomes of the population into the parent rows of the other buffer,
+        which becomes the current buffer.
+        """
+        source = self.__current
+        target = 1 - source
+
+        np.take( self.__sections[source], indices, axis=0, out=self.__sections[target, :self.__population_size] )
+        np.take( self.__lengths[source], indices, out=self.__lengths[target, :self.__population_size] )
+
+        self.__current = target
+
+
+    def measure_diversity(self):
+        """
+        Returns the share of distinct chromosomes among the parents, regardless of the order of their genes.
+        """
+        sections, _ = self.get_parents()
+
+        return len( np.unique( np.sort(sections, axis=1), axis=0 ) ) / self.__population_size
+
+
+    def decode(self, row) -> List[ Tuple[str, Section] ]:
+        """
+        Returns the chromosome at a row of the current buffer, as a list of genes `("course_code", Section object)`.
+        """
+        sections, lengths = self.__sections[self.__current], self.__lengths[self.__current]
+
+        return [
+            ( self.__section_index.get_course_code(i), self.__section_index.get_section(i) )
+            for i in sections[row, :lengths[row]].tolist()
+        ]
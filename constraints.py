@@ -0,0 +1,196 @@
+from typing import Dict, Iterable, Iterator, List
+from collections.abc import Mapping
+from datetime import timedelta
+from courses import Course, Section
+
+
+class EmptiedCourses(Exception):
+
+    def __init__(self, course_codes: List[str]) -> None:
+        super().__init__( f'No section satisfies the hard constraints for: {", ".join(course_codes)}' )
+        self.course_codes = course_codes
+
+
+def parse_time(time) -> timedelta:
+    """
+    Parses a time of day (08:30) to a timedelta, a timedelta is returned as is.
+    """
+    if time is None or isinstance(time, timedelta):
+        return time
+
+    hours, minutes = map( int, time.split(':') )
+
+    return timedelta(hours=hours, minutes=minutes)
+
+
+class HardConstraints:
+
+    def __init__(
+            self,
+            forbidden_days: Iterable[str]=(),
+            earliest_start=None,
+            latest_end=None,
+            instructors: Dict[str, Iterable[str]]=None,
+            max_hours_per_day=None
+    ) -> None:
+        """
+        Constraints a section must satisfy to be considered for a student at all, unlike the preferences
+        (instructor, days_off, credit_hours) that are only scored by `fitness()`.
+
+        Args:
+            * forbidden_days -- the days of week the student takes no section on, i.e. ['F', 'S'].
+            * earliest_start, latest_end -- (optional) the time window of the sections, as '08:30' or timedelta.
+            * instructors -- (optional) dictionary of the allowed instructors, with course_code as key.
+                The courses not in it can have any instructor.
+            * max_hours_per_day -- (optional) the maximum hours of a section on any of its days. Only single
+                sections are pruned: the hours of several sections on the same day are not checked.
+        """
+        self.__forbidden_days = frozenset(forbidden_days)
+        self.__earliest_start = parse_time(earliest_start)
+        self.__latest_end = parse_time(latest_end)
+        self.__instructors = { course_code: frozenset(names) for course_code, names in (instructors or {}).items() }
+        self.__max_hours_per_day = max_hours_per_day
+
+
+    @classmethod
+    def from_dict(cls, constraints: Dict) -> 'HardConstraints':
+        """
+        Creates the constraints of a JSON request, with the same keys as the arguments of `__init__()`.
+        """
+        for key in constraints.keys():
+            if key not in ['forbidden_days', 'earliest_start', 'latest_end', 'instructors', 'max_hours_per_day']:
+                raise ValueError(f'Unexpected hard constraint: {key}')
+
+        return cls(**constraints)
+
+
+    def allows(self, course_code, section: Section) -> bool:
+        """
+        Returns True if the section of the course satisfies all the constraints.
+        """
+        if self.__forbidden_days & section.get_days():
+            return False
+
+        if (allowed := self.__instructors.get(course_code)) is not None and section.get_instructor() not in allowed:
+            return False
+
+        start, end = section.get_start_time(), section.get_end_time()
+
+        if start is None or end is None:
+            return True
+
+        if self.__earliest_start is not None and start < self.__earliest_start:
+            return False
+
+        if self.__latest_end is not None and end > self.__latest_end:
+            return False
+
+        if self.__max_hours_per_day is not None and (end - start) / timedelta(hours=1) > self.__max_hours_per_day:
+            return False
+
+        return True
+
+
+class CandidateCourse:
+
+    __slots__ = ('__course', '__sections')
+
+    def __init__(self, course: Course, sections) -> None:
+        """
+        A course with only the sections satisfying the student's hard constraints, see `CandidateCourses`.
+        """
+        self.__course = course
+        self.__sections = sections
+
+
+    def get_course_id(self):
+        return self.__course.get_course_id()
+
+
+    def get_credit_hours(self):
+        return self.__course.get_credit_hours()
+
+
+    def get_prerequisites(self):
+        return self.__course.get_prerequisites()
+
+
+    def get_priority(self):
+        return self.__course.get_priority()
+
+
+    def is_passed(self):
+        return self.__course.is_passed()
+
+
+    def is_available(self):
+        return self.__course.is_available()
+
+
+    def get_sections(self):
+        return self.__sections
+
+
+    def __repr__(self) -> str:
+        return repr(self.__course)
+
+
+class CandidateCourses(Mapping):
+
+    def __init__(self, college_courses: Dict[str, Course], constraints: HardConstraints) -> None:
+        """
+        Per-student candidate index of the sections: a read-only view of college_courses where
+        `get_sections()` only returns the sections allowed by the hard constraints, so the genetic algorithm,
+        the mutations and the exact solver never consider the others.
+        The sections keep their ids, so the SectionIndex of college_courses still applies.
+
+        Args:
+            * college_courses -- dictionary of courses (or `StudentCourses`), with course_code as key.
+            * constraints -- the student's HardConstraints.
+        """
+        self.__courses = college_courses
+        self.__candidates: Dict[str, CandidateCourse] = {}
+        self.__pruned: List[str] = []
+
+        for course_code, course in college_courses.items():
+            sections = course.get_sections()
+            allowed = type(sections)( section for section in sections if constraints.allows(course_code, section) )
+
+            if sections and not allowed:
+                self.__pruned.append(course_code)
+
+            self.__candidates[course_code] = CandidateCourse(course, allowed)
+
+
+    def get_pruned(self) -> List[str]:
+        """
+        Returns the courses that had sections, but none of them satisfies the hard constraints.
+        """
+        return self.__pruned
+
+
+    def check_required(self, required: Iterable[str]) -> None:
+        """
+        Raises EmptiedCourses if any of the required courses (i.e. the student's compulsory pool courses)
+        has no candidate section left, before the genetic algorithm is run.
+        """
+        pruned = set(self.__pruned)
+
+        if emptied := [ course_code for course_code in required if course_code in pruned ]:
+            raise EmptiedCourses(emptied)
+
+
+    def count_sections(self) -> int:
+        return sum( len( course.get_sections() ) for course in self.__candidates.values() )
+
+
+    def __getitem__(self, course_code) -> CandidateCourse:
+        return self.__candidates[course_code]
+
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__candidates)
+
+
+    def __len__(self):
+        return len(self.__candidates)
@@ -0,0 +1,97 @@
+from typing import Hashable, Iterable
+import time
+
+
+class ConvergenceController:
+
+    def __init__(self, time_budget=None, stall_generations=None, min_diversity=None) -> None:
+        """
+        Decides when the genetic algorithm stops, after any of:
+            - the wall-clock time_budget (seconds) would be exceeded by one more generation,
+            - the best fitness did not improve for stall_generations generations,
+            - the diversity of the population (share of distinct chromosomes) fell below min_diversity.
+        A criterion left to None is not checked.
+
+        The criteria are checked between generations, in `update()`: the time_budget is not a hard wall-clock
+        bound, a generation slower than the ones before it can still overrun it.
+        """
+        self.__time_budget = time_budget
+        self.__stall_generations = stall_generations
+        self.__min_diversity = min_diversity
+
+        self.__start = None
+        self.__last = None
+        self.__best = None
+        self.__stalled = 0
+        self.__generations = 0
+        self.__stop_reason = None
+
+
+    def start(self):
+        self.__start = self.__last = time.perf_counter()
+        self.__best = None
+        self.__stalled = 0
+        self.__generations = 0
+        self.__stop_reason = None
+
+
+    def checks_diversity(self):
+        return self.__min_diversity is not None
+
+
+    def update(self, best_fitness, diversity=None):
+        """
+        Records a finished generation.
+
+        Args:
+            * best_fitness -- the best fitness in the generation.
+            * diversity -- the diversity of the selected population, only used with min_diversity
+                (see `measure_diversity()`).
+
+        Returns:
+            True if the algorithm should stop, False if not.
+        """
+        now = time.perf_counter()
+        generation_time = now - self.__last
+        self.__last = now
+        self.__generations += 1
+
+        if self.__best is None or best_fitness > self.__best:
+            self.__best = best_fitness
+            self.__stalled = 0
+        else:
+            self.__stalled += 1
+
+        if self.__stall_generations is not None and self.__stalled >= self.__stall_generations:
+            self.__stop_reason = 'stall'
+
+        elif self.__min_diversity is not None and diversity is not None and diversity < self.__min_diversity:
+            self.__stop_reason = 'diversity'
+
+        # The next generation takes about as long as this one, stop if it would not end within the budget
+        elif self.__time_budget is not None and now - self.__start + generation_time > self.__time_budget:
+            self.__stop_reason = 'time_budget'
+
+        return self.__stop_reason is not None
+
+
+    def get_generations(self):
+        return self.__generations
+
+
+    def get_stop_reason(self):
+        """
+        Returns 'stall', 'diversity', 'time_budget', or None if the algorithm ran all its generations.
+        """
+        return self.__stop_reason
+
+
+    def get_elapsed(self):
+        return time.perf_counter() - self.__start
+
+
+def measure_diversity(keys: Iterable[Hashable], population_size):
+    """
+    Returns the share of distinct chromosomes in a population, given a canonical key of each chromosome.
+    """
+    return len( set(keys) ) / population_size if population_size else 0.0
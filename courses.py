@@ -1,16 +1,27 @@
 from datetime import timedelta
-from typing import Dict, Set, List
+from typing import Dict, Set, List, Tuple, Iterable, Iterator
+import numpy as np
+import hashlib
 import json
+import sys
+import re
+
+# Week-slot encoding of the section times (see encode_time_mask)
+WEEK_DAYS = ('S', 'M', 'T', 'W', 'R', 'F', 'U')
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = (24 * 60) // SLOT_MINUTES
 
 
 class Course:
 
+    __slots__ = ('__id', '__credit_hours', '__prerequisites', '__priority', '__passed', '__sections')
+
     num_courses = 0
     
-    def __init__( self, course_id=None, credit_hours=0, prerequisites=[] ):
+    def __init__( self, course_id=None, credit_hours=0, prerequisites=None ):
         self.__id = course_id
         self.__credit_hours = credit_hours
-        self.__prerequisites = prerequisites
+        self.__prerequisites = prerequisites if prerequisites is not None else []
         self.__priority = 0
         self.__passed = False
         self.__sections: List[Section] = []
@@ -71,33 +82,80 @@ class Course:
             Sections: {self.__sections}\n-----------------\n'
     
 
-def read_student_records(filename, college_courses: Dict[str, Course]):
+def parse_student_records(lines) -> Dict[str, int]:
     """
-    Reads the courses the student has taken/passed/failed from a txt file.
+    Parses student records in the format of the records file, one `course_code=mark` per line.
 
     Args:
-        * filename --
-        * college_courses -- 
+        lines -- iterable of the record lines, empty lines are ignored.
 
     Returns:
-        None
+        records -- a dictionary with the course code as key, and the mark as value.
     """
-    with open(filename, 'r') as f:
-        lines = f.readlines()
+    records = {}
 
     for line in lines:
+        if not line.strip():
+            continue
+
         course_code, mark = line.strip().split('=')
+        records[course_code] = int(mark)
+
+    return records
+
+
+def apply_student_records(records: Dict[str, int], college_courses: Dict[str, Course], prerequisite_graph=None):
+    """
+    Marks the courses the student has passed, and removes them from the prerequisites of other courses.
+
+    Args:
+        * records -- dictionary of course code and mark (see `parse_student_records()`).
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * prerequisite_graph -- (optional) the PrerequisiteGraph of the study plan, when given only the
+            courses that depend on a passed course are updated, instead of scanning all the courses.
+
+    Modifies:
+        the passed courses and the prerequisites lists in college_courses.
+    """
+    for course_code, mark in records.items():
 
         if mark >= 60:
-            college_courses[course_code].pass_course()
+            if c := college_courses.get(course_code):
+                c.pass_course()
+
+            if prerequisite_graph is not None and course_code in prerequisite_graph:
+                dependents = (
+                    college_courses.get( prerequisite_graph.get_code(dependent) )
+                    for dependent in prerequisite_graph.get_dependents( prerequisite_graph.get_id(course_code) )
+                )
+            else:
+                dependents = college_courses.values()
 
             # Remove the course from prerequisites lists
-            for course in college_courses.values():
+            for course in dependents:
 
-                if course_code in course.get_prerequisites():
+                if course and course_code in course.get_prerequisites():
                     course.get_prerequisites().remove(course_code)
 
 
+def read_student_records(filename, college_courses: Dict[str, Course], prerequisite_graph=None):
+    """
+    Reads the courses the student has taken/passed/failed from a txt file.
+
+    Args:
+        * filename -- a file name that contains the student records, one `course_code=mark` per line.
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * prerequisite_graph -- (optional) the PrerequisiteGraph of the study plan (see `apply_student_records()`).
+
+    Returns:
+        None
+    """
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+
+    apply_student_records( parse_student_records(lines), college_courses, prerequisite_graph )
+
+
 def calculate_prerequisites_priority(courses_dict: Dict[str, Course], prerequisites):
     """
     Calculate the priority of each prerequisites course depending on the number
@@ -122,15 +180,21 @@ def calculate_prerequisites_priority(courses_dict: Dict[str, Course], prerequisi
 # ----------- Course Section Class -----------
 class Section:
 
+    __slots__ = (
+        '__number', '__id', '__type', '__instructor', '__days', '__start_time', '__end_time', '__time_mask'
+    )
+
     def __init__(self, number=None, sec_type=None) -> None:
         if number:
             self.__number = int(number)
 
+        self.__id = None
         self.__type = sec_type
         self.__instructor = None
         self.__days = set()
         self.__start_time = None
         self.__end_time = None
+        self.__time_mask = None
 
     
     def get_number(self):
@@ -141,6 +205,14 @@ class Section:
         self.__number = num
 
 
+    def get_id(self):
+        return self.__id
+
+
+    def set_id(self, section_id):
+        self.__id = section_id
+
+
     def get_type(self):
         return self.__type
     
@@ -181,6 +253,14 @@ class Section:
         self.__end_time = sec_time
 
 
+    def get_time_mask(self) -> int:
+        return self.__time_mask
+
+
+    def set_time_mask(self, mask):
+        self.__time_mask = mask
+
+
     def __repr__(self) -> str:
         return f'ID: {self.__number}-{self.__type} | Days: {self.__days} \
             time: {self.__start_time}-{self.__end_time}'
@@ -195,10 +275,16 @@ class Section:
 
         Returns:
         True if there is conflict in time and day, False if not.
+
+        Note: when both sections have a time mask the check is a single `&` of the masks,
+        which (unlike the time comparisons) also detects a section that fully contains the other one.
         """
         if other_section is self:
             return False
 
+        if self.__time_mask is not None and other_section.get_time_mask() is not None:
+            return bool( self.__time_mask & other_section.get_time_mask() )
+
         return self.__days.intersection( other_section.get_days() ) \
             and ( 
                 (other_section.get_start_time() <= self.__start_time < other_section.get_end_time())
@@ -206,13 +292,155 @@ class Section:
             )
 
 
-def read_sections(filename, college_courses: Dict[str, Course]) -> Dict[str, Course]:
+def encode_time_mask(days, start_time: timedelta, end_time: timedelta) -> int:
+    """
+    Encodes the weekly occupancy of a section as an integer bitmask.
+    Each day in WEEK_DAYS has SLOTS_PER_DAY bits, one for every SLOT_MINUTES of the day,
+    and the slots covered by [start_time, end_time) are set on every day in days.
+
+    Args:
+        * days -- the days of week the section is reserved in (keys of WEEK_DAYS).
+        * start_time -- the start time of the section, rounded down to the slot.
+        * end_time -- the end time of the section, rounded up to the slot.
+
+    Returns:
+        mask -- the week-slot bitmask, 0 if the section has no time.
+    """
+    if start_time is None or end_time is None:
+        return 0
+
+    first_slot = ( start_time // timedelta(minutes=1) ) // SLOT_MINUTES
+    last_slot = -( -( end_time // timedelta(minutes=1) ) // SLOT_MINUTES )
+
+    day_mask = ( (1 << (last_slot - first_slot)) - 1 ) << first_slot
+    mask = 0
+
+    for day in days:
+        if day not in WEEK_DAYS:
+            raise ValueError(f'Unknown day of week: {day}')
+
+        mask |= day_mask << ( WEEK_DAYS.index(day) * SLOTS_PER_DAY )
+
+    return mask
+
+
+def get_day_masks(mask) -> List[int]:
+    """
+    Splits a week-slot mask into one sub-mask per day in WEEK_DAYS.
+    """
+    day_bits = (1 << SLOTS_PER_DAY) - 1
+
+    return [ (mask >> (i * SLOTS_PER_DAY)) & day_bits for i in range( len(WEEK_DAYS) ) ]
+
+
+def count_occupied_days(mask) -> int:
+    """
+    Returns the number of days that have at least one occupied slot in the week-slot mask.
+    """
+    return sum( 1 for day_mask in get_day_masks(mask) if day_mask )
+
+
+def get_hours_per_day(mask) -> List[float]:
+    """
+    Returns the occupied hours of each day in WEEK_DAYS, counted from the week-slot mask.
+    """
+    return [ day_mask.bit_count() * SLOT_MINUTES / 60 for day_mask in get_day_masks(mask) ]
+
+
+def parse_time_range(time_range, time_cache: Dict=None) -> Tuple[timedelta, timedelta]:
+    """
+    Parses a section time range (10:00 - 11:25) to the start and end time.
+
+    Args:
+        * time_range -- the time range string.
+        * time_cache -- (optional) dictionary of already parsed ranges, so sections with the same
+            time share the same timedelta objects.
+    """
+    if time_cache is not None and (times := time_cache.get(time_range)):
+        return times
+
+    start, end = time_range.split(" - ")
+
+    # split hours and minutes for the start and end time
+    start_hours, start_minutes = map( int, start.split(':') )
+    end_hours, end_minutes = map( int, end.split(':') )
+
+    times = ( timedelta(hours=start_hours, minutes=start_minutes), timedelta(hours=end_hours, minutes=end_minutes) )
+
+    if time_cache is not None:
+        time_cache[time_range] = times
+
+    return times
+
+
+def create_section(section_id, section_details: Dict, time_masks=False, time_cache: Dict=None) -> Section:
+    """
+    Creates a Section from one entry of the course browser.
+
+    Args:
+        * section_id -- the key of the entry (COURSE-TYPE-NUMBER).
+        * section_details -- the value of the entry, the instructor and the time of each day.
+        * time_masks -- if True, the week-slot mask of the section is computed (see encode_time_mask).
+        * time_cache -- (optional) cache of the parsed time ranges (see `parse_time_range()`).
+
+    Returns:
+        section -- the created Section.
+    """
+    _, section_type, section_num = section_id.split('-')
+
+    section = Section(
+        number=int(section_num),
+        sec_type=sys.intern(section_type)
+    )
+
+    # get the rest of attributes for the course
+    for key, value in section_details.items():
+        if key == 'Instructor':
+            section.set_instructor( sys.intern(value) )
+
+        # the day of week in which the section is reserved in
+        else:
+            section.get_days().add( sys.intern(key) )
+
+            # check if the time is already set, no need to recreate it
+            if section.get_start_time() and section.get_end_time():
+                continue
+
+            start_time, end_time = parse_time_range(value, time_cache)
+            section.set_start_time(start_time)
+            section.set_end_time(end_time)
+
+    if time_masks:
+        section.set_time_mask(
+            encode_time_mask( section.get_days(), section.get_start_time(), section.get_end_time() )
+        )
+
+    return section
+
+
+def browser_version(filename, chunk_size=1 << 20) -> str:
+    """
+    Returns the version of a course browser file, the SHA-256 of its content,
+    so results computed from an older browser can be told apart (see `ResultCache`).
+    """
+    digest = hashlib.sha256()
+
+    with open(filename, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def read_sections(filename, college_courses: Dict[str, Course], time_masks=False) -> Dict[str, Course]:
     """
     Read the sections from the course browser.
 
     Args:
         * filename -- Name for a JSON file, which contains sections and the section details.
         * college_courses -- a dictionary containing the courses with course code as the key, and Course as value.
+        * time_masks -- (optional) if True, the week-slot mask of each section is computed (see encode_time_mask),
+            and conflict checks use the masks instead of comparing days and times.
 
     Modifies:
         college_courses -- the sections that are read from the json file (course Browser) are added to the correct course if it exists.
@@ -223,38 +451,12 @@ def read_sections(filename, college_courses: Dict[str, Course]) -> Dict[str, Cou
     with open(filename, 'r') as f:
         json_data = json.load(f)
 
-    for section_id, section_details in json_data.items():
-
-        course_code, section_type, section_num = section_id.split('-')
-        
-        section = Section(
-            number=int(section_num),
-            sec_type=section_type
-        )
-        
-        # get the rest of attributes for the course
-        for key, value in section_details.items():
-            if key == 'Instructor':
-                section.set_instructor(value)
-                
-            # the day of week in which the section is reserved in
-            else:
-                section.get_days().add(key)
-
-                # check if the time is already set, no need to recreate it
-                if section.get_start_time() and section.get_end_time():
-                    continue
-
-                # get the start and end time (10:00 - 11:25)
-                start, end = value.split(" - ")
+    time_cache = {}
 
-                # split hours and minutes for the start time
-                hours, minutes = map( int, start.split(':') )
-                section.set_start_time( timedelta(hours=hours, minutes=minutes) )
+    for section_id, section_details in json_data.items():
 
-                # split hours and minutes for the start time
-                hours, minutes = map( int, end.split(':') )
-                section.set_end_time( timedelta(hours=hours, minutes=minutes) )
+        course_code = section_id.split('-')[0]
+        section = create_section(section_id, section_details, time_masks, time_cache)
 
         # check if the course already exists
         if c := college_courses.get(course_code):
@@ -275,3 +477,352 @@ def read_sections(filename, college_courses: Dict[str, Course]) -> Dict[str, Cou
             # college_courses[ new_course.get_course_id() ] = new_course
 
     return college_courses
+
+
+# Matches one `"key": {...}` entry of the course browser whose value has no nested objects,
+# so the entries of other courses can be skipped without decoding them
+_FLAT_ENTRY = re.compile(r'\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*(\{[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*\})\s*,?')
+_WHITESPACE = re.compile(r'\s*')
+
+
+def iter_course_browser(filename, course_codes=None, chunk_size=1 << 16) -> Iterator[Tuple[str, Dict]]:
+    """
+    Reads the course browser incrementally, one entry at a time, instead of loading the whole JSON file.
+    Entries of courses that are not in course_codes are skipped before their value is decoded.
+
+    Args:
+        * filename -- Name for a JSON file, which contains sections and the section details.
+        * course_codes -- (optional) set of the course codes to read, all the entries are read if None.
+        * chunk_size -- number of characters read from the file at a time.
+
+    Yields:
+        (section_id, section_details) for each entry of the course browser.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(filename, 'r') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def read_more():
+            nonlocal buffer, pos, eof
+
+            if eof:
+                raise ValueError(f'Unexpected end of the course browser: {filename}')
+
+            # drop the part of the buffer that is already parsed
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            eof = not chunk
+
+        def next_token():
+            """Skips the whitespace, and returns the next character."""
+            nonlocal pos
+
+            while True:
+                pos = _WHITESPACE.match(buffer, pos).end()
+
+                if pos < len(buffer):
+                    return buffer[pos]
+
+                read_more()
+
+        def decode():
+            """Decodes the JSON value at pos, reading more of the file if it is incomplete."""
+            nonlocal pos
+
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                    if end < len(buffer) or eof:
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+                read_more()
+
+        if next_token() != '{':
+            raise ValueError(f'The course browser is not a JSON object: {filename}')
+        pos += 1
+
+        while next_token() != '}':
+
+            # Fast path: the whole entry is matched at once, and only decoded if it is needed
+            if (match := _FLAT_ENTRY.match(buffer, pos)) and match.end() < len(buffer):
+                pos = match.end()
+                section_id = match.group(1)
+
+                if '\\' in section_id:
+                    section_id = json.loads(f'"{section_id}"')
+
+                if course_codes is None or section_id.split('-')[0] in course_codes:
+                    yield section_id, json.loads( match.group(2) )
+
+                continue
+
+            # The entry is cut at the end of the buffer
+            if not eof and len(buffer) - pos < chunk_size:
+                read_more()
+                continue
+
+            # Slow path, for entries with nested values
+            section_id = decode()
+
+            if next_token() != ':':
+                raise ValueError(f'Expected ":" after {section_id} in the course browser')
+            pos += 1
+            next_token()
+
+            section_details = decode()
+
+            if course_codes is None or section_id.split('-')[0] in course_codes:
+                yield section_id, section_details
+
+            if next_token() == ',':
+                pos += 1
+
+
+def read_sections_streaming(
+        filename,
+        college_courses: Dict[str, Course],
+        time_masks=False,
+        chunk_size=1 << 16
+) -> Dict[str, Course]:
+    """
+    Same as `read_sections()`, but the course browser is read incrementally (see `iter_course_browser()`),
+    and only the entries of the courses in college_courses are decoded and turned into sections.
+    Repeated instructors and days are interned, and sections with the same time share the timedelta objects.
+    """
+    time_cache = {}
+
+    for section_id, section_details in iter_course_browser(filename, college_courses.keys(), chunk_size):
+        section = create_section(section_id, section_details, time_masks, time_cache)
+        college_courses[ section_id.split('-')[0] ].get_sections().append(section)
+
+    return college_courses
+
+
+# ----------- Section Conflict Index -----------
+def encode_section_times(sections: List[Section], day_index: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encodes the days and times of the given sections as arrays.
+
+    Args:
+        * sections -- a list of sections.
+        * day_index -- the bit of each day, new days are added to it.
+
+    Returns:
+        days -- one bit per day of week of each section.
+        start, end -- the start and end times of each section, in minutes from midnight.
+    """
+    n = len(sections)
+
+    days = np.zeros(n, dtype=np.int64)
+    start = np.zeros(n, dtype=np.int32)
+    end = np.zeros(n, dtype=np.int32)
+
+    for i, section in enumerate(sections):
+        for day in section.get_days():
+            days[i] |= 1 << day_index.setdefault(day, len(day_index))
+
+        if section.get_start_time() is not None and section.get_end_time() is not None:
+            start[i] = section.get_start_time() // timedelta(minutes=1)
+            end[i] = section.get_end_time() // timedelta(minutes=1)
+
+    return days, start, end
+
+
+def compute_conflicts(rows: Tuple[np.ndarray, ...], columns: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Returns the time conflicts between two sets of sections encoded by `encode_section_times()`
+    (with the same day_index), as a (rows x columns) boolean matrix.
+    """
+    row_days, row_start, row_end = rows
+    column_days, column_start, column_end = columns
+
+    # Same condition as Section.has_conflict() checked in both directions
+    return ( (row_days[:, None] & column_days[None, :]) != 0 ) \
+        & ( row_start[:, None] < column_end[None, :] ) \
+        & ( column_start[None, :] < row_end[:, None] )
+
+
+def build_conflict_matrix(sections: List[Section], block_size=1024) -> np.ndarray:
+    """
+    Builds the pairwise time conflict matrix of the given sections.
+
+    Args:
+        * sections -- a list of sections, the position of each section in the list is its row/column in the matrix.
+        * block_size -- number of rows computed at once, bounds the memory used by the intermediate arrays.
+
+    Returns:
+        conflicts -- a (n x n) boolean matrix, where conflicts[i, j] is True if section i and section j
+                     share a day and their times overlap. The diagonal is always False.
+    """
+    n = len(sections)
+    times = encode_section_times(sections, {})
+    conflicts = np.zeros((n, n), dtype=bool)
+
+    for row in range(0, n, block_size):
+        rows = slice(row, row + block_size)
+        conflicts[rows] = compute_conflicts( tuple(array[rows] for array in times), times )
+
+    np.fill_diagonal(conflicts, False)
+
+    return conflicts
+
+
+class SectionIndex:
+
+    def __init__(self, college_courses: Dict[str, Course], conflict_matrix: np.ndarray=None) -> None:
+        """
+        Gives every section in college_courses a dense integer id (see `Section.get_id()`),
+        and precomputes the conflict matrix of all the sections.
+        Must be built after the sections are read (`read_sections()`).
+
+        A conflict_matrix computed before for the same sections (i.e. loaded from the catalog cache) can be given,
+        so it is not computed again.
+        """
+        self.__sections: List[Section] = []
+        self.__course_codes: List[str] = []
+
+        for course_code, course in college_courses.items():
+
+            for section in course.get_sections():
+                section.set_id( len(self.__sections) )
+                self.__sections.append(section)
+                self.__course_codes.append(course_code)
+
+        if conflict_matrix is None:
+            conflict_matrix = build_conflict_matrix(self.__sections)
+
+        assert conflict_matrix.shape == ( len(self.__sections), len(self.__sections) ), 'conflict matrix size mismatch'
+        self.__conflicts = conflict_matrix
+        self.__removed: Set[int] = set()
+
+        # Encoded times of the sections (see `encode_section_times()`), only computed when sections are added
+        self.__times = None
+        self.__day_index = {}
+
+        # Each row of the matrix packed in an int (bit j set if conflicting with section j),
+        # checking a few sections with these is faster than indexing the matrix.
+        self.__conflict_rows = [
+            int.from_bytes( row.tobytes(), 'little' ) for row in np.packbits(self.__conflicts, axis=1, bitorder='little')
+        ]
+
+
+    def __len__(self):
+        return len(self.__sections)
+
+
+    def get_sections(self) -> List[Section]:
+        return self.__sections
+
+
+    def get_section(self, section_id) -> Section:
+        return self.__sections[section_id]
+
+
+    def get_course_code(self, section_id) -> str:
+        return self.__course_codes[section_id]
+
+
+    def get_conflict_matrix(self) -> np.ndarray:
+        return self.__conflicts[ :len(self.__sections), :len(self.__sections) ]
+
+
+    def get_conflict_row(self, section_id) -> int:
+        """
+        Returns the row of the conflict matrix of a section packed in an int, bit j is set if it conflicts with section j.
+        """
+        return self.__conflict_rows[section_id]
+
+
+    def is_removed(self, section_id) -> bool:
+        return section_id in self.__removed
+
+
+    def get_removed(self) -> Set[int]:
+        return self.__removed
+
+
+    def add_sections(self, course_code, sections: List[Section]) -> List[int]:
+        """
+        Indexes new sections of a course, i.e. sections opened during the registration.
+        Only the conflicts of the new sections are computed: the matrix grows by doubling its capacity,
+        and the bits of the new sections are set in the packed rows of the sections they conflict with.
+
+        Args:
+            * course_code -- the course of the sections.
+            * sections -- the new sections, given the next ids. Sections that already have an id
+                are already indexed, and are skipped.
+
+        Returns:
+            the ids of the new sections.
+        """
+        sections = [ section for section in sections if section.get_id() is None ]
+
+        if self.__times is None:
+            self.__times = encode_section_times(self.__sections, self.__day_index)
+
+        n, count = len(self.__sections), len(sections)
+        times = encode_section_times(sections, self.__day_index)
+        self.__times = tuple( np.concatenate(arrays) for arrays in zip(self.__times, times) )
+
+        if n + count > self.__conflicts.shape[0]:
+            capacity = max( n + count, 2 * self.__conflicts.shape[0] )
+            conflicts = np.zeros((capacity, capacity), dtype=bool)
+            conflicts[:n, :n] = self.__conflicts[:n, :n]
+            self.__conflicts = conflicts
+
+        # The new rows against all the sections, and their transpose as the new columns
+        new_rows = compute_conflicts( tuple(array[n:] for array in self.__times), self.__times )
+        new_rows[ np.arange(count), n + np.arange(count) ] = False
+
+        self.__conflicts[ n:n + count, :n + count ] = new_rows
+        self.__conflicts[ :n + count, n:n + count ] = new_rows.T
+
+        for row, section in zip(new_rows, sections):
+            section_id = len(self.__sections)
+            section.set_id(section_id)
+            self.__sections.append(section)
+            self.__course_codes.append(course_code)
+
+            self.__conflict_rows.append( int.from_bytes( np.packbits(row, bitorder='little').tobytes(), 'little' ) )
+
+            for other_id in np.flatnonzero( row[:n] ):
+                self.__conflict_rows[other_id] |= 1 << section_id
+
+        return list( range(n, n + count) )
+
+
+    def remove_sections(self, section_ids: Iterable[int]) -> None:
+        """
+        Marks sections as removed, i.e. closed during the registration. The ids of the other sections do not change,
+        so the encoded chromosomes stay valid; the removed sections must also be removed from their course.
+        """
+        self.__removed.update(section_ids)
+
+
+    def has_conflict(self, sections: Iterable[Section]):
+        """
+        Returns weather any two of the given sections have a time conflict, using the conflict matrix.
+
+        Args:
+            sections -- the sections to check, all of them must be indexed by this SectionIndex.
+
+        Returns:
+        True if at least one pair of sections conflicts, False if not.
+        """
+        conflicting = 0 # the sections that conflict with any of the already checked sections
+
+        for section in sections:
+            if conflicting >> section.get_id() & 1:
+                return True
+
+            conflicting |= self.__conflict_rows[ section.get_id() ]
+
+        return False
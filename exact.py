@@ -0,0 +1,236 @@
+from typing import Dict, List, Tuple
+from courses import Course, Section, SectionIndex
+from genetic import MAX_COURSES, MAX_DAYS
+import time
+
+NODE_LIMIT = 200_000
+TIME_LIMIT = 1.0 # seconds
+
+
+class SearchLimitReached(Exception):
+    pass
+
+
+class BranchAndBound:
+
+    def __init__(
+            self,
+            pool: List[str],
+            college_courses: Dict[str, Course],
+            section_index: SectionIndex,
+            preferences: Dict={},
+            max_courses=MAX_COURSES,
+            node_limit=NODE_LIMIT,
+            time_limit=TIME_LIMIT
+    ) -> None:
+        """
+        Exact search of the schedule with the highest `fitness()`, among the schedules of at most max_courses
+        courses of the pool (the longest chromosomes the genetic algorithm generates).
+
+        The courses are branched in decreasing priority, each one is skipped or takes one of its sections
+        that does not conflict with the sections already taken (checked with the packed conflict rows of
+        the SectionIndex). A branch is pruned when an upper bound of its fitness is not better than the best
+        schedule found: the priorities of the next courses, the instructor bonus if any next section matches,
+        and the days-off and credit-hours terms, which can only get worse as sections are added.
+
+        Args:
+            * pool -- list of the course codes the student can register for.
+            * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+            * section_index -- SectionIndex of college_courses.
+            * preferences -- the student preferences: instructor, days_off, credit_hours.
+            * max_courses -- the maximum number of courses of a schedule.
+            * node_limit, time_limit -- `solve()` raises SearchLimitReached after visiting node_limit nodes
+                or running for time_limit seconds.
+        """
+        self.__section_index = section_index
+        self.__max_courses = max_courses
+        self.__node_limit = node_limit
+        self.__time_limit = time_limit
+        self.__nodes = 0
+
+        self.__preferred_days_off = preferences.get("days_off")
+        self.__preferred_credit_hours = preferences.get("credit_hours")
+        instructor = preferences.get("instructor")
+
+        courses = [
+            course_code for course_code in dict.fromkeys(pool)
+            if college_courses[course_code].get_sections() and not college_courses[course_code].is_passed()
+        ]
+        courses.sort( key=lambda course_code: college_courses[course_code].get_priority(), reverse=True )
+
+        self.__courses = courses
+        self.__priorities = [ college_courses[c].get_priority() for c in courses ]
+        self.__credit_hours = [ college_courses[c].get_credit_hours() for c in courses ]
+        self.__sections = [ [section.get_id() for section in college_courses[c].get_sections()] for c in courses ]
+
+        # One bit per day of week of each section, and whether it is taught by the preferred instructor
+        day_index = {}
+        self.__days = {}
+        self.__instructor_match = {}
+
+        for course_sections in self.__sections:
+            for section_id in course_sections:
+                section = section_index.get_section(section_id)
+                days = 0
+
+                for day in section.get_days():
+                    days |= 1 << day_index.setdefault(day, len(day_index))
+
+                self.__days[section_id] = days
+                self.__instructor_match[section_id] = instructor is not None and section.get_instructor() == instructor
+
+        # Course positions by decreasing priority per credit hour, for the bound of the credit hours preference
+        self.__by_density = sorted(
+            ( i for i, p in enumerate(self.__priorities) if p > 0 ),
+            key=lambda i: self.__priorities[i] / self.__credit_hours[i] if self.__credit_hours[i] > 0 else float('inf'),
+            reverse=True
+        )
+
+        # Sections of the preferred instructor are tried first, so the first schedules found have the instructor bonus
+        for course_sections in self.__sections:
+            course_sections.sort( key=lambda section_id: not self.__instructor_match[section_id] )
+
+        # The sections of the courses from i onwards that match the preferred instructor, one bit per section id
+        self.__instructor_ahead = [0] * ( len(courses) + 1 )
+
+        for i in reversed( range( len(courses) ) ):
+            self.__instructor_ahead[i] = self.__instructor_ahead[i + 1]
+
+            for section_id in self.__sections[i]:
+                if self.__instructor_match[section_id]:
+                    self.__instructor_ahead[i] |= 1 << section_id
+
+
+    def get_nodes(self):
+        return self.__nodes
+
+
+    def __score(self, priority, credit_hours, days, matched):
+        """
+        Same as `fitness()` for a schedule without conflicts, with a matching section placed last.
+        """
+        score = priority + (5 if matched else 0)
+
+        if self.__preferred_days_off:
+            days_off = MAX_DAYS - days.bit_count()
+            score += self.__preferred_days_off - abs(self.__preferred_days_off - days_off)
+
+        if self.__preferred_credit_hours:
+            score -= abs(self.__preferred_credit_hours - credit_hours)
+
+        return score
+
+
+    def __credit_bound(self, i, credit_hours):
+        """
+        Upper bound of the priorities minus the credit hours penalty gained by adding courses from i onwards,
+        from the fractional relaxation: a credit hour beyond the preferred ones costs 1, so the courses with
+        more priority than credit hours are always worth adding, then the remaining credit hours are filled
+        in decreasing priority per credit hour.
+        """
+        remaining = self.__preferred_credit_hours - credit_hours
+        bound = -max(0, -remaining)
+        remaining = max(0, remaining)
+
+        for j in self.__by_density:
+            if j < i:
+                continue
+
+            p, h = self.__priorities[j], self.__credit_hours[j]
+
+            if p > h:
+                bound += p - max(0, h - remaining)
+                remaining = max(0, remaining - h)
+
+            elif remaining > 0:
+                bound += p * min(1, remaining / h)
+                remaining = max(0, remaining - h)
+
+        return bound
+
+
+    def __bound(self, i, taken, occupied, priority, credit_hours, days, matched):
+        """
+        Upper bound of the fitness of any schedule extending the current one with courses from i onwards.
+        """
+        # The priorities of the next courses that still fit in max_courses
+        gain = sum( p for p in self.__priorities[i : i + self.__max_courses - taken] if p > 0 )
+
+        if self.__preferred_credit_hours:
+            gain = min(
+                gain - max(0, credit_hours - self.__preferred_credit_hours),
+                self.__credit_bound(i, credit_hours)
+            )
+
+        bound = priority + gain
+
+        # A section of the preferred instructor is still possible if one does not conflict with the current ones
+        if matched or self.__instructor_ahead[i] & ~occupied:
+            bound += 5
+
+        if self.__preferred_days_off:
+            bound += min( self.__preferred_days_off, MAX_DAYS - days.bit_count() )
+
+        return bound
+
+
+    def solve(self) -> Tuple[ List[Tuple[str, Section]], int ]:
+        """
+        Returns:
+            The optimal schedule and its fitness.
+
+        Raises:
+            SearchLimitReached -- when the node or time limit is reached before the search is complete.
+        """
+        self.__nodes = 0
+        self.__deadline = time.perf_counter() + self.__time_limit
+        self.__best_score = 0
+        self.__best = []
+
+        self.__search(0, [], 0, 0, 0, 0, False)
+
+        return self.__decode(self.__best), self.__best_score
+
+
+    def __search(self, i, taken, occupied, priority, credit_hours, days, matched):
+        self.__nodes += 1
+
+        if self.__nodes > self.__node_limit or ( self.__nodes & 1023 == 0 and time.perf_counter() > self.__deadline ):
+            raise SearchLimitReached(f'{self.__nodes} nodes in {self.__time_limit} seconds')
+
+        if taken and (score := self.__score(priority, credit_hours, days, matched)) > self.__best_score:
+            self.__best_score = score
+            self.__best = list(taken)
+
+        if i == len(self.__courses) or len(taken) == self.__max_courses:
+            return
+
+        if self.__bound(i, len(taken), occupied, priority, credit_hours, days, matched) <= self.__best_score:
+            return
+
+        get_conflict_row = self.__section_index.get_conflict_row
+
+        for section_id in self.__sections[i]:
+            if occupied >> section_id & 1:
+                continue
+
+            taken.append(section_id)
+            self.__search(
+                i + 1, taken, occupied | get_conflict_row(section_id),
+                priority + self.__priorities[i], credit_hours + self.__credit_hours[i],
+                days | self.__days[section_id], matched or self.__instructor_match[section_id]
+            )
+            taken.pop()
+
+        # Skip this course
+        self.__search(i + 1, taken, occupied, priority, credit_hours, days, matched)
+
+
+    def __decode(self, section_ids) -> List[ Tuple[str, Section] ]:
+        # The instructor bonus of `fitness()` is given to the last gene, so a matching section goes last
+        section_ids = sorted( section_ids, key=lambda section_id: self.__instructor_match[section_id] )
+
+        return [
+            ( self.__section_index.get_course_code(section_id), self.__section_index.get_section(section_id) )
+            for section_id in section_ids
+        ]
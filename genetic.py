@@ -1,6 +1,18 @@
 from typing import Tuple, List, Dict
-from courses import Section, Course
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from courses import Section, Course, SectionIndex, count_occupied_days
+from chromosome import GenerationBuffers
+from mutation import MUTATION_RATE, MutationOperator
+from initializer import GreedyInitializer
+from convergence import ConvergenceController, measure_diversity
+from archive import EliteArchive
+from selection import Selection, roulette_wheel
+from instrumentation import generation_stats
+import itertools
 import random
+import time
 import numpy as np
 
 MAX_ITERATIONS = 20
@@ -37,7 +49,8 @@ def count_gene_collisions(selected_gene, chromosome: List[ Tuple[str, Section] ]
 def fitness(
         chromosome: List[ Tuple[str, Section] ],
         college_courses: Dict[str, Course],
-        preferences: Dict={}
+        preferences: Dict={},
+        section_index: SectionIndex=None
 ):
     """
     Calculates the fitness of a given chromosome
@@ -53,16 +66,36 @@ def fitness(
             - soft_preference: <True or False> (default True) ---> not implemented yet
 
             hard preferences means that the algorithm should not generate a solution that breaks the preference
+        * section_index -- (optional) a SectionIndex of the college courses, when given the conflicts are
+            checked with its conflict matrix instead of comparing every pair of sections.
     """
+    if not chromosome:
+        return 0
+
     score = 0
     credit_hours = 0 # used to satisfy the Credit Hours preference
     occupied_days = set() # used to satisfy the days-off preference
+    occupied_slots = 0    # same as occupied_days, for sections with a week-slot mask
     instructors = set()
 
+    # Sections read with time masks are checked with `&` on the masks (see `read_sections()`)
+    masked = all( gene[1].get_time_mask() is not None for gene in chromosome )
+
+    # One lookup in the conflict matrix replaces counting the collisions of each gene
+    if section_index is not None and section_index.has_conflict( [gene[1] for gene in chromosome] ):
+        return 0
+
     for gene in chromosome:
         # score -= ( (count_gene_collisions(gene, chromosome) / 2) * 10 )
 
-        if count_gene_collisions(gene, chromosome) or college_courses[ gene[0] ].is_passed():
+        if masked:
+            if section_index is None and occupied_slots & gene[1].get_time_mask():
+                return 0
+
+        elif section_index is None and count_gene_collisions(gene, chromosome):
+            return 0
+
+        if college_courses[ gene[0] ].is_passed():
             return 0
 
         # Highly penalize finished courses
@@ -72,7 +105,10 @@ def fitness(
         score += college_courses[ gene[0] ].get_priority()
         
         # Add the days of this section as occupied days.
-        occupied_days.update( gene[1].get_days() )
+        if masked:
+            occupied_slots |= gene[1].get_time_mask()
+        else:
+            occupied_days.update( gene[1].get_days() )
 
         # Add the instructor to instructors set
         instructors.add( gene[1].get_instructor() )
@@ -90,20 +126,373 @@ def fitness(
 
     # increase score by 1 for each day-off
     if preferred_days_off:= preferences.get("days_off"):
-        days_off = ( MAX_DAYS - len(occupied_days) )
+        days_off = MAX_DAYS - ( count_occupied_days(occupied_slots) if masked else len(occupied_days) )
         score += ( preferred_days_off - abs(preferred_days_off - days_off) )
 
     # Penalize unmatched credit hours preference
-    if preferred_credit_hours:= preferences.get("credit"):
+    if preferred_credit_hours:= preferences.get("credit_hours"):
         score -= abs(preferred_credit_hours - credit_hours)
 
     return score
 
 
-def populate(pool, college_courses: Dict[str, Course]):
+def encode_population(population: List[ List[Tuple[str, Section]] ]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes the chromosomes as integer arrays of section ids (see `SectionIndex`).
+
+    Args:
+        population -- a list of chromosomes, all their sections must be indexed by a SectionIndex.
+
+    Returns:
+        * sections -- a (population size x longest chromosome) matrix of section ids, padded with -1.
+        * lengths -- the number of genes in each chromosome.
+    """
+    lengths = np.fromiter( (len(chromosome) for chromosome in population), dtype=np.int64, count=len(population) )
+    sections = np.full( (len(population), lengths.max(initial=1)), -1, dtype=np.int64 )
+
+    # Scatter all the genes at once, instead of one row at a time
+    valid = np.arange( sections.shape[1] ) < lengths[:, None]
+    sections[valid] = np.fromiter(
+        (gene[1].get_id() for chromosome in population for gene in chromosome),
+        dtype=np.int64, count=int(lengths.sum())
+    )
+
+    return sections, lengths
+
+
+def decode_chromosome(section_ids, section_index: SectionIndex) -> List[ Tuple[str, Section] ]:
+    """
+    Inverse of the encoding done by `encode_population()` for a single chromosome.
+
+    Args:
+        * section_ids -- the section ids of the chromosome, padding (-1) is ignored.
+        * section_index -- the SectionIndex the ids belong to.
+
+    Returns:
+        chromosome -- list of genes `("course_code", Section object)`.
+    """
+    return [
+        ( section_index.get_course_code(section_id), section_index.get_section(section_id) )
+        for section_id in map(int, section_ids) if section_id >= 0
+    ]
+
+
+class BatchFitness:
+
+    def __init__(
+            self,
+            college_courses: Dict[str, Course],
+            section_index: SectionIndex,
+            preferences: Dict={}
+    ) -> None:
+        """
+        Calculates the fitness of a whole population at once, with the same score as `fitness()`.
+        The course and preference terms of every section are looked up once here,
+        so the evaluation is a few NumPy operations over the encoded population (see `encode_population()`).
+
+        Each lookup table has one more entry, a neutral one, picked by the -1 padding of the encoded chromosomes.
+        The conflicts are looked up for the gene pairs (i < j) only, in the flat conflict matrix.
+        `evaluate_population()` encodes the chromosomes first, in a Python loop over the genes.
+        """
+        sections = section_index.get_sections()
+        courses = [ college_courses[ section_index.get_course_code(i) ] for i in range(len(sections)) ]
+        day_index = {}
+
+        self.__preferences = preferences
+
+        # Flat view of the conflict matrix, a pair of sections (i, j) is looked up at i * n + j
+        self.__num_sections = len(sections)
+        self.__conflicts = np.ascontiguousarray( section_index.get_conflict_matrix() ).ravel()
+        self.__pairs = {} # the gene pairs (i < j) of each chromosome width
+
+        self.__priority = np.array( [c.get_priority() for c in courses] + [0], dtype=np.int64 )
+        self.__credit_hours = np.array( [c.get_credit_hours() for c in courses] + [0], dtype=np.int64 )
+        self.__passed = np.array( [c.is_passed() for c in courses] + [False], dtype=bool )
+
+        self.__instructor_match = np.array(
+            [s.get_instructor() == preferences.get("instructor") for s in sections] + [False], dtype=bool
+        )
+
+        self.__days = np.zeros(len(sections) + 1, dtype=np.int64) # one bit per day of week
+
+        for i, section in enumerate(sections):
+            for day in section.get_days():
+                self.__days[i] |= 1 << day_index.setdefault(day, len(day_index))
+
+
+    def evaluate(self, sections: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            * sections -- the section ids of the population padded with -1, as returned by `encode_population()`.
+            * lengths -- the number of genes in each chromosome.
+
+        Returns:
+            scores -- the fitness of each chromosome.
+        """
+        population_size, width = sections.shape
+
+        score = self.__priority[sections].sum(axis=1)
+        credit_hours = self.__credit_hours[sections].sum(axis=1)
+
+        # Any conflicting pair of genes, or any passed course makes the fitness 0.
+        # The later gene of a pair is its row: a padding gene (-1) makes the flat index negative,
+        # clipped to the diagonal entry (0, 0), which is never a conflict.
+        if (pairs := self.__pairs.get(width)) is None:
+            pairs = self.__pairs[width] = np.triu_indices(width, 1)
+
+        first, second = pairs
+        flat = np.multiply( sections[:, second], self.__num_sections, dtype=np.int64 )
+        flat += sections[:, first]
+
+        collisions = self.__conflicts.take(flat, mode='clip').any(axis=1)
+        rejected = collisions | self.__passed[sections].any(axis=1) | (lengths == 0)
+
+        # The instructor preference is matched against the last gene
+        last_gene = sections[ np.arange(population_size), np.maximum(lengths - 1, 0) ]
+        score += np.where( self.__instructor_match[last_gene], 5, 0 )
+
+        if preferred_days_off:= self.__preferences.get("days_off"):
+            occupied_days = np.bitwise_or.reduce( self.__days[sections], axis=1 )
+            days_off = MAX_DAYS - np.bitwise_count(occupied_days).astype(np.int64)
+            score += preferred_days_off - np.abs(preferred_days_off - days_off)
+
+        if preferred_credit_hours:= self.__preferences.get("credit_hours"):
+            score -= np.abs(preferred_credit_hours - credit_hours)
+
+        return np.where(rejected, 0, score)
+
+
+    def evaluate_population(self, population: List[ List[Tuple[str, Section]] ]) -> np.ndarray:
+        return self.evaluate( *encode_population(population) )
+
+
+class FitnessCache:
+
+    def __init__(self, max_size=10_000) -> None:
+        """
+        Bounded LRU cache of fitness scores, keyed by the canonical form of the chromosome (see `make_key()`).
+        The scores depend on the student's courses (priority, passed courses), so a cache must only be
+        shared between runs of the same student.
+        """
+        self.__max_size = max_size
+        self.__entries: OrderedDict = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+
+    @staticmethod
+    def make_key(chromosome: List[ Tuple[str, Section] ], preferences: Dict={}):
+        """
+        Returns a hashable key of the chromosome that does not depend on the order of the genes.
+        Only the last gene is kept apart when there is an instructor preference, since it is the one
+        matched against the preferred instructor in `fitness()`.
+        """
+        genes = frozenset( (course, section.get_number(), section.get_type()) for course, section in chromosome )
+        last_gene = None
+
+        if preferences.get("instructor") is not None and chromosome:
+            course, section = chromosome[-1]
+            last_gene = (course, section.get_number(), section.get_type())
+
+        return genes, last_gene, tuple( sorted(preferences.items()) )
+
+
+    def lookup(self, key):
+        """
+        Returns the cached fitness for key, or None if it is not cached.
+        """
+        if (score := self.__entries.get(key)) is None:
+            self.__misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+
+        return score
+
+
+    def store(self, key, score):
+        self.__entries[key] = score
+        self.__entries.move_to_end(key)
+
+        # Evict the least recently used entries
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+
+    def get_fitness(
+            self,
+            chromosome: List[ Tuple[str, Section] ],
+            college_courses: Dict[str, Course],
+            preferences: Dict={},
+            section_index: SectionIndex=None
+    ):
+        """
+        Same as `fitness()`, but the score is only calculated if the chromosome is not cached.
+        """
+        key = self.make_key(chromosome, preferences)
+
+        if (score := self.lookup(key)) is None:
+            score = fitness(chromosome, college_courses, preferences=preferences, section_index=section_index)
+            self.store(key, score)
+
+        return score
+
+
+    def get_hits(self):
+        return self.__hits
+
+
+    def get_misses(self):
+        return self.__misses
+
+
+    def get_evictions(self):
+        return self.__evictions
+
+
+    def get_hit_rate(self):
+        lookups = self.__hits + self.__misses
+        return self.__hits / lookups if lookups else 0.0
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    def __repr__(self) -> str:
+        return f'FitnessCache: {len(self)}/{self.__max_size} | Hits: {self.__hits} \
+            Misses: {self.__misses} | Evictions: {self.__evictions}'
+
+
+# State of a fitness worker process, set once by `_init_fitness_worker()`
+_worker_state = {}
+
+# Identifies the runs evaluated in a shared executor (see `ParallelFitness`)
+_fitness_runs = itertools.count()
+
+
+def _init_fitness_worker(college_courses, section_index, preferences, vectorized, run=None):
+    _worker_state['run'] = run
+    _worker_state['college_courses'] = college_courses
+    _worker_state['section_index'] = section_index
+    _worker_state['preferences'] = preferences
+    _worker_state['batch_fitness'] = BatchFitness(college_courses, section_index, preferences) if vectorized else None
+
+
+def _evaluate_encoded(sections: np.ndarray, lengths: np.ndarray, run=None, state=None) -> List:
+    # A worker of a shared executor holds the state of a single run, a chunk of another run
+    # is answered with None until it is sent again with the state of its run
+    if run is not None and _worker_state.get('run') != run:
+        if state is None:
+            return None
+
+        _init_fitness_worker(*state, run)
+
+    if batch_fitness := _worker_state['batch_fitness']:
+        return batch_fitness.evaluate(sections, lengths).tolist()
+
+    return [
+        fitness(
+            decode_chromosome(row[:length], _worker_state['section_index']),
+            _worker_state['college_courses'],
+            preferences=_worker_state['preferences'],
+            section_index=_worker_state['section_index']
+        )
+        for row, length in zip(sections, lengths)
+    ]
+
+
+class ParallelFitness:
+
+    def __init__(
+            self,
+            workers,
+            college_courses: Dict[str, Course],
+            section_index: SectionIndex,
+            preferences: Dict={},
+            vectorized=False,
+            executor: ProcessPoolExecutor=None
+    ) -> None:
+        """
+        Evaluates the fitness of a population across a pool of worker processes.
+        The courses and the section index are sent once to each worker when the pool starts,
+        then the chromosomes are sent as section ids (see `encode_population()`).
+
+        A started executor can be given instead, and reused by the following runs (i.e. one per batch worker),
+        so that they do not pay for starting a pool. Its workers are not initialized: the courses and the
+        section index are sent to a worker with the first chunk it gets that it holds no state for.
+        The executor is then left open by `close()`.
+        """
+        self.__workers = workers
+        self.__state = (college_courses, section_index, preferences, vectorized)
+
+        if executor is None:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_fitness_worker,
+                initargs=self.__state
+            )
+            self.__run = None
+        else:
+            self.__executor = executor
+            self.__run = next(_fitness_runs)
+
+        self.__owns_executor = executor is None
+
+
+    def evaluate(self, sections: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Returns the fitness of encoded chromosomes (see `encode_population()`).
+        """
+        if len(lengths) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        chunks = np.array_split( np.arange(len(lengths)), min(self.__workers, len(lengths)) )
+        section_chunks, length_chunks = [sections[c] for c in chunks], [lengths[c] for c in chunks]
+
+        # map() keeps the order of the chunks, so the result is the same as a serial evaluation
+        chunk_fitness = list( self.__executor.map( _evaluate_encoded, section_chunks, length_chunks, [self.__run] * len(chunks) ) )
+
+        # The chunks of a shared executor that reached a worker without the state of this run are sent again with it
+        resent = {
+            i: self.__executor.submit( _evaluate_encoded, section_chunks[i], length_chunks[i], self.__run, self.__state )
+            for i, scores in enumerate(chunk_fitness) if scores is None
+        }
+
+        for i, future in resent.items():
+            chunk_fitness[i] = future.result()
+
+        return np.array( [score for scores in chunk_fitness for score in scores], dtype=np.int64 )
+
+
+    def evaluate_population(self, population: List[ List[Tuple[str, Section]] ]) -> np.ndarray:
+        if not population:
+            return np.zeros(0, dtype=np.int64)
+
+        return self.evaluate( *encode_population(population) )
+
+
+    def close(self):
+        if self.__owns_executor:
+            self.__executor.shutdown()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def populate(pool, college_courses: Dict[str, Course], population_size=None):
     generation = []
 
-    for i in range(MAX_POPULATION):
+    # MAX_POPULATION is read at call time, so it can be changed on the module (i.e. by the benchmarks)
+    for i in range(MAX_POPULATION if population_size is None else population_size):
         num_courses = random.randint(MIN_COURSES, MAX_COURSES)
 
         # Randomly select courses
@@ -123,14 +512,18 @@ def populate(pool, college_courses: Dict[str, Course]):
     return generation
 
 
+def draw_cross_point(first_length, second_length):
+    if first_length <= 2 or second_length <= 2:
+        return 1
+
+    return random.randint(1, min( first_length, second_length ) - 1)
+
+
 def crossover(first_parent, second_parent):
 
     # assert len(first_parent) > 2 and len(second_parent) > 2, 'error in range -- first:{} second:{}'.format(len(first_parent), len(second_parent))
 
-    if len(first_parent) <= 2 or len(second_parent) <= 2:
-        cross_point = 1
-    else:
-        cross_point = random.randint(1, min( len(first_parent), len(second_parent) ) - 1)
+    cross_point = draw_cross_point( len(first_parent), len(second_parent) )
 
 
     # Copy first half from each parent
@@ -171,33 +564,99 @@ def crossover(first_parent, second_parent):
     return offspring1, offspring2
 
 
-def mutate(mutation_rate):
-    pass
+def mutate(population, mutation_operator: MutationOperator):
+    """
+    Returns the mutated and repaired chromosomes of the population (see `MutationOperator.mutate()`).
+    """
+    return [ mutation_operator.mutate(chromosome) for chromosome in population ]
+
+
+def roulette_wheel_selection(population, pop_fitness, total_fitness=None):
+    """
+    Spins the roulette wheel MAX_POPULATION times (see `selection.roulette_wheel()`), and returns the
+    selected chromosomes. total_fitness is not needed anymore, populations with no fitness are selected uniformly.
+    """
+    return [ population[i] for i in roulette_wheel( np.asarray(pop_fitness), MAX_POPULATION ).tolist() ]
+
+
+def make_evaluator(
+        college_courses: Dict[str, Course],
+        section_index: SectionIndex=None,
+        preferences: Dict={},
+        batch_fitness=None,
+        fitness_cache: FitnessCache=None
+):
+    """
+    Creates the function that calculates the fitness of a whole population.
+
+    Args:
+        * college_courses, section_index, preferences -- same as in `fitness()`.
+        * batch_fitness -- (optional) BatchFitness or ParallelFitness, used instead of calling `fitness()` for each chromosome.
+        * fitness_cache -- (optional) FitnessCache, chromosomes found in the cache are not evaluated again.
+
+    Returns:
+        evaluate -- a function that takes a population and returns the list of its fitness.
+    """
+    def score(population):
+        if batch_fitness is not None:
+            return batch_fitness.evaluate_population(population).tolist()
+
+        return [
+            fitness(chromosome, college_courses, preferences=preferences, section_index=section_index)
+            for chromosome in population
+        ]
 
+    def evaluate(population):
+        if fitness_cache is None:
+            return score(population)
 
-def roulette_wheel_selection(population, pop_fitness, total_fitness):
-    selection_probabilities = [fit / total_fitness for fit in pop_fitness]
+        keys = [fitness_cache.make_key(chromosome, preferences) for chromosome in population]
+        pop_fitness = [fitness_cache.lookup(key) for key in keys]
 
-    # Create a roulette wheel (list with probabilities)
-    roulette_wheel = np.cumsum(selection_probabilities)
+        # Only the chromosomes missing from the cache are scored (in one batch when vectorized)
+        missing = [i for i, fit in enumerate(pop_fitness) if fit is None]
 
-    selected_parents = []
+        for i, fit in zip( missing, score([population[i] for i in missing]) ):
+            pop_fitness[i] = fit
+            fitness_cache.store(keys[i], fit)
 
-    for _ in range(MAX_POPULATION):
-        spin_value = random.random()
-        selected_index = np.searchsorted(roulette_wheel, spin_value)
-        selected_parents.append(population[selected_index])
+        return pop_fitness
 
-    return selected_parents
+    return evaluate
 
 
-def run_ga(initial_pool, college_courses, **kwargs) -> Tuple[ List[Tuple[str, Section]], int ]:
+def evolve(
+        parents,
+        evaluate,
+        generations=MAX_ITERATIONS,
+        mutation_operator: MutationOperator=None,
+        controller: ConvergenceController=None,
+        archive: EliteArchive=None,
+        selection: Selection=None,
+        on_generation=None
+):
+    """
+    Evolves the parents for a number of generations (crossover, mutation, then selection).
 
-    assert all(key in ['instructor', 'days_off', 'credit_hours'] for key in kwargs.keys()), 'Unexpected preference'
+    Args:
+        * parents -- the initial population.
+        * evaluate -- function returning the fitness of a population (see `make_evaluator()`).
+        * generations -- the maximum number of generations to run.
+        * mutation_operator -- (optional) MutationOperator the offsprings are mutated and repaired with.
+        * controller -- (optional) ConvergenceController, started by the caller, that can stop the
+            evolution early. It counts the generations run.
+        * archive -- (optional) EliteArchive every evaluated chromosome is offered to.
+        * selection -- (optional) Selection of the next parents, defaults to the roulette wheel.
+        * on_generation -- (optional) callback called after each generation with its statistics
+            (see `instrumentation.generation_stats()`).
 
-    parents = populate(initial_pool, college_courses)
+    Returns:
+        parents -- the population selected in the last generation.
+    """
+    selection = selection or Selection()
 
-    for _ in range(MAX_ITERATIONS):
+    for generation in range(1, generations + 1):
+        start = time.perf_counter()
 
         offsprings = []
 
@@ -205,28 +664,275 @@ def run_ga(initial_pool, college_courses, **kwargs) -> Tuple[ List[Tuple[str, Se
         for i in range(0, len(parents), 2):
             offsprings.extend( crossover(parents[i], parents[i+1]) )
 
-        population = parents + offsprings
+        crossover_end = time.perf_counter()
+
+        if mutation_operator is not None:
+            offsprings = mutate(offsprings, mutation_operator)
 
-        pop_fitness = []
-        total_fitness = 0
+        mutation_end = time.perf_counter()
+
+        population = parents + offsprings
 
         # Calculate the fitness for population
-        for chromosome in population:
-            fit = fitness(chromosome, college_courses, preferences=kwargs)
-            total_fitness += fit
-            pop_fitness.append(fit)
+        pop_fitness = evaluate(population)
+
+        if archive is not None:
+            archive.offer_population(population, pop_fitness)
+
+        evaluation_end = time.perf_counter()
 
         # Most fitted, will become parents for the next iteration
-        parents = roulette_wheel_selection(population, pop_fitness, total_fitness)
+        parents = selection.select_population( population, pop_fitness, len(parents) )
+
+        if on_generation is not None:
+            on_generation( generation_stats( generation, {
+                'crossover': crossover_end - start,
+                'mutation': mutation_end - crossover_end,
+                'evaluation': evaluation_end - mutation_end,
+                'selection': time.perf_counter() - evaluation_end,
+            }, pop_fitness ) )
+
+        if controller is not None:
+            diversity = None
+
+            if controller.checks_diversity():
+                diversity = measure_diversity( map(FitnessCache.make_key, parents), len(parents) )
+
+            if controller.update( max(pop_fitness), diversity ):
+                break
+
+    return parents
+
+
+def evolve_encoded(
+        buffers: GenerationBuffers,
+        evaluate_encoded,
+        generations=MAX_ITERATIONS,
+        mutation_operator: MutationOperator=None,
+        controller: ConvergenceController=None,
+        archive: EliteArchive=None,
+        selection: Selection=None,
+        on_generation=None
+) -> np.ndarray:
+    """
+    Same as `evolve()`, on an integer-encoded population: the crossover and the selection work on the
+    preallocated GenerationBuffers, so no Python lists are created for the chromosomes.
+    The mutation is the exception: with a mutation_operator, every offspring is mutated and repaired as a list
+    of section ids (see `GenerationBuffers.update_offsprings()`), with the same random draws as in `evolve()`.
+
+    Args:
+        * buffers -- the GenerationBuffers, loaded with the initial parents.
+        * evaluate_encoded -- function returning the fitness of encoded chromosomes (sections, lengths),
+            i.e. `BatchFitness.evaluate`.
+        * generations -- the maximum number of generations to run.
+        * mutation_operator -- (optional) MutationOperator the offsprings are mutated and repaired with.
+        * controller -- (optional) ConvergenceController that can stop the evolution early (see `evolve()`).
+        * archive -- (optional) EliteArchive the evaluated chromosomes are offered to, only the ones
+            above its threshold are decoded.
+        * selection -- (optional) Selection of the next parents, defaults to the roulette wheel.
+        * on_generation -- (optional) callback called after each generation with its statistics (see `evolve()`).
+
+    Returns:
+        The fitness of the parents selected in the last generation.
+    """
+    selection = selection or Selection()
+
+    for generation in range(1, generations + 1):
+        start = time.perf_counter()
+
+        _, parent_lengths = buffers.get_parents()
+
+        # Same random draws as the crossover of each pair in `evolve()`
+        cross_points = np.array( [
+            draw_cross_point( parent_lengths[i], parent_lengths[i + 1] ) for i in range(0, len(parent_lengths), 2)
+        ] )
+        buffers.crossover(cross_points)
+
+        crossover_end = time.perf_counter()
+
+        if mutation_operator is not None:
+            buffers.update_offsprings(mutation_operator.mutate_ids)
+
+        mutation_end = time.perf_counter()
+
+        pop_fitness = evaluate_encoded( *buffers.get_population() )
+
+        if archive is not None:
+            threshold = archive.get_threshold()
+            candidates = np.arange(len(pop_fitness)) if threshold is None else np.flatnonzero(pop_fitness > threshold)
+
+            for row in candidates.tolist():
+                if (threshold := archive.get_threshold()) is None or pop_fitness[row] > threshold:
+                    archive.offer( buffers.decode(row), int( pop_fitness[row] ) )
+
+        evaluation_end = time.perf_counter()
+
+        buffers.select( selection.select( pop_fitness, len(parent_lengths) ) )
 
+        if on_generation is not None:
+            on_generation( generation_stats( generation, {
+                'crossover': crossover_end - start,
+                'mutation': mutation_end - crossover_end,
+                'evaluation': evaluation_end - mutation_end,
+                'selection': time.perf_counter() - evaluation_end,
+            }, pop_fitness ) )
+
+        if controller is not None:
+            diversity = None
+
+            if controller.checks_diversity():
+                diversity = buffers.measure_diversity()
+
+            if controller.update( int( pop_fitness.max() ), diversity ):
+                break
+
+    return evaluate_encoded( *buffers.get_parents() )
+
+
+def select_best(population, pop_fitness) -> Tuple[ List[Tuple[str, Section]], int ]:
+    """
+    Returns the most fitted chromosome of the population and its fitness.
+    """
     most_fitted_index = 0
     fitness_max = 0
 
-    for i, individual in enumerate(parents):
-        ind_fitness = fitness(individual, college_courses, preferences=kwargs)
+    for i, ind_fitness in enumerate(pop_fitness):
 
         if ind_fitness > fitness_max:
             fitness_max = ind_fitness
             most_fitted_index = i
 
-    return parents[ most_fitted_index ], fitness_max
+    return population[ most_fitted_index ], fitness_max
+
+
+def run_ga(
+        initial_pool,
+        college_courses,
+        section_index: SectionIndex=None,
+        vectorized=False,
+        fitness_cache: FitnessCache=None,
+        workers=1,
+        executor: ProcessPoolExecutor=None,
+        encoded=False,
+        mutation_rate=MUTATION_RATE,
+        max_generations=None,
+        time_budget=None,
+        stall_generations=None,
+        min_diversity=None,
+        archive: EliteArchive=None,
+        selection: Selection=None,
+        on_generation=None,
+        initial_population: List[ List[Tuple[str, Section]] ]=None,
+        greedy_init=False,
+        **kwargs
+) -> Tuple[ List[Tuple[str, Section]], int, int ]:
+    """
+    Runs the genetic algorithm on the pool of available courses.
+
+    Args:
+        * initial_pool -- list of the course codes the student can register for.
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * section_index -- (optional) SectionIndex of college_courses, used for the conflict checks.
+        * vectorized -- if True, the fitness of each generation is calculated at once with `BatchFitness`
+            (requires section_index). Without a fitness_cache and workers, the population is then kept encoded,
+            same as encoded=True, instead of being encoded again every generation.
+        * fitness_cache -- (optional) FitnessCache, chromosomes found in the cache are not evaluated again.
+        * workers -- number of processes the fitness is evaluated in (see `ParallelFitness`),
+            more than 1 requires section_index.
+        * executor -- (optional) started ProcessPoolExecutor of the workers, reused across runs instead of
+            starting a pool for each one (see `ParallelFitness`).
+        * encoded -- if True, the population is kept as section ids in preallocated `GenerationBuffers`
+            (requires section_index, the fitness is then always vectorized).
+        * mutation_rate -- the probability of mutating each gene of the offsprings, with a section_index
+            the initial population and the offsprings are also repaired (see `MutationOperator`).
+        * max_generations -- the maximum number of generations, defaults to MAX_ITERATIONS.
+        * time_budget -- (optional) wall-clock budget of the run in seconds, checked between generations
+            (see `ConvergenceController`).
+        * stall_generations -- (optional) stop after this many generations without a better fitness.
+        * min_diversity -- (optional) stop when the share of distinct parents falls below it.
+        * archive -- (optional) EliteArchive, filled with the top distinct schedules of all the generations
+            (see `EliteArchive.get_schedules()`).
+        * selection -- (optional) Selection of the parents of each generation, defaults to the roulette wheel.
+        * on_generation -- (optional) callback called after each generation with its statistics: the operator
+            timings, evaluations, best and mean fitness, share of zero fitness (see `generation_stats()`),
+            and the fitness_cache hits and misses of the generation. i.e. `instrumentation.JsonLinesSink`.
+        * initial_population -- (optional) chromosomes the first generation starts from, used as they are
+            (i.e. the patched population of a previous run, see `reoptimize.reoptimize()`). The rest of the first
+            generation is random.
+        * greedy_init -- if True, the first generation is built conflict-free and priority-biased by a
+            `GreedyInitializer` instead of `populate()` (requires section_index).
+        * kwargs -- the student preferences: instructor, days_off, credit_hours.
+
+    Returns:
+        The most fitted chromosome of the last generation, its fitness, and the number of generations run.
+    """
+    assert all(key in ['instructor', 'days_off', 'credit_hours'] for key in kwargs.keys()), 'Unexpected preference'
+    assert not vectorized or section_index is not None, 'vectorized fitness requires a section_index'
+    assert workers <= 1 or section_index is not None, 'parallel fitness requires a section_index'
+    assert not encoded or section_index is not None, 'encoded chromosomes require a section_index'
+    assert not encoded or fitness_cache is None, 'encoded chromosomes are not cached'
+    assert not greedy_init or section_index is not None, 'greedy initialization requires a section_index'
+
+    # The encoded evolution gives the same results, without encoding the list population every generation
+    encoded = encoded or ( vectorized and workers <= 1 and fitness_cache is None )
+
+    controller = ConvergenceController(time_budget, stall_generations, min_diversity)
+    controller.start()
+
+    generations = MAX_ITERATIONS if max_generations is None else max_generations
+
+    # Adds the fitness cache counters of the generation to its statistics
+    if on_generation is not None and fitness_cache is not None:
+        callback, cache_counters = on_generation, [ fitness_cache.get_hits(), fitness_cache.get_misses() ]
+
+        def on_generation(stats):
+            hits, misses = fitness_cache.get_hits(), fitness_cache.get_misses()
+            stats['cache_hits'], stats['cache_misses'] = hits - cache_counters[0], misses - cache_counters[1]
+            cache_counters[:] = hits, misses
+            callback(stats)
+
+    with ExitStack() as stack:
+
+        # Evaluates a whole population at once: in worker processes, or vectorized in this process
+        if workers > 1:
+            batch_fitness = stack.enter_context( ParallelFitness(workers, college_courses, section_index, kwargs, vectorized, executor) )
+        elif vectorized or encoded:
+            batch_fitness = BatchFitness(college_courses, section_index, kwargs)
+        else:
+            batch_fitness = None
+
+        initial_population = list( initial_population or [] )[:MAX_POPULATION]
+
+        if greedy_init:
+            initializer = GreedyInitializer(
+                initial_pool, college_courses, section_index, MIN_COURSES, MAX_COURSES, kwargs.get("credit_hours")
+            )
+            parents = initializer.populate( MAX_POPULATION - len(initial_population) )
+        else:
+            parents = populate( initial_pool, college_courses, MAX_POPULATION - len(initial_population) )
+
+        # Conflicting chromosomes are repaired instead of scoring 0, the greedy ones have no conflicts
+        if section_index is not None and mutation_rate > 0:
+            mutation_operator = MutationOperator(initial_pool, college_courses, section_index, mutation_rate)
+
+            if not greedy_init:
+                parents = [ mutation_operator.repair(chromosome) for chromosome in parents ]
+        else:
+            mutation_operator = None
+
+        parents = initial_population + parents
+
+        if encoded:
+            buffers = GenerationBuffers( section_index, MAX_POPULATION, max( 1, *map(len, parents) ) )
+            buffers.load(parents)
+
+            pop_fitness = evolve_encoded(buffers, batch_fitness.evaluate, generations, mutation_operator, controller, archive, selection, on_generation)
+            best, fitness_max = select_best( range(MAX_POPULATION), pop_fitness )
+
+            return buffers.decode(best), int(fitness_max), controller.get_generations()
+
+        evaluate = make_evaluator(college_courses, section_index, kwargs, batch_fitness, fitness_cache)
+
+        parents = evolve( parents, evaluate, generations, mutation_operator, controller, archive, selection, on_generation )
+
+        return ( *select_best( parents, evaluate(parents) ), controller.get_generations() )
@@ -0,0 +1,113 @@
+from typing import Dict, List, Tuple
+from courses import Course, Section, SectionIndex
+import random
+
+
+class GreedyInitializer:
+
+    def __init__(
+            self,
+            pool: List[str],
+            college_courses: Dict[str, Course],
+            section_index: SectionIndex,
+            min_courses,
+            max_courses,
+            credit_hours=None
+    ) -> None:
+        """
+        Builds conflict-free chromosomes for the first generation, instead of the random ones of `populate()`.
+        Each chromosome takes the courses of the pool in a random order biased by their priority
+        (see `calculate_prerequisites_priority()`), and a random section of each course that does not conflict
+        with the sections already taken, checked with the packed conflict rows of the section_index.
+        Courses are added until the credit hours target is met.
+
+        Args:
+            * pool -- list of the course codes the student can register for.
+            * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+            * section_index -- SectionIndex of college_courses.
+            * min_courses, max_courses -- the number of courses of a chromosome.
+            * credit_hours -- (optional) the credit hours target, i.e. the student's preference. Without it,
+                each chromosome targets a random number of courses between min_courses and max_courses.
+        """
+        self.__section_index = section_index
+        self.__credit_hours = credit_hours
+        self.__min_courses = min_courses
+        self.__max_courses = max_courses
+
+        self.__courses = [
+            course_code for course_code in pool
+            if college_courses[course_code].get_sections() and not college_courses[course_code].is_passed()
+        ]
+        self.__course_sections: Dict[str, List[int]] = {
+            course_code: [ section.get_id() for section in college_courses[course_code].get_sections() ]
+            for course_code in self.__courses
+        }
+        self.__weights = { course_code: college_courses[course_code].get_priority() + 1 for course_code in self.__courses }
+        self.__course_credit_hours = {
+            course_code: college_courses[course_code].get_credit_hours() for course_code in self.__courses
+        }
+
+
+    def __draw_order(self) -> List[str]:
+        """
+        Returns the courses in a random order, where a course comes first with a probability proportional to its weight
+        (weighted sampling without replacement: each course is sorted by a random key u ** (1 / weight)).
+        """
+        return sorted( self.__courses, key=lambda c: random.random() ** (1 / self.__weights[c]), reverse=True )
+
+
+    def build_ids(self) -> List[int]:
+        """
+        Builds one chromosome, given as section ids.
+        """
+        get_conflict_row = self.__section_index.get_conflict_row
+
+        if self.__credit_hours is None:
+            num_courses = random.randint(self.__min_courses, self.__max_courses)
+        else:
+            num_courses = self.__max_courses
+
+        credit_hours = 0
+        occupied = 0 # the sections that conflict with the taken sections
+        section_ids = []
+
+        for course_code in self.__draw_order():
+
+            if len(section_ids) >= num_courses:
+                break
+
+            if self.__credit_hours is not None:
+                if credit_hours >= self.__credit_hours:
+                    break
+
+                # A course that overshoots the target is skipped, a smaller one may still fit
+                if credit_hours + self.__course_credit_hours[course_code] > self.__credit_hours:
+                    continue
+
+            candidates = [
+                section_id for section_id in self.__course_sections[course_code] if not occupied >> section_id & 1
+            ]
+
+            if not candidates:
+                continue
+
+            section_id = random.choice(candidates)
+            section_ids.append(section_id)
+            credit_hours += self.__course_credit_hours[course_code]
+            occupied |= get_conflict_row(section_id)
+
+        return section_ids
+
+
+    def build(self) -> List[ Tuple[str, Section] ]:
+        """
+        Same as `build_ids()`, for a chromosome given as a list of genes `("course_code", Section object)`.
+        """
+        return [
+            ( self.__section_index.get_course_code(section_id), self.__section_index.get_section(section_id) )
+            for section_id in self.build_ids()
+        ]
+
+
+    def populate(self, population_size) -> List[ List[Tuple[str, Section]] ]:
+        return [ self.build() for _ in range(population_size) ]
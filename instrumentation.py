@@ -0,0 +1,146 @@
+from typing import Callable, Dict, IO, List, Tuple
+from collections import defaultdict
+import numpy as np
+import functools
+import importlib
+import json
+import time
+
+# The functions wrapped by `Profiler` by default, as (module, attribute) with "Class.method" for methods
+HOT_FUNCTIONS = [
+    ('genetic', 'fitness'),
+    ('genetic', 'count_gene_collisions'),
+    ('genetic', 'populate'),
+    ('genetic', 'crossover'),
+    ('genetic', 'mutate'),
+    ('genetic', 'encode_population'),
+    ('genetic', 'BatchFitness.evaluate'),
+    ('genetic', 'FitnessCache.get_fitness'),
+    ('chromosome', 'GenerationBuffers.crossover'),
+    ('chromosome', 'GenerationBuffers.update_offsprings'),
+    ('mutation', 'MutationOperator.repair_ids'),
+    ('mutation', 'MutationOperator.mutate_ids'),
+    ('selection', 'Selection.select'),
+]
+
+
+def generation_stats(generation, timings: Dict[str, float], pop_fitness) -> Dict:
+    """
+    Returns the statistics of a generation, given to the on_generation callback of `run_ga()`.
+
+    Args:
+        * generation -- the number of the generation, from 1.
+        * timings -- the seconds spent in each operator of the generation.
+        * pop_fitness -- the fitness of the evaluated population (parents and offsprings).
+    """
+    pop_fitness = np.asarray(pop_fitness)
+
+    return {
+        'generation': generation,
+        'timings': timings,
+        'evaluations': len(pop_fitness),
+        'best_fitness': int( pop_fitness.max() ) if len(pop_fitness) else 0,
+        'mean_fitness': float( pop_fitness.mean() ) if len(pop_fitness) else 0.0,
+        'zero_fitness_share': float( np.mean(pop_fitness == 0) ) if len(pop_fitness) else 0.0,
+    }
+
+
+class JsonLinesSink:
+
+    def __init__(self, file: IO, **fields) -> None:
+        """
+        An on_generation callback (see `run_ga()`) writing the statistics of each generation as a JSON line.
+        The extra fields (i.e. a student id) are added to every line.
+        """
+        self.__file = file
+        self.__fields = fields
+
+
+    def __call__(self, stats: Dict):
+        self.__file.write( json.dumps( { **self.__fields, **stats } ) + '\n' )
+
+
+class Profiler:
+
+    def __init__(self, functions: List[ Tuple[str, str] ]=HOT_FUNCTIONS) -> None:
+        """
+        Counts the calls and the time spent in the hot functions, while it is active as a context manager:
+
+            with Profiler() as profiler:
+                run_ga(...)
+            print( profiler.report() )
+
+        The functions are replaced by timed wrappers on enter and restored on exit, so there is no overhead
+        outside of the `with` block. Nested calls are timed in both functions (i.e. `count_gene_collisions`
+        is also part of `fitness`).
+
+        Args:
+            functions -- the (module, attribute) to profile, "Class.method" for methods (see HOT_FUNCTIONS).
+        """
+        self.__functions = functions
+        self.__originals = []
+        self.__calls = defaultdict(int)
+        self.__seconds = defaultdict(float)
+
+
+    def __wrap(self, name, function: Callable):
+        calls, seconds = self.__calls, self.__seconds
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds[name] += time.perf_counter() - start
+                calls[name] += 1
+
+        return timed
+
+
+    def __enter__(self):
+        for module_name, attribute in self.__functions:
+            owner = importlib.import_module(module_name)
+            *path, function_name = attribute.split('.')
+
+            for class_name in path:
+                owner = getattr(owner, class_name)
+
+            original = owner.__dict__[function_name]
+            self.__originals.append( (owner, function_name, original) )
+
+            # staticmethods are unwrapped and wrapped again, so they are still called without self
+            if isinstance(original, staticmethod):
+                setattr( owner, function_name, staticmethod( self.__wrap(attribute, original.__func__) ) )
+            else:
+                setattr( owner, function_name, self.__wrap(attribute, original) )
+
+        return self
+
+
+    def __exit__(self, *args):
+        while self.__originals:
+            owner, function_name, original = self.__originals.pop()
+            setattr(owner, function_name, original)
+
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Returns the calls and seconds of each profiled function that was called, the slowest first.
+        """
+        return {
+            name: { 'calls': self.__calls[name], 'seconds': self.__seconds[name] }
+            for name in sorted( self.__calls, key=lambda name: self.__seconds[name], reverse=True )
+        }
+
+
+    def report(self) -> str:
+        lines = [ f'{"function":>40} {"calls":>10} {"seconds":>10} {"us/call":>10}' ]
+
+        for name, stats in self.get_stats().items():
+            lines.append(
+                f'{name:>40} {stats["calls"]:>10} {stats["seconds"]:>10.4f} {stats["seconds"] / stats["calls"] * 1e6:>10.1f}'
+            )
+
+        return '\n'.join(lines)
@@ -0,0 +1,166 @@
+from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from courses import Course, Section, SectionIndex
+from mutation import MUTATION_RATE, MutationOperator
+from genetic import (
+    MAX_ITERATIONS, BatchFitness,
+    populate, evolve, select_best, make_evaluator, encode_population, decode_chromosome
+)
+import random
+import os
+
+TOPOLOGIES = ['ring', 'full']
+
+# State of an island worker process, set once by `_init_island_worker()`
+_island_state = {}
+
+
+def _init_island_worker(initial_pool, college_courses, section_index, preferences, vectorized, mutation_rate):
+    batch_fitness = BatchFitness(college_courses, section_index, preferences) if vectorized else None
+
+    if mutation_rate > 0:
+        _island_state['mutation_operator'] = MutationOperator(initial_pool, college_courses, section_index, mutation_rate)
+    else:
+        _island_state['mutation_operator'] = None
+
+    _island_state['initial_pool'] = initial_pool
+    _island_state['college_courses'] = college_courses
+    _island_state['section_index'] = section_index
+    _island_state['evaluate'] = make_evaluator(college_courses, section_index, preferences, batch_fitness)
+
+
+def _evolve_island(encoded_parents, generations, seed):
+    """
+    Evolves one island for a number of generations.
+
+    Args:
+        * encoded_parents -- the island population as returned by `encode_population()`,
+            or None to start from a new random population.
+        * generations -- number of generations to run.
+        * seed -- seed of the random generator for this island and epoch.
+
+    Returns:
+        The encoded population after evolving it, and the list of its fitness.
+    """
+    random.seed(seed)
+    section_index = _island_state['section_index']
+    mutation_operator = _island_state['mutation_operator']
+
+    if encoded_parents is None:
+        parents = populate( _island_state['initial_pool'], _island_state['college_courses'] )
+
+        if mutation_operator is not None:
+            parents = [ mutation_operator.repair(chromosome) for chromosome in parents ]
+    else:
+        sections, lengths = encoded_parents
+        parents = [ decode_chromosome(row[:length], section_index) for row, length in zip(sections, lengths) ]
+
+    parents = evolve(parents, _island_state['evaluate'], generations, mutation_operator)
+
+    return encode_population(parents), _island_state['evaluate'](parents)
+
+
+def migrate(populations: List[List], pop_fitness: List[List], migrants, topology='ring'):
+    """
+    Copies the migrants most fitted chromosomes of each island over the least fitted ones of its neighbours.
+
+    Args:
+        * populations -- the population of each island.
+        * pop_fitness -- the fitness of each island's population.
+        * migrants -- the number of chromosomes each island receives.
+        * topology -- 'ring': island i receives from island i-1,
+                      'full': each island receives the most fitted migrants among all other islands.
+
+    Modifies:
+        populations and pop_fitness, the received chromosomes replace the least fitted ones.
+    """
+    num_islands = len(populations)
+
+    # Select the emigrants before replacing anything, so that every island sends its own chromosomes
+    emigrants = []
+
+    for population, fitness_list in zip(populations, pop_fitness):
+        ranked = sorted( range(len(population)), key=lambda i: fitness_list[i], reverse=True )[:migrants]
+        emigrants.append( [ (fitness_list[i], population[i]) for i in ranked ] )
+
+    for island in range(num_islands):
+
+        if topology == 'ring':
+            arriving = emigrants[ (island - 1) % num_islands ]
+        else:
+            arriving = sorted(
+                ( m for other in range(num_islands) if other != island for m in emigrants[other] ),
+                key=lambda m: m[0], reverse=True
+            )[:migrants]
+
+        population, fitness_list = populations[island], pop_fitness[island]
+        worst = sorted( range(len(population)), key=lambda i: fitness_list[i] )[:len(arriving)]
+
+        for i, (fit, chromosome) in zip(worst, arriving):
+            population[i] = chromosome
+            fitness_list[i] = fit
+
+
+def run_islands(
+        initial_pool,
+        college_courses: Dict[str, Course],
+        section_index: SectionIndex,
+        islands=None,
+        migration_interval=5,
+        migrants=2,
+        topology='ring',
+        generations=MAX_ITERATIONS,
+        vectorized=False,
+        mutation_rate=MUTATION_RATE,
+        **kwargs
+) -> Tuple[ List[Tuple[str, Section]], int ]:
+    """
+    Runs the genetic algorithm as an island model: each island evolves its own population in a separate
+    process, and every migration_interval generations the islands exchange their most fitted chromosomes.
+
+    Args:
+        * initial_pool, college_courses, section_index, vectorized, mutation_rate -- same as in `run_ga()`.
+        * islands -- the number of islands (and processes), defaults to the number of CPUs.
+        * migration_interval -- number of generations between migrations.
+        * migrants -- number of chromosomes each island receives in a migration.
+        * topology -- one of TOPOLOGIES (see `migrate()`).
+        * generations -- total number of generations each island runs.
+        * kwargs -- the student preferences: instructor, days_off, credit_hours.
+
+    Returns:
+        The most fitted chromosome among all islands, and its fitness.
+    """
+    assert all(key in ['instructor', 'days_off', 'credit_hours'] for key in kwargs.keys()), 'Unexpected preference'
+    assert topology in TOPOLOGIES, f'Unknown topology: {topology}'
+
+    islands = islands or os.cpu_count()
+    encoded = [None] * islands
+    populations, pop_fitness = [], []
+
+    with ProcessPoolExecutor(
+        max_workers=islands,
+        initializer=_init_island_worker,
+        initargs=(initial_pool, college_courses, section_index, kwargs, vectorized, mutation_rate)
+    ) as executor:
+
+        for epoch_start in range(0, generations, migration_interval):
+            epoch_generations = min(migration_interval, generations - epoch_start)
+
+            # Seeds are drawn here, so a seeded run gives the same result for any number of CPUs
+            seeds = [ random.getrandbits(32) for _ in range(islands) ]
+            results = list( executor.map( _evolve_island, encoded, [epoch_generations] * islands, seeds ) )
+
+            populations = [
+                [ decode_chromosome(row[:length], section_index) for row, length in zip(*sections) ]
+                for sections, _ in results
+            ]
+            pop_fitness = [ fitness_list for _, fitness_list in results ]
+
+            if epoch_start + epoch_generations < generations:
+                migrate(populations, pop_fitness, migrants, topology)
+
+            encoded = [ encode_population(population) for population in populations ]
+
+    best = [ select_best(population, fitness_list) for population, fitness_list in zip(populations, pop_fitness) ]
+
+    return max( best, key=lambda result: result[1] )
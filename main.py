@@ -1,5 +1,5 @@
 from studyplan import StudyPlan, read_study_plan, read_electives
-from courses import Course, read_sections
+from courses import Course, SectionIndex, read_sections
 from genetic import run_ga
 from typing import Dict
 
@@ -62,13 +62,20 @@ def main():
     print( 'Compulsory Courses:', len( [c for semester in CE_study_plan.get_compulsory_courses().values() for c in semester] ) )
     print( 'Elective Courses:', len( [c for group in CE_study_plan.get_elective_courses().values() for c in group] ) )
 
-    college_courses = read_sections('courseBrowser_1.json', college_courses)
+    college_courses = read_sections('courseBrowser_1.json', college_courses, time_masks=True)
     print(college_courses)
 
-    best_schedule, best_schedule_fitness = run_ga(create_courses_pool(college_courses, CE_study_plan), college_courses, instructor='Mohammad Y. M. Alkhanafseh', days_off=0)
+    section_index = SectionIndex(college_courses)
+
+    best_schedule, best_schedule_fitness, generations = run_ga(
+        create_courses_pool(college_courses, CE_study_plan), college_courses,
+        section_index=section_index,
+        instructor='Mohammad Y. M. Alkhanafseh', days_off=0
+    )
     
     print('best:', best_schedule)
     print('fitness:', best_schedule_fitness)
+    print('generations:', generations)
 
     print('\n'.join( [section[1].get_instructor() for section in best_schedule] ))
 
@@ -0,0 +1,181 @@
+from typing import Dict, List, Tuple
+from courses import Course, Section, SectionIndex
+import random
+
+MUTATION_RATE = 0.1
+
+# Share of the mutations that swap the section of a course, replace the course, or drop it
+SWAP_SECTION = 0.6
+REPLACE_COURSE = 0.3
+
+# Number of random pool courses tried when looking for a replacement course
+REPLACEMENT_TRIES = 4
+
+
+class MutationOperator:
+
+    def __init__(
+            self,
+            pool: List[str],
+            college_courses: Dict[str, Course],
+            section_index: SectionIndex,
+            mutation_rate=MUTATION_RATE
+    ) -> None:
+        """
+        Mutates and repairs chromosomes, so that they have no time conflicts and no passed courses.
+        The sections of each course of the pool are indexed by their id (see `SectionIndex`), and the
+        time conflicts are checked with the packed conflict rows, so fixing a gene costs O(sections of its course).
+
+        Args:
+            * pool -- list of the course codes the student can register for.
+            * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+            * section_index -- SectionIndex of college_courses.
+            * mutation_rate -- the probability of mutating each gene.
+        """
+        self.__section_index = section_index
+        self.__mutation_rate = mutation_rate
+
+        self.__pool = [
+            course_code for course_code in pool
+            if college_courses[course_code].get_sections() and not college_courses[course_code].is_passed()
+        ]
+        self.__course_sections: Dict[str, List[int]] = {
+            course_code: [ section.get_id() for section in college_courses[course_code].get_sections() ]
+            for course_code in self.__pool
+        }
+        self.__passed = { course_code for course_code in pool if college_courses[course_code].is_passed() }
+
+
+    def get_mutation_rate(self):
+        return self.__mutation_rate
+
+
+    def __pick_section(self, course_code, occupied, exclude=-1):
+        """
+        Returns a random section of the course that does not conflict with the occupied sections, or None.
+        """
+        candidates = [
+            section_id for section_id in self.__course_sections.get(course_code, ())
+            if section_id != exclude and not occupied >> section_id & 1
+        ]
+
+        return random.choice(candidates) if candidates else None
+
+
+    def __pick_replacement(self, excluded, occupied):
+        """
+        Returns a section of a random pool course, not in excluded, that does not conflict with the occupied sections, or None.
+        """
+        for _ in range(REPLACEMENT_TRIES):
+            course_code = random.choice(self.__pool)
+
+            if course_code not in excluded and (section_id := self.__pick_section(course_code, occupied)) is not None:
+                return section_id
+
+        return None
+
+
+    def repair_ids(self, section_ids: List[int]) -> List[int]:
+        """
+        Repairs a chromosome given as section ids: each gene conflicting with the genes before it, or whose section
+        was removed (see `SectionIndex.remove_sections()`), gets a non-conflicting section of the same course,
+        or else is replaced by another course of the pool, or else is dropped. Passed and duplicate courses are dropped.
+
+        Returns:
+            the section ids of the repaired chromosome, in the same order.
+        """
+        get_course_code = self.__section_index.get_course_code
+        get_conflict_row = self.__section_index.get_conflict_row
+        removed = self.__section_index.get_removed()
+
+        excluded = { get_course_code(section_id) for section_id in section_ids }
+        courses = set()
+        occupied = 0 # the sections that conflict with the kept genes
+        repaired = []
+
+        for section_id in section_ids:
+            course_code = get_course_code(section_id)
+
+            if course_code in courses or course_code in self.__passed:
+                continue
+
+            if occupied >> section_id & 1 or section_id in removed:
+                section_id = self.__pick_section(course_code, occupied)
+
+                if section_id is None:
+                    section_id = self.__pick_replacement(excluded, occupied) if self.__pool else None
+
+                    if section_id is None:
+                        continue
+
+                    course_code = get_course_code(section_id)
+                    excluded.add(course_code)
+
+            repaired.append(section_id)
+            courses.add(course_code)
+            occupied |= get_conflict_row(section_id)
+
+        return repaired
+
+
+    def mutate_ids(self, section_ids: List[int]) -> List[int]:
+        """
+        Mutates each gene of a chromosome given as section ids with probability mutation_rate:
+        its section is swapped for another section of the same course, or its course is replaced by
+        another course of the pool, or dropped. The chromosome is then repaired (see `repair_ids()`).
+        """
+        get_course_code = self.__section_index.get_course_code
+
+        mutated = []
+        excluded = None
+
+        for section_id in section_ids:
+
+            if random.random() >= self.__mutation_rate:
+                mutated.append(section_id)
+                continue
+
+            action = random.random()
+
+            if action < SWAP_SECTION:
+                new_section_id = self.__pick_section( get_course_code(section_id), 0, exclude=section_id )
+                mutated.append( section_id if new_section_id is None else new_section_id )
+
+            elif action < SWAP_SECTION + REPLACE_COURSE:
+                if excluded is None:
+                    excluded = { get_course_code(gene) for gene in section_ids }
+
+                new_section_id = self.__pick_replacement(excluded, 0) if self.__pool else None
+
+                if new_section_id is None:
+                    mutated.append(section_id)
+                else:
+                    excluded.add( get_course_code(new_section_id) )
+                    mutated.append(new_section_id)
+
+        return self.repair_ids(mutated)
+
+
+    def __to_ids(self, chromosome: List[ Tuple[str, Section] ]) -> List[int]:
+        return [ gene[1].get_id() for gene in chromosome ]
+
+
+    def __to_genes(self, section_ids: List[int]) -> List[ Tuple[str, Section] ]:
+        return [
+            ( self.__section_index.get_course_code(section_id), self.__section_index.get_section(section_id) )
+            for section_id in section_ids
+        ]
+
+
+    def repair(self, chromosome: List[ Tuple[str, Section] ]) -> List[ Tuple[str, Section] ]:
+        """
+        Same as `repair_ids()`, for a chromosome given as a list of genes `("course_code", Section object)`.
+        """
+        return self.__to_genes( self.repair_ids( self.__to_ids(chromosome) ) )
+
+
+    def mutate(self, chromosome: List[ Tuple[str, Section] ]) -> List[ Tuple[str, Section] ]:
+        """
+        Same as `mutate_ids()`, for a chromosome given as a list of genes `("course_code", Section object)`.
+        """
+        return self.__to_genes( self.mutate_ids( self.__to_ids(chromosome) ) )
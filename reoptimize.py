@@ -0,0 +1,125 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from courses import Course, Section, SectionIndex
+from mutation import MUTATION_RATE, MutationOperator
+from archive import EliteArchive
+from genetic import run_ga
+
+# Generations run after patching the previous population
+RESUME_GENERATIONS = 5
+
+
+def apply_section_delta(
+        college_courses: Dict[str, Course],
+        section_index: SectionIndex,
+        added: Dict[str, List[Section]]=None,
+        removed: Iterable[Section]=()
+) -> Set[int]:
+    """
+    Adds and removes sections of the courses during the registration, and updates the section_index incrementally
+    (see `SectionIndex.add_sections()` and `SectionIndex.remove_sections()`).
+    It is the one place where the sections change: it is applied once per change, to the shared courses
+    (i.e. `Catalog.get_courses()`, never a student's `StudentCourses`), then each affected student is re-planned
+    with `reoptimize()`. Applying the same delta again changes nothing.
+
+    Args:
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * section_index -- SectionIndex of college_courses.
+        * added -- (optional) dictionary of the new sections, with course_code as key. Sections that already
+            have an id are already indexed, and are skipped.
+        * removed -- (optional) the sections to remove, indexed by section_index.
+
+    Returns:
+        the ids of the removed sections.
+    """
+    removed_ids = { section.get_id() for section in removed }
+    added = {
+        course_code: [ section for section in sections if section.get_id() is None ]
+        for course_code, sections in (added or {}).items()
+    }
+    changed_courses = { section_index.get_course_code(section_id) for section_id in removed_ids } | set(added)
+
+    for course_code, sections in added.items():
+        section_index.add_sections(course_code, sections)
+
+    section_index.remove_sections(removed_ids)
+
+    # Keeps the container type of the sections, the catalog freezes them in tuples
+    for course_code in changed_courses:
+        course = college_courses[course_code]
+        sections = course.get_sections()
+
+        course.set_sections( type(sections)(
+            [ section for section in sections if section.get_id() not in removed_ids ] + added.get(course_code, [])
+        ) )
+
+    return removed_ids
+
+
+def patch_population(
+        population: List[ List[Tuple[str, Section]] ],
+        mutation_operator: MutationOperator,
+        removed_ids: Set[int]
+) -> Tuple[ List[ List[Tuple[str, Section]] ], int ]:
+    """
+    Repairs the chromosomes that have a removed section (see `MutationOperator.repair()`), the others are kept as they are.
+
+    Returns:
+        the patched population, and the number of patched chromosomes.
+    """
+    patched = []
+    count = 0
+
+    for chromosome in population:
+
+        if any( section.get_id() in removed_ids for _, section in chromosome ):
+            chromosome = mutation_operator.repair(chromosome)
+            count += 1
+
+        patched.append(chromosome)
+
+    return patched, count
+
+
+def reoptimize(
+        previous,
+        initial_pool,
+        college_courses: Dict[str, Course],
+        section_index: SectionIndex,
+        removed_ids: Set[int],
+        generations=RESUME_GENERATIONS,
+        mutation_rate=MUTATION_RATE,
+        **kwargs
+) -> Tuple[ List[Tuple[str, Section]], int, int ]:
+    """
+    Re-plans a student's schedule after sections were added or removed (see `apply_section_delta()`),
+    starting from a previous run instead of a random population: the chromosomes with a removed section
+    are patched, and the genetic algorithm resumes for a few generations. Nothing shared is modified,
+    so all the affected students can be re-planned after a single `apply_section_delta()`.
+
+    Args:
+        * previous -- the EliteArchive of the previous run, or a list of its chromosomes.
+        * initial_pool -- list of the course codes the student can register for.
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * section_index -- SectionIndex of college_courses, after the delta was applied.
+        * removed_ids -- the ids of the removed sections, as returned by `apply_section_delta()`.
+        * generations -- number of generations to resume for.
+        * mutation_rate -- the probability of mutating each gene of the offsprings.
+        * kwargs -- the other `run_ga()` options and the student preferences.
+
+    Returns:
+        The most fitted chromosome, its fitness, and the number of generations run.
+    """
+    if isinstance(previous, EliteArchive):
+        previous = [ chromosome for chromosome, _ in previous.get_schedules() ]
+
+    mutation_operator = MutationOperator(initial_pool, college_courses, section_index, mutation_rate)
+    population, _ = patch_population(previous, mutation_operator, removed_ids)
+
+    return run_ga(
+        initial_pool, college_courses,
+        section_index=section_index,
+        mutation_rate=mutation_rate,
+        max_generations=generations,
+        initial_population=population,
+        **kwargs
+    )
@@ -0,0 +1,175 @@
+from typing import Dict, List
+import hashlib
+import sqlite3
+import json
+import time
+
+RESULT_CACHE_VERSION = 2
+
+
+def make_result_key(
+        browser_version,
+        student_year,
+        student_semester,
+        pool: List[str],
+        passed: List[str],
+        preferences: Dict,
+        seed,
+        options: Dict=None
+) -> str:
+    """
+    Returns the key of a schedule request: a hash of the course browser version, the student's year and semester
+    (the course priorities depend on them), the pool of available courses (see `create_courses_pool()`),
+    the passed courses of the pool (a passed course stays in the pool when its prerequisites are met,
+    but scores 0), the preferences, the seed and the other `run_ga()` options.
+    """
+    fingerprint = json.dumps(
+        [
+            RESULT_CACHE_VERSION, browser_version, str(student_year), str(student_semester),
+            sorted(pool), sorted(passed), preferences, seed, options or {}
+        ],
+        sort_keys=True
+    )
+
+    return hashlib.sha256( fingerprint.encode() ).hexdigest()
+
+
+class ResultCache:
+
+    def __init__(self, filename, ttl=None, max_entries=None) -> None:
+        """
+        Persistent cache of schedule results in a SQLite file, shared by processes opening the same file.
+
+        Args:
+            * filename -- the SQLite file, created if it does not exist.
+            * ttl -- (optional) seconds after which a result expires.
+            * max_entries -- (optional) maximum number of results, the least recently used ones are evicted.
+
+        All the results belong to one course browser version: results of any other version are deleted
+        when a newer browser is used (see `set_browser_version()`).
+        """
+        self.__ttl = ttl
+        self.__max_entries = max_entries
+        self.__hits = 0
+        self.__misses = 0
+
+        self.__connection = sqlite3.connect(filename, timeout=30, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute('PRAGMA synchronous=NORMAL')
+        self.__connection.executescript('''
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+        ''')
+        self.__browser_version = self.__get_metadata('browser_version')
+
+
+    def __get_metadata(self, name):
+        row = self.__connection.execute('SELECT value FROM metadata WHERE name = ?', (name,)).fetchone()
+
+        return row[0] if row else None
+
+
+    def get_browser_version(self):
+        return self.__browser_version
+
+
+    def set_browser_version(self, version):
+        """
+        Sets the version of the course browser the results are computed from (see `browser_version()`).
+        When it changed, every cached result is deleted.
+        """
+        if version == self.__browser_version:
+            return
+
+        with self.__connection:
+            self.__connection.execute('BEGIN IMMEDIATE')
+
+            # Another process may have already moved to this version
+            if self.__get_metadata('browser_version') != version:
+                self.__connection.execute('DELETE FROM results')
+                self.__connection.execute(
+                    'INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)', ('browser_version', version)
+                )
+
+        self.__browser_version = version
+
+
+    def get(self, key) -> Dict:
+        """
+        Returns the cached result of the key, or None if it is not cached or expired.
+        """
+        now = time.time()
+        row = self.__connection.execute('SELECT result, created FROM results WHERE key = ?', (key,)).fetchone()
+
+        if row is None or ( self.__ttl is not None and now - row[1] > self.__ttl ):
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+
+        # The access time is only used by the size eviction
+        if self.__max_entries is not None:
+            self.__connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+
+        return json.loads(row[0])
+
+
+    def put(self, key, result: Dict):
+        """
+        Caches a result, evicting the expired results and the least recently used ones above max_entries.
+        """
+        now = time.time()
+
+        with self.__connection:
+            self.__connection.execute('BEGIN IMMEDIATE')
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO results (key, result, created, accessed) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(result), now, now)
+            )
+
+            if self.__ttl is not None:
+                self.__connection.execute('DELETE FROM results WHERE created < ?', (now - self.__ttl,))
+
+            if self.__max_entries is not None:
+                self.__connection.execute(
+                    'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                    (self.__max_entries,)
+                )
+
+
+    def clear(self):
+        self.__connection.execute('DELETE FROM results')
+
+
+    def get_hits(self):
+        return self.__hits
+
+
+    def get_misses(self):
+        return self.__misses
+
+
+    def __len__(self):
+        return self.__connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+
+    def close(self):
+        self.__connection.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __repr__(self) -> str:
+        return f'ResultCache(entries={len(self)}, hits={self.__hits}, misses={self.__misses})'
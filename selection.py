@@ -0,0 +1,137 @@
+from typing import List
+import numpy as np
+import random
+
+SELECTION_METHODS = ['roulette', 'sus', 'tournament']
+
+
+def make_rng() -> np.random.Generator:
+    """
+    Returns a NumPy generator seeded from the `random` module, so `random.seed()` makes the selection reproducible.
+    """
+    return np.random.default_rng( random.getrandbits(64) )
+
+
+def _selection_wheel(pop_fitness: np.ndarray) -> np.ndarray:
+    """
+    Returns the cumulative selection probabilities of the chromosomes.
+    Negative fitness counts as 0, and when no chromosome has a positive fitness they are all equally likely.
+    """
+    weights = np.maximum( np.asarray(pop_fitness, dtype=np.float64), 0 )
+    total = weights.sum()
+
+    if total <= 0:
+        weights = np.ones_like(weights)
+        total = len(weights)
+
+    wheel = np.cumsum(weights / total)
+    wheel[-1] = 1.0 # no spin can fall past the last chromosome because of rounding
+
+    return wheel
+
+
+def roulette_wheel(pop_fitness: np.ndarray, size, rng: np.random.Generator=None) -> np.ndarray:
+    """
+    Spins the roulette wheel size times, each chromosome is selected with probability proportional to its fitness.
+
+    Returns:
+        the indices of the selected chromosomes.
+    """
+    rng = rng or make_rng()
+
+    return np.searchsorted( _selection_wheel(pop_fitness), rng.random(size), side='right' )
+
+
+def stochastic_universal_sampling(pop_fitness: np.ndarray, size, rng: np.random.Generator=None) -> np.ndarray:
+    """
+    Same expected selection as `roulette_wheel()`, with size evenly spaced pointers from a single spin,
+    so a chromosome is selected within one of its expected number of times.
+    """
+    rng = rng or make_rng()
+    pointers = ( rng.random() + np.arange(size) ) / size
+
+    return np.searchsorted( _selection_wheel(pop_fitness), pointers, side='right' )
+
+
+def tournament(pop_fitness: np.ndarray, size, tournament_size=2, rng: np.random.Generator=None) -> np.ndarray:
+    """
+    Selects the most fitted chromosome of each of size random groups of tournament_size chromosomes.
+    """
+    rng = rng or make_rng()
+    pop_fitness = np.asarray(pop_fitness)
+
+    contestants = rng.integers( 0, len(pop_fitness), (size, tournament_size) )
+    winners = np.argmax( pop_fitness[contestants], axis=1 )
+
+    return contestants[ np.arange(size), winners ]
+
+
+def elite(pop_fitness: np.ndarray, size) -> np.ndarray:
+    """
+    Returns the indices of the size most fitted chromosomes, most fitted first.
+    """
+    pop_fitness = np.asarray(pop_fitness)
+    size = min(size, len(pop_fitness))
+
+    if size <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    top = np.argpartition(-pop_fitness, size - 1)[:size]
+
+    return top[ np.argsort(-pop_fitness[top], kind='stable') ]
+
+
+class Selection:
+
+    def __init__(self, method='roulette', elites=0, tournament_size=2) -> None:
+        """
+        Selects the parents of the next generation.
+
+        Args:
+            * method -- one of SELECTION_METHODS: 'roulette' (see `roulette_wheel()`),
+                'sus' (see `stochastic_universal_sampling()`) or 'tournament' (see `tournament()`).
+            * elites -- number of most fitted chromosomes always kept, the others are selected by method.
+            * tournament_size -- number of chromosomes in each tournament.
+        """
+        assert method in SELECTION_METHODS, f'Unknown selection method: {method}'
+
+        self.__method = method
+        self.__elites = elites
+        self.__tournament_size = tournament_size
+
+
+    def get_method(self):
+        return self.__method
+
+
+    def get_elites(self):
+        return self.__elites
+
+
+    def select(self, pop_fitness: np.ndarray, size) -> np.ndarray:
+        """
+        Returns the indices of the size selected chromosomes.
+        """
+        rng = make_rng()
+        elites = elite( pop_fitness, min(self.__elites, size) )
+        remaining = size - len(elites)
+
+        if self.__method == 'roulette':
+            selected = roulette_wheel(pop_fitness, remaining, rng)
+        elif self.__method == 'sus':
+            selected = stochastic_universal_sampling(pop_fitness, remaining, rng)
+        else:
+            selected = tournament(pop_fitness, remaining, self.__tournament_size, rng)
+
+        return np.concatenate( (elites, selected) ) if len(elites) else selected
+
+
+    def select_population(self, population: List, pop_fitness, size) -> List:
+        """
+        Same as `select()`, returns the selected chromosomes.
+        """
+        return [ population[i] for i in self.select( np.asarray(pop_fitness), size ).tolist() ]
+
+
+    def __repr__(self) -> str:
+        return f'Selection(method={self.__method!r}, elites={self.__elites}, tournament_size={self.__tournament_size})'
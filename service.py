@@ -0,0 +1,237 @@
+from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from catalog import read_catalog
+from catalog_cache import load_or_compile_catalog
+from batch import _init_batch_worker, _schedule_student_worker, check_worker_options
+import argparse
+import asyncio
+import json
+import time
+import sys
+import os
+
+
+def request_key(request: Dict) -> str:
+    """
+    Returns a canonical key of a schedule request, equal for requests that only differ by their id
+    or by the order of their records.
+    """
+    fields = { key: value for key, value in request.items() if key != 'id' }
+    fields['records'] = sorted( fields.get('records', []) )
+
+    return json.dumps(fields, sort_keys=True)
+
+
+class ScheduleService:
+
+    def __init__(self, catalog, workers=None, max_pending=None, ga_options: Dict=None, result_cache_options: Dict=None) -> None:
+        """
+        Schedules student requests (see `batch.schedule_student()`) on a pool of worker processes that keep
+        the catalog loaded, for a long-running server (see `serve()`).
+
+        At most max_pending requests are in flight: a connection is not read any further while they are,
+        so a burst of requests waits in the socket buffers instead of in memory. Identical requests in flight
+        at the same time (see `request_key()`) are computed once, and each one gets the result with its own id.
+
+        Args:
+            * catalog -- the shared Catalog (see `read_catalog()`), or the name of a compiled catalog file.
+            * workers -- number of worker processes, defaults to the number of CPUs.
+            * max_pending -- maximum number of requests in flight, defaults to 4 per worker.
+            * ga_options -- (optional) dict of `run_ga()` options used for every request, without workers
+                (see `batch.check_worker_options()`).
+            * result_cache_options -- (optional) dict of ResultCache arguments (filename, ttl, max_entries),
+            each worker opens the same cache file.
+        """
+        check_worker_options(ga_options)
+
+        self.__workers = workers or os.cpu_count()
+        self.__max_pending = max_pending or 4 * self.__workers
+        self.__executor = ProcessPoolExecutor(
+            max_workers=self.__workers, initializer=_init_batch_worker, initargs=(catalog, ga_options, result_cache_options)
+        )
+
+        # Starts the workers now, so they load the catalog before the first request. Forked later,
+        # they would also inherit the open connections, which then would not close with the server's end.
+        self.__executor.submit(os.getpid).result()
+        self.__slots = None # created in the event loop, see `__get_slots()`
+        self.__in_flight: Dict[str, asyncio.Future] = {}
+        self.__requests = 0
+        self.__computed = 0
+        self.__coalesced = 0
+
+
+    def __get_slots(self) -> asyncio.Semaphore:
+        if self.__slots is None:
+            self.__slots = asyncio.Semaphore(self.__max_pending)
+
+        return self.__slots
+
+
+    async def schedule(self, request: Dict) -> Dict:
+        """
+        Returns the result of a request, computed in a worker process or shared with an identical request in flight.
+        """
+        self.__requests += 1
+        key = request_key(request)
+
+        if (future := self.__in_flight.get(key)) is not None:
+            self.__coalesced += 1
+        else:
+            self.__computed += 1
+            future = asyncio.get_running_loop().run_in_executor(self.__executor, _schedule_student_worker, request)
+            self.__in_flight[key] = future
+            future.add_done_callback( lambda _: self.__in_flight.pop(key, None) )
+
+        result = dict( await asyncio.shield(future) )
+        result['id'] = request.get('id')
+
+        return result
+
+
+    async def __handle_line(self, line: bytes) -> Dict:
+        """
+        Returns the result of one request line, or an error result: a failing request never leaves its client
+        without a reply.
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return { 'error': f'JSONDecodeError: {e}' }
+
+        if request == 'stats':
+            return self.get_stats()
+
+        if not isinstance(request, dict):
+            return { 'error': f'Expected a JSON object, got {type(request).__name__}' }
+
+        try:
+            return await self.schedule(request)
+        except Exception as e:
+            return { 'id': request.get('id'), 'error': f'{type(e).__name__}: {e}' }
+
+
+    async def __respond(self, line: bytes, writer: asyncio.StreamWriter, slots: asyncio.Semaphore):
+        try:
+            result = await self.__handle_line(line)
+
+            writer.write( json.dumps(result).encode() + b'\n' )
+            await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            slots.release()
+
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Reads JSON requests from a connection, one per line, and writes each result as a JSON line as soon
+        as it is ready, so the results may not be in the order of the requests (they carry the request id).
+        The JSON string "stats" returns the counters of the service (see `get_stats()`).
+        """
+        slots = self.__get_slots()
+        tasks = set()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+
+                # Backpressure: the connection is not read while max_pending requests are in flight
+                await slots.acquire()
+
+                task = asyncio.create_task( self.__respond(line, writer, slots) )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+
+        finally:
+            writer.close()
+
+
+    def get_stats(self) -> Dict:
+        return {
+            'requests': self.__requests,
+            'computed': self.__computed,
+            'coalesced': self.__coalesced,
+            'in_flight': len(self.__in_flight),
+            'workers': self.__workers,
+            'max_pending': self.__max_pending,
+        }
+
+
+    def close(self):
+        self.__executor.shutdown()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+async def serve(service: ScheduleService, host='127.0.0.1', port=8765, unix_path=None):
+    """
+    Serves the requests on a TCP port, or on a Unix socket when unix_path is given, until cancelled.
+    """
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix_path)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Schedule students as a service (JSON lines over TCP or a Unix socket).')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help='path of a Unix socket to listen on, instead of TCP')
+    parser.add_argument('--study-plan', default='CEStudyPlan.txt')
+    parser.add_argument('--electives', default='Electives.txt')
+    parser.add_argument('--browser', default='courseBrowser_1.json')
+    parser.add_argument('--cache', default=None, help='compiled catalog file, created or refreshed if stale')
+    parser.add_argument(
+        '--critical-path-priority', action='store_true',
+        help='prioritize the courses by all the courses that depend on them, directly or not'
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-pending', type=int, default=None)
+    parser.add_argument('--time-budget', type=float, default=None, help='GA wall-clock budget per student, in seconds')
+    parser.add_argument('--result-cache', default=None, help='SQLite file caching the results across runs')
+    parser.add_argument('--result-ttl', type=float, default=None, help='seconds after which a cached result expires')
+    parser.add_argument('--result-max-entries', type=int, default=None)
+    args = parser.parse_args()
+
+    result_cache_options = None
+
+    if args.result_cache:
+        result_cache_options = { 'filename': args.result_cache, 'ttl': args.result_ttl, 'max_entries': args.result_max_entries }
+
+    start = time.perf_counter()
+
+    if args.cache:
+        load_or_compile_catalog(
+            args.cache, args.study_plan, args.electives, args.browser, critical_path_priority=args.critical_path_priority
+        )
+        catalog = args.cache
+    else:
+        catalog = read_catalog(args.study_plan, args.electives, args.browser, critical_path_priority=args.critical_path_priority)
+
+    with ScheduleService(catalog, args.workers, args.max_pending, { 'time_budget': args.time_budget }, result_cache_options) as service:
+        print(f'catalog loaded in {(time.perf_counter() - start) * 1000:.1f} ms', file=sys.stderr)
+
+        try:
+            asyncio.run( serve(service, args.host, args.port, args.unix) )
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
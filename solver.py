@@ -0,0 +1,53 @@
+from typing import Dict, List, Tuple
+from courses import Course, Section, SectionIndex
+from genetic import run_ga
+from exact import NODE_LIMIT, TIME_LIMIT, BranchAndBound, SearchLimitReached
+
+ENGINES = ['ga', 'exact']
+
+PREFERENCES = ['instructor', 'days_off', 'credit_hours']
+
+
+def solve(
+        initial_pool,
+        college_courses: Dict[str, Course],
+        section_index: SectionIndex,
+        engine='ga',
+        node_limit=NODE_LIMIT,
+        time_limit=TIME_LIMIT,
+        **kwargs
+) -> Tuple[ List[Tuple[str, Section]], int, str ]:
+    """
+    Finds the best schedule with one of the ENGINES:
+        - 'ga': the genetic algorithm (see `run_ga()`).
+        - 'exact': the branch and bound search (see `BranchAndBound`), falls back to the genetic algorithm
+            when it reaches node_limit or time_limit.
+
+    Args:
+        * initial_pool -- list of the course codes the student can register for.
+        * college_courses -- dictionary of courses, with course_code as key, and Course object as value.
+        * section_index -- SectionIndex of college_courses.
+        * engine -- one of ENGINES.
+        * node_limit, time_limit -- the limits of the exact search.
+        * kwargs -- the student preferences (instructor, days_off, credit_hours), and the other `run_ga()` options.
+
+    Returns:
+        The best schedule, its fitness, and the engine that found it.
+    """
+    assert engine in ENGINES, f'Unknown engine: {engine}'
+
+    if engine == 'exact':
+        preferences = { key: value for key, value in kwargs.items() if key in PREFERENCES }
+
+        try:
+            return (
+                *BranchAndBound(initial_pool, college_courses, section_index, preferences, node_limit=node_limit, time_limit=time_limit).solve(),
+                'exact'
+            )
+
+        except SearchLimitReached:
+            pass
+
+    best_schedule, best_fitness, _ = run_ga(initial_pool, college_courses, section_index=section_index, **kwargs)
+
+    return best_schedule, best_fitness, 'ga'
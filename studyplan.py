@@ -3,6 +3,112 @@ from courses import calculate_prerequisites_priority
 from typing import Dict, List, Tuple
 
 
+class PrerequisiteGraph:
+
+    def __init__(self) -> None:
+        """
+        DAG of the prerequisites, every course code gets a dense integer id.
+        Stores both the forward edges (the prerequisites of a course) and the reverse edges
+        (the courses a course is a prerequisite for).
+        """
+        self.__ids: Dict[str, int] = {}
+        self.__codes: List[str] = []
+        self.__prerequisites: List[List[int]] = []
+        self.__dependents: List[List[int]] = []
+
+
+    def __len__(self):
+        return len(self.__codes)
+
+
+    def __contains__(self, course_code):
+        return course_code in self.__ids
+
+
+    def __add_node(self, course_code) -> int:
+        if (course_id := self.__ids.get(course_code)) is None:
+            course_id = self.__ids[course_code] = len(self.__codes)
+            self.__codes.append(course_code)
+            self.__prerequisites.append([])
+            self.__dependents.append([])
+
+        return course_id
+
+
+    def add_course(self, course_code, prerequisites) -> int:
+        """
+        Adds a course and the edges from its prerequisites, prerequisites that are not added yet get an id too.
+
+        Returns:
+            course_id -- the id of the course.
+        """
+        course_id = self.__add_node(course_code)
+
+        for prerequisite in prerequisites:
+            prerequisite_id = self.__add_node(prerequisite)
+
+            if prerequisite_id not in self.__prerequisites[course_id]:
+                self.__prerequisites[course_id].append(prerequisite_id)
+                self.__dependents[prerequisite_id].append(course_id)
+
+        return course_id
+
+
+    def get_id(self, course_code) -> int:
+        return self.__ids.get(course_code)
+
+
+    def get_code(self, course_id) -> str:
+        return self.__codes[course_id]
+
+
+    def get_prerequisites(self, course_id) -> List[int]:
+        return self.__prerequisites[course_id]
+
+
+    def get_dependents(self, course_id) -> List[int]:
+        return self.__dependents[course_id]
+
+
+    def count_prerequisites(self) -> List[int]:
+        """
+        Returns the number of prerequisites of each course, indexed by course id.
+        """
+        return [ len(prerequisites) for prerequisites in self.__prerequisites ]
+
+
+    def count_transitive_dependents(self) -> List[int]:
+        """
+        Counts, for each course, all the courses that directly or indirectly require it (critical-path priority).
+        Computed with a single topological pass, the dependents of each course are kept as a bitset of ids.
+
+        Returns:
+            counts -- the number of transitive dependents of each course, indexed by course id.
+        """
+        remaining = self.count_prerequisites()
+        order = [ course_id for course_id, count in enumerate(remaining) if count == 0 ]
+
+        # Kahn's algorithm, order ends up in topological order
+        for course_id in order:
+            for dependent in self.__dependents[course_id]:
+                remaining[dependent] -= 1
+
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+
+        if len(order) != len(self.__codes):
+            raise ValueError('The prerequisites graph has a cycle')
+
+        descendants = [0] * len(self.__codes)
+
+        # Reverse topological order, the dependents of a course are done before the course
+        for course_id in reversed(order):
+            for dependent in self.__dependents[course_id]:
+                descendants[course_id] |= (1 << dependent) | descendants[dependent]
+
+        return [ bits.bit_count() for bits in descendants ]
+
+
 class StudyPlan:
 
     def __init__(self, name=None, total_hours=0) -> None:
@@ -10,6 +116,7 @@ class StudyPlan:
         self.__total_credit_hours = total_hours
         self.__compulsory_courses: Dict[str, List] = {}
         self.__elective_courses: Dict[str, List] = {}
+        self.__prerequisite_graph = PrerequisiteGraph()
 
 
     def get_name(self):
@@ -36,6 +143,10 @@ class StudyPlan:
         return self.__elective_courses
 
 
+    def get_prerequisite_graph(self) -> PrerequisiteGraph:
+        return self.__prerequisite_graph
+
+
     def __repr__(self) -> str:
         return f'Name: {self.__name} | Total Hours: {self.__total_credit_hours} \
             \nCourses: {self.__compulsory_courses}\nElectives {self.__elective_courses}'
@@ -60,6 +171,7 @@ def read_study_plan(
                     The total credit hours.
                     A dictionary of list of courses representing each semester and the courses associated with the study plan,
                         ordered with respect to year and semester.
+                    The prerequisite graph of the courses (see PrerequisiteGraph).
         * college_courses --  dictionary that has the course_code as the key, and the value as an object of type Course.
     """
     study_plan = StudyPlan(name=spec_name, total_hours=total_hours)
@@ -81,6 +193,7 @@ def read_study_plan(
 
         # add the course to the corresponding semester in the study plan
         study_plan.get_compulsory_courses()[ str(year) + "-" + str(sem) ].append(course_code)
+        study_plan.get_prerequisite_graph().add_course(course_code, prereq)
 
         if (len(course_code) > 5) and (course_code not in ['ENCS53xx', 'ENCS51xx']):
             credit_hours = int(course_code[5])
@@ -151,6 +264,7 @@ def read_electives(
 
         # add the course to the corresponding group in the elective courses
         study_plan.get_elective_courses()[ group ].append(course_code)
+        study_plan.get_prerequisite_graph().add_course(course_code, prereq)
 
         calculate_prerequisites_priority( college_courses, prereq )
 
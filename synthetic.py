@@ -0,0 +1,212 @@
+from typing import List, Tuple
+import random
+import json
+
+# Day patterns and time slots used by the generated sections
+DAY_PATTERNS = [ ('S', 'M', 'W'), ('T', 'R'), ('M', 'W'), ('S',), ('M',), ('T',), ('W',), ('R',) ]
+TIME_SLOTS = [
+    '08:00 - 08:50', '08:30 - 09:45', '10:00 - 11:15', '11:25 - 12:40',
+    '12:50 - 14:05', '14:15 - 15:30', '15:40 - 16:55', '11:25 - 14:05', '14:15 - 16:55'
+]
+
+# Credit hours of the generated courses, the 6th character of a course code (see `read_study_plan()`)
+CREDIT_HOURS = [1, 3, 3, 3, 3, 4]
+
+PASSING_MARK = 60
+
+
+def _course_code(department, year, credit_hours, number):
+    return f'D{department:03}{year}{credit_hours}{number:02}'
+
+
+def generate_study_plan(
+        filename,
+        num_courses=60,
+        years=5,
+        max_prerequisites=2,
+        seed=0
+) -> List[ Tuple[str, str, str] ]:
+    """
+    Writes a synthetic study plan (same format as `CEStudyPlan.txt`), with the courses spread over
+    the semesters of the given number of years, and prerequisites taken from the earlier semesters.
+
+    Args:
+        * filename -- name of the file to write.
+        * num_courses -- the number of compulsory courses.
+        * years -- the number of years of the plan, each with 2 semesters.
+        * max_prerequisites -- the maximum number of prerequisites of a course.
+        * seed -- seed of the random generator, the same seed always writes the same file.
+
+    Returns:
+        plan -- a list of (year, semester, course_code), in the order of the file.
+    """
+    rng = random.Random(seed)
+    plan = []
+    earlier = [] # the courses of the previous semesters
+    semesters = [ (year, semester) for year in range(1, years + 1) for semester in (1, 2) ]
+
+    with open(filename, 'w') as f:
+        f.write('Year,Seamster,CourseCode,Prerequisites\n')
+
+        for i in range(num_courses):
+            year, semester = semesters[ i * len(semesters) // num_courses ]
+
+            # the courses of a new semester can depend on all the courses before it
+            if plan and (year, semester) != tuple( map(int, plan[-1][:2]) ):
+                earlier = [ course_code for _, _, course_code in plan ]
+
+            course_code = _course_code( i // 100, year % 10, rng.choice(CREDIT_HOURS), i % 100 )
+            prerequisites = rng.sample( earlier, min( len(earlier), rng.randint(0, max_prerequisites) ) )
+
+            f.write( ','.join( [str(year), str(semester), course_code] + prerequisites ) + '\n' )
+            plan.append( (str(year), str(semester), course_code) )
+
+    return plan
+
+
+def generate_electives(
+        filename,
+        plan: List[ Tuple[str, str, str] ],
+        num_electives=20,
+        groups=4,
+        max_prerequisites=2,
+        seed=0
+) -> List[str]:
+    """
+    Writes synthetic elective courses (same format as `Electives.txt`), in groups 0 to groups - 1,
+    with prerequisites taken from the compulsory courses of the plan.
+
+    Returns:
+        the course codes of the electives.
+    """
+    rng = random.Random(seed)
+    compulsory = [ course_code for _, _, course_code in plan ]
+    electives = []
+
+    with open(filename, 'w') as f:
+        f.write('Group,CourseCode,Prerequisites\n')
+
+        for i in range(num_electives):
+            # departments after the ones of the compulsory courses, so the codes never collide
+            course_code = _course_code( 900 + i // 100, 5, rng.choice(CREDIT_HOURS), i % 100 )
+            prerequisites = rng.sample( compulsory, min( len(compulsory), rng.randint(0, max_prerequisites) ) )
+
+            f.write( ','.join( [str( i % groups ), course_code] + prerequisites ) + '\n' )
+            electives.append(course_code)
+
+    return electives
+
+
+def generate_records(
+        plan: List[ Tuple[str, str, str] ],
+        student_year,
+        student_semester,
+        fail_rate=0.1,
+        rng: random.Random=None
+) -> List[str]:
+    """
+    Returns synthetic record lines (`course_code=mark`, same format as `studentRecords.txt`) of a student
+    who took all the courses of the plan before the given year and semester, failing some of them.
+    """
+    rng = rng or random.Random(0)
+    student = ( int(student_year), int(student_semester) )
+    records = []
+
+    for year, semester, course_code in plan:
+
+        if ( int(year), int(semester) ) < student:
+            mark = rng.randint(35, PASSING_MARK - 1) if rng.random() < fail_rate else rng.randint(PASSING_MARK, 99)
+            records.append( f'{course_code}={mark}' )
+
+    return records
+
+
+def generate_student_records(filename, plan: List[ Tuple[str, str, str] ], student_year, student_semester, fail_rate=0.1, seed=0):
+    """
+    Writes the records file of a synthetic student (see `generate_records()`).
+
+    Returns:
+        the number of records written.
+    """
+    records = generate_records( plan, student_year, student_semester, fail_rate, random.Random(seed) )
+
+    with open(filename, 'w') as f:
+        f.write( '\n'.join(records) )
+
+    return len(records)
+
+
+def generate_student_requests(
+        filename,
+        plan: List[ Tuple[str, str, str] ],
+        num_students=100,
+        fail_rate=0.1,
+        seed=0
+):
+    """
+    Writes a JSONL file of synthetic student requests for `batch.py`, each one in a random year and semester
+    of the plan, with its records and preferences.
+
+    Returns:
+        the number of requests written.
+    """
+    rng = random.Random(seed)
+    semesters = sorted( { ( int(year), int(semester) ) for year, semester, _ in plan } )
+
+    with open(filename, 'w') as f:
+
+        for i in range(num_students):
+            year, semester = rng.choice(semesters)
+            request = {
+                'id': f'student-{i}',
+                'year': year,
+                'semester': semester,
+                'records': generate_records(plan, year, semester, fail_rate, rng),
+                'preferences': { 'days_off': rng.randint(0, 2) },
+                'seed': rng.getrandbits(32),
+            }
+            f.write( json.dumps(request) + '\n' )
+
+    return num_students
+
+
+def generate_course_browser(
+        filename,
+        course_codes: List[str],
+        min_sections=1,
+        max_sections=5,
+        num_instructors=30,
+        seed=0
+):
+    """
+    Writes a synthetic course browser (same format as `courseBrowser_1.json`) for the given courses.
+
+    Args:
+        * filename -- name of the JSON file to write.
+        * course_codes -- the courses to create sections for.
+        * min_sections, max_sections -- range of the number of sections of each course.
+        * num_instructors -- size of the pool the instructor of each section is chosen from.
+        * seed -- seed of the random generator, the same seed always writes the same file.
+
+    Returns:
+        num_sections -- the number of sections written.
+    """
+    rng = random.Random(seed)
+    instructors = [f'Instructor {i}' for i in range(num_instructors)]
+    browser = {}
+
+    for course_code in course_codes:
+
+        for number in range( 1, rng.randint(min_sections, max_sections) + 1 ):
+            section_details = { 'Instructor': rng.choice(instructors) }
+            time = rng.choice(TIME_SLOTS)
+
+            for day in rng.choice(DAY_PATTERNS):
+                section_details[day] = time
+
+            browser[ f'{course_code}-L-{number}' ] = section_details
+
+    with open(filename, 'w') as f:
+        json.dump(browser, f)
+
+    return len(browser)
@@ -0,0 +1,23 @@
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+sys.path.insert(0, ROOT)
+
+from catalog import read_catalog
+
+
+@pytest.fixture(scope='session')
+def catalog_files():
+    return (
+        os.path.join(ROOT, 'CEStudyPlan.txt'),
+        os.path.join(ROOT, 'Electives.txt'),
+        os.path.join(ROOT, 'courseBrowser_1.json')
+    )
+
+
+@pytest.fixture
+def catalog(catalog_files):
+    # Not shared between tests, some of them change the sections
+    return read_catalog(*catalog_files)
@@ -0,0 +1,45 @@
+from archive import EliteArchive
+from courses import Section
+
+
+def make_schedule(*genes):
+    return [ (course_code, Section(number, 'Lecture')) for course_code, number in genes ]
+
+
+def test_same_schedule_is_archived_once():
+    archive = EliteArchive(size=3)
+
+    assert archive.offer( make_schedule(('A', 1), ('B', 2)), 10 )
+    assert not archive.offer( make_schedule(('B', 2), ('A', 1)), 10 )
+    assert not archive.offer( make_schedule(('A', 1), ('B', 2)), 12 )
+
+    assert len(archive) == 1
+    assert archive.get_offers() == 3
+
+
+def test_keeps_the_most_fitted_schedules():
+    archive = EliteArchive(size=3)
+    scores = [5, 9, 1, 7, 3, 8]
+
+    for i, score in enumerate(scores):
+        archive.offer( make_schedule(('A', i + 1), ('B', i + 1)), score )
+
+    assert [ score for _, score in archive.get_schedules() ] == [9, 8, 7]
+    assert archive.get_threshold() == 7
+
+    # Schedules not above the threshold are not archived
+    assert not archive.offer( make_schedule(('C', 1)), 7 )
+    assert archive.offer( make_schedule(('C', 1)), 10 )
+    assert [ score for _, score in archive.get_schedules() ] == [10, 9, 8]
+
+
+def test_close_schedules_keep_the_most_fitted():
+    archive = EliteArchive(size=3, min_distance=2)
+
+    archive.offer( make_schedule(('A', 1), ('B', 1), ('C', 1)), 5 )
+
+    # One gene apart from the archived schedule
+    assert not archive.offer( make_schedule(('A', 1), ('B', 1), ('C', 2)), 4 )
+    assert archive.offer( make_schedule(('A', 1), ('B', 1), ('C', 2)), 6 )
+
+    assert [ score for _, score in archive.get_schedules() ] == [6]
@@ -0,0 +1,22 @@
+from batch import run_batch, schedule_student
+
+
+def test_run_batch_keeps_the_request_order(catalog):
+    requests = [
+        { 'id': f's{i}', 'year': 3, 'semester': 2, 'seed': i, 'preferences': { 'days_off': 1 } } for i in range(12)
+    ]
+
+    for i, request in enumerate(requests):
+        request['records'] = [ 'MATH1411=90' ] if i % 3 else []
+
+    # Fewer pending requests than requests, so results are yielded while the others are in flight
+    ga_options = { 'max_generations': 3 }
+    results = list( run_batch(requests, catalog, workers=3, max_pending=4, ga_options=ga_options) )
+
+    assert [ result['id'] for result in results ] == [ request['id'] for request in requests ]
+
+    # Same results as scheduling each request alone
+    for request, result in zip(requests, results):
+        expected = schedule_student(request, catalog, ga_options)
+
+        assert result['schedule'] == expected['schedule'] and result['fitness'] == expected['fitness']
@@ -0,0 +1,43 @@
+from catalog import read_catalog
+from catalog_cache import load_or_compile_catalog
+
+
+def course_state(catalog):
+    return {
+        course_code: ( course.get_priority(), course.is_passed(), course.get_prerequisites(), course.get_sections() )
+        for course_code, course in catalog.get_courses().items()
+    }
+
+
+def test_students_do_not_modify_the_catalog(catalog):
+    before = course_state(catalog)
+
+    first = catalog.for_student('3', '2', { 'MATH1411': 90, 'BUSA2302': 75 })
+    second = catalog.for_student('3', '2', {})
+
+    assert course_state(catalog) == before
+
+    # Each overlay only sees its own records
+    assert first['MATH1411'].is_passed() and not second['MATH1411'].is_passed()
+    assert first['MATH1411'].get_priority() == 0 < second['MATH1411'].get_priority()
+
+
+def test_critical_path_priority(catalog_files, tmp_path):
+    default = read_catalog(*catalog_files)
+    critical = read_catalog(*catalog_files, critical_path_priority=True)
+    graph = critical.get_prerequisite_graph()
+    dependents = graph.count_transitive_dependents()
+
+    assert critical.has_critical_path_priority() and not default.has_critical_path_priority()
+    assert all( critical.get_base_priority(code) == dependents[ graph.get_id(code) ] for code in critical.get_courses() )
+    assert any( critical.get_base_priority(code) != default.get_base_priority(code) for code in critical.get_courses() )
+
+    # The compiled catalog keeps the option, and is compiled again when it changes
+    cache_file = str( tmp_path / 'catalog.bin' )
+
+    for critical_path_priority in (True, True, False):
+        loaded = load_or_compile_catalog(cache_file, *catalog_files, critical_path_priority=critical_path_priority)
+        expected = critical if critical_path_priority else default
+
+        assert loaded.has_critical_path_priority() == critical_path_priority
+        assert all( loaded.get_base_priority(code) == expected.get_base_priority(code) for code in expected.get_courses() )
@@ -0,0 +1,124 @@
+import os
+import shutil
+import numpy as np
+import pytest
+import catalog_cache
+from catalog import read_catalog
+from catalog_cache import compile_catalog, load_catalog_cache, load_or_compile_catalog
+
+
+@pytest.fixture
+def source_files(catalog_files, tmp_path):
+    # Copies, so the tests can change them
+    copies = []
+
+    for filename in catalog_files:
+        copies.append( str( tmp_path / os.path.basename(filename) ) )
+        shutil.copy(filename, copies[-1])
+
+    return copies
+
+
+@pytest.fixture
+def cache_file(tmp_path, source_files):
+    cache_file = str( tmp_path / 'catalog.bin' )
+    compile_catalog( cache_file, read_catalog(*source_files), source_files )
+
+    return cache_file
+
+
+def describe(catalog):
+    """Everything the cache stores, in comparable form."""
+    study_plan = catalog.get_study_plan()
+    graph = catalog.get_prerequisite_graph()
+
+    return {
+        'study_plan': ( study_plan.get_name(), study_plan.get_total_hours(), study_plan.get_compulsory_courses(), study_plan.get_elective_courses() ),
+        'graph': [ ( graph.get_code(i), graph.get_prerequisites(i) ) for i in range( len(graph) ) ],
+        'courses': {
+            code: (
+                course.get_credit_hours(), course.get_priority(), catalog.get_base_priority(code), course.get_prerequisites(),
+                [
+                    ( s.get_number(), s.get_type(), s.get_instructor(), s.get_days(), s.get_start_time(), s.get_end_time(), s.get_time_mask() )
+                    for s in course.get_sections()
+                ]
+            )
+            for code, course in catalog.get_courses().items()
+        },
+        'browser_version': catalog.get_browser_version(),
+    }
+
+
+def test_cache_round_trip(source_files, cache_file):
+    catalog = read_catalog(*source_files)
+    loaded = load_catalog_cache(cache_file, source_files)
+
+    assert loaded is not None
+    assert describe(loaded) == describe(catalog)
+    assert np.array_equal( loaded.get_section_index().get_conflict_matrix(), catalog.get_section_index().get_conflict_matrix() )
+
+    # Students see the same courses
+    records = { 'MATH1411': 90, 'ENCS2110': 80 }
+    student, loaded_student = catalog.for_student('3', '2', records), loaded.for_student('3', '2', records)
+
+    assert all(
+        ( student[code].is_passed(), student[code].is_available(), student[code].get_priority() )
+        == ( loaded_student[code].is_passed(), loaded_student[code].is_available(), loaded_student[code].get_priority() )
+        for code in catalog.get_courses()
+    )
+
+
+def test_cache_without_source_files_is_not_checked(source_files, cache_file):
+    with open(source_files[2], 'a') as f:
+        f.write(' ')
+
+    assert load_catalog_cache(cache_file) is not None
+
+
+def test_touched_source_is_still_fresh(source_files, cache_file):
+    # Same content, newer modification time: the hash is checked
+    stat = os.stat(source_files[0])
+    os.utime( source_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9) )
+
+    assert load_catalog_cache(cache_file, source_files) is not None
+
+
+@pytest.mark.parametrize('source', range(3))
+def test_changed_source_is_stale(source_files, cache_file, source):
+    with open(source_files[source], 'a') as f:
+        f.write('\n')
+
+    assert load_catalog_cache(cache_file, source_files) is None
+
+
+def test_other_sources_are_stale(catalog_files, source_files, cache_file):
+    # Same content, but other files
+    assert load_catalog_cache(cache_file, list(catalog_files)) is None
+    assert load_catalog_cache(cache_file, source_files[:2]) is None
+
+    os.remove(source_files[1])
+    assert load_catalog_cache(cache_file, source_files) is None
+
+
+def test_missing_or_other_version_cache(source_files, cache_file, tmp_path, monkeypatch):
+    assert load_catalog_cache( str( tmp_path / 'missing.bin' ), source_files ) is None
+
+    monkeypatch.setattr(catalog_cache, 'CACHE_VERSION', catalog_cache.CACHE_VERSION + 1)
+    assert load_catalog_cache(cache_file, source_files) is None
+
+
+def test_stale_cache_is_compiled_again(source_files, cache_file):
+    old_version = load_catalog_cache(cache_file, source_files).get_browser_version()
+
+    with open(source_files[2]) as f:
+        browser = f.read()
+
+    # Drops the first section of the browser
+    with open(source_files[2], 'w') as f:
+        f.write( '{' + browser[ browser.index('}, ') + 3: ] )
+
+    catalog = load_or_compile_catalog(cache_file, *source_files)
+    loaded = load_catalog_cache(cache_file, source_files)
+
+    assert loaded is not None and loaded.get_browser_version() != old_version
+    assert describe(loaded) == describe(catalog) == describe( read_catalog(*source_files) )
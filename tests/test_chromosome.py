@@ -0,0 +1,61 @@
+import random
+import numpy as np
+import pytest
+from chromosome import GenerationBuffers
+from genetic import crossover, draw_cross_point
+
+
+def random_parents(catalog, size, max_length, rng):
+    section_index = catalog.get_section_index()
+    courses = [ code for code, course in catalog.get_courses().items() if course.get_sections() ]
+    parents = []
+
+    for _ in range(size):
+        parents.append( [
+            ( code, rng.choice( catalog.get_courses()[code].get_sections() ) )
+            for code in rng.sample( courses, rng.randint(0, max_length) )
+        ] )
+
+    return parents
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_encoded_crossover_matches_list_crossover(catalog, seed):
+    rng = random.Random(seed)
+    size = 20
+    parents = random_parents(catalog, size, 6, rng)
+
+    # Empty and short parents get a cross point past their length
+    parents[0] = []
+    parents[2] = parents[2][:1]
+
+    random.seed(seed)
+    expected = []
+
+    for i in range(0, size, 2):
+        expected.extend( crossover(parents[i], parents[i + 1]) )
+
+    buffers = GenerationBuffers( catalog.get_section_index(), size, max( 1, *map(len, parents) ) )
+    buffers.load(parents)
+
+    random.seed(seed)
+    _, lengths = buffers.get_parents()
+    buffers.crossover( np.array( [ draw_cross_point( lengths[i], lengths[i + 1] ) for i in range(0, size, 2) ] ) )
+
+    sections, lengths = buffers.get_population()
+
+    for row, chromosome in enumerate(expected, start=size):
+        assert -1 not in sections[row, :lengths[row]]
+        assert buffers.decode(row) == chromosome
+
+
+def test_empty_parent_takes_the_other_parents_genes(catalog):
+    section_index = catalog.get_section_index()
+    parent = [ ( section_index.get_course_code(i), section_index.get_section(i) ) for i in (5, 40, 90) ]
+
+    buffers = GenerationBuffers(section_index, 4, 3)
+    buffers.load( [ [], parent, [], parent ] )
+    buffers.crossover( np.array([1, 1]) )
+
+    assert buffers.decode(4) == parent[1:]
+    assert buffers.decode(5) == parent[:1]
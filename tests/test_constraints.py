@@ -0,0 +1,72 @@
+import pickle
+import pytest
+from batch import schedule_student
+from constraints import CandidateCourses, EmptiedCourses, HardConstraints
+from genetic import run_ga
+from main import create_courses_pool
+
+CONSTRAINTS = { 'forbidden_days': ['S'], 'earliest_start': '09:00', 'latest_end': '16:00' }
+
+
+def test_candidate_sections_satisfy_the_constraints(catalog):
+    constraints = HardConstraints(**CONSTRAINTS)
+    candidates = CandidateCourses( catalog.for_student('3', '2', {}), constraints )
+
+    for course_code, course in candidates.items():
+        assert all( constraints.allows(course_code, section) for section in course.get_sections() )
+
+    pool = create_courses_pool(candidates, catalog.get_study_plan())
+    schedule, _, _ = run_ga( pool, candidates, section_index=catalog.get_section_index(), max_generations=3 )
+
+    assert all( constraints.allows(course_code, section) for course_code, section in schedule )
+
+
+def test_candidate_courses_pickle(catalog):
+    candidates = CandidateCourses( catalog.for_student('3', '2', {}), HardConstraints(**CONSTRAINTS) )
+    copy = pickle.loads( pickle.dumps(candidates) )
+
+    assert list(copy) == list(candidates)
+    assert copy.count_sections() == candidates.count_sections()
+    assert copy['BUSA2302'].get_credit_hours() == candidates['BUSA2302'].get_credit_hours()
+
+
+def test_emptied_required_course_is_reported(catalog):
+    candidates = CandidateCourses( catalog.for_student('3', '2', {}), HardConstraints(forbidden_days=['S', 'M', 'T', 'W', 'R']) )
+
+    with pytest.raises(EmptiedCourses) as error:
+        candidates.check_required(['BUSA2302'])
+
+    assert error.value.course_codes == ['BUSA2302']
+
+
+def test_schedule_student_reports_pruned_courses(catalog):
+    # Every MATH1411 section meets on Monday
+    constraints = { 'forbidden_days': ['M'] }
+    request = { 'id': 's', 'year': 3, 'semester': 2, 'records': [], 'seed': 1, 'constraints': constraints, 'required': [] }
+    result = schedule_student(request, catalog, { 'max_generations': 3 })
+
+    assert result['pruned'] == ['MATH1411']
+    assert not set( result['pruned'] ) & { gene['course'] for gene in result['schedule'] }
+
+    # Without required, the compulsory pool courses must keep a section
+    del request['required']
+    result = schedule_student(request, catalog, { 'max_generations': 3 })
+
+    assert result['error'].startswith('EmptiedCourses')
+
+
+def test_schedule_student_ignores_pruned_passed_courses(catalog):
+    # MATH1411 is passed, so losing its Monday sections neither fails the request nor is reported
+    request = {
+        'id': 's', 'year': 3, 'semester': 2, 'records': ['MATH1411=90'], 'seed': 1,
+        'constraints': { 'forbidden_days': ['M'] }
+    }
+    result = schedule_student(request, catalog, { 'max_generations': 3 })
+
+    assert 'error' not in result
+    assert 'MATH1411' not in result['pruned']
+
+
+def test_unexpected_constraint_is_rejected():
+    with pytest.raises(ValueError, match='latest_start'):
+        HardConstraints.from_dict({ 'forbidden_days': ['S'], 'latest_start': '10:00' })
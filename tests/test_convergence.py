@@ -0,0 +1,62 @@
+import random
+import convergence
+from convergence import ConvergenceController
+from genetic import run_ga
+from main import create_courses_pool
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_stall_stop():
+    controller = ConvergenceController(stall_generations=3)
+    controller.start()
+
+    # The best fitness improves twice, then stalls for three generations
+    stops = [ controller.update(best_fitness) for best_fitness in (10, 12, 12, 11, 12) ]
+
+    assert stops == [False, False, False, False, True]
+    assert controller.get_stop_reason() == 'stall'
+    assert controller.get_generations() == 5
+
+
+def test_time_budget_stop(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(convergence.time, 'perf_counter', clock)
+
+    controller = ConvergenceController(time_budget=10)
+    controller.start()
+
+    # Generations of 3 seconds: the one ending at 9 seconds would let the next one overrun the budget
+    stops = []
+
+    for _ in range(5):
+        clock.now += 3
+        stops.append( controller.update(len(stops)) )
+
+        if stops[-1]:
+            break
+
+    assert stops == [False, False, True]
+    assert controller.get_stop_reason() == 'time_budget'
+
+
+def test_run_ga_stops_early(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+
+    random.seed(0)
+    _, _, generations = run_ga( pool, courses, section_index=catalog.get_section_index(), max_generations=200, stall_generations=2 )
+
+    assert 3 <= generations < 200
+
+    random.seed(0)
+    _, _, generations = run_ga( pool, courses, section_index=catalog.get_section_index(), max_generations=200, time_budget=0 )
+
+    assert generations == 1
@@ -0,0 +1,75 @@
+import itertools
+import random
+import pytest
+from exact import BranchAndBound, SearchLimitReached
+from genetic import fitness
+from main import create_courses_pool
+from solver import solve
+
+
+def brute_force(pool, courses, section_index, preferences):
+    """
+    Best fitness of every schedule of the pool, each course being skipped or taking one of its sections.
+    """
+    best = 0
+    choices = [ [None] + [ (course_code, section) for section in courses[course_code].get_sections() ] for course_code in pool ]
+
+    for genes in itertools.product(*choices):
+        # The instructor bonus is given to the last gene
+        chromosome = sorted(
+            ( gene for gene in genes if gene is not None ),
+            key=lambda gene: gene[1].get_instructor() == preferences.get('instructor')
+        )
+        best = max( best, fitness(chromosome, courses, preferences, section_index) )
+
+    return best
+
+
+@pytest.fixture
+def student(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+
+    return courses, pool, catalog.get_section_index()
+
+
+def test_branch_and_bound_matches_exhaustive_search(student):
+    courses, pool, section_index = student
+    candidates = [ course_code for course_code in pool if len( courses[course_code].get_sections() ) <= 14 ]
+    rng = random.Random(0)
+
+    for _ in range(5):
+        small = rng.sample( candidates, 4 )
+        instructor = rng.choice( [ section.get_instructor() for c in small for section in courses[c].get_sections() ] )
+
+        for preferences in ( {}, { 'days_off': 2 }, { 'instructor': instructor, 'credit_hours': 6, 'days_off': 1 } ):
+            schedule, best_fitness = BranchAndBound(small, courses, section_index, preferences).solve()
+
+            assert best_fitness == fitness(schedule, courses, preferences, section_index)
+            assert best_fitness == brute_force(small, courses, section_index, preferences)
+
+
+def test_search_limits_fall_back_to_the_genetic_algorithm(student):
+    courses, pool, section_index = student
+    preferences = { 'credit_hours': 12, 'days_off': 2 }
+
+    # Every course with sections, so that the search visits a few thousand nodes
+    everything = [ course_code for course_code in courses if courses[course_code].get_sections() ]
+
+    with pytest.raises(SearchLimitReached):
+        BranchAndBound(everything, courses, section_index, preferences, node_limit=10).solve()
+
+    # The time limit is checked every 1024 nodes
+    with pytest.raises(SearchLimitReached):
+        BranchAndBound(everything, courses, section_index, preferences, time_limit=0).solve()
+
+    random.seed(0)
+    schedule, best_fitness, engine = solve(everything, courses, section_index, engine='exact', time_limit=0, max_generations=3, **preferences)
+
+    assert engine == 'ga'
+    assert best_fitness == fitness(schedule, courses, preferences, section_index)
+
+    schedule, best_fitness, engine = solve(pool, courses, section_index, engine='exact', **preferences)
+
+    assert engine == 'exact'
+    assert best_fitness == fitness(schedule, courses, preferences, section_index)
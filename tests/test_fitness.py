@@ -0,0 +1,85 @@
+import random
+import pytest
+from genetic import BatchFitness, FitnessCache, fitness, populate, run_ga
+from main import create_courses_pool
+
+INSTRUCTOR = 'Fatimah Hasan Ahmed Shamasneh'
+PREFERENCES = [ {}, { 'days_off': 2 }, { 'days_off': 3, 'instructor': INSTRUCTOR, 'credit_hours': 15 } ]
+
+
+@pytest.mark.parametrize('preferences', PREFERENCES)
+def test_batch_fitness_matches_scalar_fitness(catalog, preferences):
+    courses = catalog.for_student('3', '2', { 'BUSA2302': 90 })
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+
+    random.seed(0)
+    population = populate(pool, courses, 300) + [ [] ]
+
+    # Single sections of the preferred instructor, that score the instructor preference
+    population += [
+        [ (course_code, section) ] for course_code in pool for section in courses[course_code].get_sections()
+        if section.get_instructor() == INSTRUCTOR
+    ]
+
+    batch_fitness = BatchFitness( courses, catalog.get_section_index(), preferences )
+    expected = [ fitness(chromosome, courses, preferences) for chromosome in population ]
+
+    assert batch_fitness.evaluate_population(population).tolist() == expected
+    assert 0 < sum( score > 0 for score in expected ) < len(population)
+
+    # The instructor preference is matched by some of the scored chromosomes
+    if 'instructor' in preferences:
+        others = { key: value for key, value in preferences.items() if key != 'instructor' }
+        assert any( score != fitness(chromosome, courses, others) for chromosome, score in zip(population, expected) )
+
+
+def test_vectorized_run_keeps_the_results_of_the_list_population(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    results = []
+
+    # A fitness cache keeps the list population, without it the population stays encoded
+    for fitness_cache in (FitnessCache(), None):
+        random.seed(3)
+        schedule, best_fitness, generations = run_ga(
+            pool, courses, section_index=catalog.get_section_index(), vectorized=True, fitness_cache=fitness_cache,
+            max_generations=5, days_off=1
+        )
+        results.append( ( [ (course_code, section.get_id()) for course_code, section in schedule ], best_fitness, generations ) )
+
+    assert results[0] == results[1]
+
+
+def test_fitness_cache_evicts_the_least_recently_used():
+    cache = FitnessCache(max_size=2)
+
+    cache.store('a', 1)
+    cache.store('b', 2)
+
+    assert cache.lookup('a') == 1 # 'b' is now the least recently used
+    cache.store('c', 3)
+
+    assert cache.lookup('b') is None
+    assert cache.lookup('a') == 1 and cache.lookup('c') == 3
+    assert len(cache) == 2
+    assert (cache.get_hits(), cache.get_misses(), cache.get_evictions()) == (3, 1, 1)
+    assert cache.get_hit_rate() == 0.75
+
+
+def test_fitness_cache_scores_each_schedule_once(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    preferences = { 'days_off': 2, 'instructor': INSTRUCTOR }
+
+    random.seed(0)
+    population = populate(pool, courses, 50)
+    cache = FitnessCache()
+
+    scores = [ cache.get_fitness(chromosome, courses, preferences) for chromosome in population ]
+
+    # The same schedules again, with the genes in another order except the last one (the instructor's gene)
+    shuffled = [ random.sample(chromosome[:-1], len(chromosome) - 1) + chromosome[-1:] for chromosome in population ]
+
+    assert [ cache.get_fitness(chromosome, courses, preferences) for chromosome in shuffled ] == scores
+    assert scores == [ fitness(chromosome, courses, preferences) for chromosome in population ]
+    assert cache.get_hits() == len(population) and cache.get_misses() == len(population)
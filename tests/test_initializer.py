@@ -0,0 +1,49 @@
+import random
+import pytest
+from initializer import GreedyInitializer
+from main import create_courses_pool
+
+
+@pytest.mark.parametrize('credit_hours', [9, 15, 18])
+def test_greedy_generation_is_conflict_free_and_meets_the_credit_hours(catalog, credit_hours):
+    courses = catalog.for_student('3', '2', { 'BUSA2302': 90 })
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    section_index = catalog.get_section_index()
+
+    random.seed(0)
+    population = GreedyInitializer(pool, courses, section_index, 3, 10, credit_hours).populate(100)
+    totals = []
+
+    for chromosome in population:
+        sections = [ section for _, section in chromosome ]
+        total = sum( courses[course_code].get_credit_hours() for course_code, _ in chromosome )
+        totals.append(total)
+
+        assert not section_index.has_conflict(sections)
+        assert not any( courses[course_code].is_passed() for course_code, _ in chromosome )
+        assert total <= credit_hours
+
+        # Short of the target, no other course fits in the remaining credit hours without a conflict
+        if total < credit_hours:
+            taken = { course_code for course_code, _ in chromosome }
+
+            for course_code in pool:
+                if course_code in taken or courses[course_code].is_passed():
+                    continue
+
+                if total + courses[course_code].get_credit_hours() <= credit_hours:
+                    assert all( section_index.has_conflict( sections + [ section ] ) for section in courses[course_code].get_sections() )
+
+    assert credit_hours in totals
+
+
+def test_greedy_generation_without_target(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    section_index = catalog.get_section_index()
+
+    random.seed(1)
+
+    for chromosome in GreedyInitializer(pool, courses, section_index, 3, 5).populate(100):
+        assert 1 <= len(chromosome) <= 5
+        assert not section_index.has_conflict( [ section for _, section in chromosome ] )
@@ -0,0 +1,99 @@
+import io
+import json
+import random
+import pytest
+import genetic
+from genetic import FitnessCache, run_ga
+from instrumentation import JsonLinesSink, generation_stats
+from main import create_courses_pool
+
+TIMINGS = { 'crossover', 'mutation', 'evaluation', 'selection' }
+
+
+@pytest.fixture
+def student(catalog):
+    courses = catalog.for_student('3', '2', {})
+
+    return create_courses_pool( courses, catalog.get_study_plan() ), courses, catalog.get_section_index()
+
+
+def run_with_stats(student, seed=0, **options):
+    pool, courses, section_index = student
+    stats = []
+
+    random.seed(seed)
+    _, fitness_max, generations = run_ga( pool, courses, section_index=section_index, on_generation=stats.append, days_off=1, **options )
+
+    return stats, fitness_max, generations
+
+
+def test_generation_stats():
+    stats = generation_stats( 4, { 'evaluation': 0.5 }, [0, 10, 20, 0] )
+
+    assert stats == {
+        'generation': 4, 'timings': { 'evaluation': 0.5 }, 'evaluations': 4,
+        'best_fitness': 20, 'mean_fitness': 7.5, 'zero_fitness_share': 0.5
+    }
+
+    assert generation_stats(1, {}, [])['best_fitness'] == 0
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    { 'vectorized': True },
+    { 'encoded': True },
+    { 'mutation_rate': 0 },
+    { 'stall_generations': 2 },
+], ids=['list', 'vectorized', 'encoded', 'no-mutation', 'stall'])
+def test_callback_receives_every_generation(student, options):
+    stats, _, generations = run_with_stats( student, max_generations=8, **options )
+
+    assert [ s['generation'] for s in stats ] == list( range(1, generations + 1) )
+    assert 0 < generations <= 8
+
+    for s in stats:
+        assert set( s['timings'] ) == TIMINGS and all( seconds >= 0 for seconds in s['timings'].values() )
+
+        # parents and offsprings
+        assert s['evaluations'] == 2 * genetic.MAX_POPULATION
+        assert 0 <= s['zero_fitness_share'] <= 1
+        assert s['mean_fitness'] <= s['best_fitness']
+        assert 'cache_hits' not in s
+
+
+def test_list_and_encoded_stats_match(student):
+    # Same random draws, so the same fitness in every generation
+    list_stats, list_fitness, _ = run_with_stats( student, seed=3, max_generations=5 )
+    encoded_stats, encoded_fitness, _ = run_with_stats( student, seed=3, max_generations=5, encoded=True )
+
+    fields = lambda stats: [ ( s['best_fitness'], s['mean_fitness'], s['zero_fitness_share'] ) for s in stats ]
+
+    assert fields(list_stats) == fields(encoded_stats)
+    assert list_fitness == encoded_fitness
+
+
+def test_cache_counters_of_each_generation(student):
+    fitness_cache = FitnessCache()
+    stats, _, _ = run_with_stats( student, max_generations=6, fitness_cache=fitness_cache )
+
+    # Every evaluated chromosome is looked up once, and the counters are not cumulative
+    assert all( s['cache_hits'] + s['cache_misses'] == s['evaluations'] for s in stats )
+    assert sum( s['cache_misses'] for s in stats ) <= fitness_cache.get_misses()
+
+    # The same run again finds all its chromosomes in the cache
+    stats, _, _ = run_with_stats( student, max_generations=6, fitness_cache=fitness_cache )
+
+    assert all( s['cache_misses'] == 0 and s['cache_hits'] == s['evaluations'] for s in stats )
+
+
+def test_json_lines_sink(student):
+    file = io.StringIO()
+    pool, courses, section_index = student
+
+    random.seed(0)
+    _, _, generations = run_ga( pool, courses, section_index=section_index, max_generations=4, on_generation=JsonLinesSink(file, student='s1') )
+
+    lines = [ json.loads(line) for line in file.getvalue().splitlines() ]
+
+    assert [ line['generation'] for line in lines ] == list( range(1, generations + 1) )
+    assert all( line['student'] == 's1' and line['evaluations'] == 2 * genetic.MAX_POPULATION for line in lines )
@@ -0,0 +1,47 @@
+import random
+from genetic import fitness
+from islands import migrate, run_islands
+from main import create_courses_pool
+
+
+def make_islands():
+    populations = [ [ f'{island}{i}' for i in range(4) ] for island in 'abc' ]
+    pop_fitness = [ [1, 5, 3, 2], [7, 0, 4, 6], [2, 9, 8, 1] ]
+
+    return populations, pop_fitness
+
+
+def test_ring_migration():
+    populations, pop_fitness = make_islands()
+    migrate(populations, pop_fitness, 2, 'ring')
+
+    # Each island receives the 2 most fitted chromosomes of the previous one, over its 2 least fitted
+    assert populations == [ ['c1', 'a1', 'a2', 'c2'], ['b0', 'a1', 'a2', 'b3'], ['b3', 'c1', 'c2', 'b0'] ]
+    assert pop_fitness == [ [9, 5, 3, 8], [7, 5, 3, 6], [6, 9, 8, 7] ]
+
+
+def test_full_migration():
+    populations, pop_fitness = make_islands()
+    migrate(populations, pop_fitness, 1, 'full')
+
+    # Each island receives the most fitted chromosome of all the other islands
+    assert populations == [ ['c1', 'a1', 'a2', 'a3'], ['b0', 'c1', 'b2', 'b3'], ['c0', 'c1', 'c2', 'b0'] ]
+    assert pop_fitness == [ [9, 5, 3, 2], [7, 9, 4, 6], [2, 9, 8, 7] ]
+
+
+def test_run_islands(catalog):
+    courses = catalog.for_student('3', '2', {})
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    results = []
+
+    for _ in range(2):
+        random.seed(0)
+        schedule, best_fitness = run_islands(
+            pool, courses, catalog.get_section_index(), islands=2, migration_interval=2, generations=4, days_off=1
+        )
+        results.append( ( [ (course_code, section.get_id()) for course_code, section in schedule ], best_fitness ) )
+
+        assert best_fitness == fitness(schedule, courses, { 'days_off': 1 }) > 0
+
+    # The seeds of the islands are drawn from the seeded generator
+    assert results[0] == results[1]
@@ -0,0 +1,67 @@
+import random
+from genetic import populate
+from main import create_courses_pool
+from mutation import MutationOperator
+
+
+def setup_student(catalog):
+    courses = catalog.for_student('3', '2', { 'BUSA2302': 90 })
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    section_index = catalog.get_section_index()
+
+    return courses, pool, section_index, MutationOperator(pool, courses, section_index, mutation_rate=0.5)
+
+
+def assert_valid(chromosome, courses, section_index):
+    course_codes = [ course_code for course_code, _ in chromosome ]
+
+    assert not section_index.has_conflict( [ section for _, section in chromosome ] )
+    assert len( set(course_codes) ) == len(course_codes)
+    assert not any( courses[course_code].is_passed() for course_code in course_codes )
+
+
+def test_repair_leaves_conflict_free_chromosomes(catalog):
+    courses, pool, section_index, mutation_operator = setup_student(catalog)
+
+    random.seed(0)
+    population = populate(pool, courses, 200)
+
+    assert any( section_index.has_conflict( [ section for _, section in chromosome ] ) for chromosome in population )
+
+    for chromosome in population:
+        repaired = mutation_operator.repair(chromosome)
+        assert_valid(repaired, courses, section_index)
+
+        # A course is only dropped when every one of its sections conflicts with the repaired chromosome
+        kept = { course_code for course_code, _ in repaired }
+
+        for course_code, _ in chromosome:
+            if course_code in kept or courses[course_code].is_passed():
+                continue
+
+            assert all(
+                section_index.has_conflict( [ section ] + [ gene[1] for gene in repaired ] )
+                for section in courses[course_code].get_sections()
+            )
+
+
+def test_repair_keeps_conflict_free_chromosomes(catalog):
+    courses, pool, section_index, mutation_operator = setup_student(catalog)
+
+    random.seed(1)
+
+    for chromosome in map( mutation_operator.repair, populate(pool, courses, 100) ):
+        assert mutation_operator.repair(chromosome) == chromosome
+
+
+def test_mutated_chromosomes_are_repaired(catalog):
+    courses, pool, section_index, mutation_operator = setup_student(catalog)
+
+    random.seed(2)
+    population = populate(pool, courses, 200)
+    mutated = [ mutation_operator.mutate(chromosome) for chromosome in population ]
+
+    for chromosome in mutated:
+        assert_valid(chromosome, courses, section_index)
+
+    assert sum( a != b for a, b in zip(population, mutated) ) > len(population) // 2
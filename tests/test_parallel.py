@@ -0,0 +1,56 @@
+import random
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from batch import run_batch, schedule_student
+from genetic import run_ga
+from main import create_courses_pool
+
+
+def schedule(catalog, year, semester, records, preferences, **options):
+    courses = catalog.for_student(year, semester, records)
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+
+    random.seed(0)
+    best_schedule, best_fitness, generations = run_ga(
+        pool, courses, section_index=catalog.get_section_index(), max_generations=4, **options, **preferences
+    )
+
+    return [ (course_code, section.get_id()) for course_code, section in best_schedule ], best_fitness, generations
+
+
+STUDENTS = [
+    ( '3', '2', {}, { 'days_off': 1 } ),
+    ( '2', '1', { 'BUSA2302': 90 }, { 'credit_hours': 12 } ),
+    ( '3', '2', {}, { 'days_off': 2 } ),
+]
+
+
+def test_shared_executor_matches_serial_runs(catalog):
+    expected = [ schedule(catalog, *student) for student in STUDENTS ]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        # The same executor evaluates the runs of several students, one after the other
+        assert [ schedule(catalog, *student, workers=2, executor=executor) for student in STUDENTS ] == expected
+
+        # It is left open by the runs
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+
+def test_own_executor_matches_serial_run(catalog):
+    assert schedule(catalog, *STUDENTS[0], workers=2, vectorized=True) == schedule(catalog, *STUDENTS[0])
+
+
+def test_batch_rejects_nested_fitness_workers(catalog):
+    with pytest.raises(ValueError):
+        list( run_batch( [ { 'id': 1, 'year': 3, 'semester': 2 } ], catalog, 1, ga_options={ 'workers': 2 } ) )
+
+
+def test_schedule_student_reuses_the_executor(catalog):
+    requests = [ { 'id': i, 'year': 3, 'semester': 2, 'seed': i, 'preferences': { 'days_off': 1 } } for i in range(3) ]
+    expected = [ schedule_student(request, catalog, { 'max_generations': 3 })['schedule'] for request in requests ]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert [
+            schedule_student(request, catalog, { 'max_generations': 3, 'workers': 2 }, fitness_executor=executor)['schedule']
+            for request in requests
+        ] == expected
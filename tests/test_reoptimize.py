@@ -0,0 +1,64 @@
+import random
+import numpy as np
+from archive import EliteArchive
+from courses import build_conflict_matrix, create_section
+from genetic import run_ga
+from main import create_courses_pool
+from reoptimize import apply_section_delta, reoptimize
+
+
+def plan(catalog, year, semester, records={}):
+    courses = catalog.for_student(year, semester, records)
+    pool = create_courses_pool(courses, catalog.get_study_plan())
+    archive = EliteArchive(20)
+
+    random.seed(0)
+    run_ga(pool, courses, section_index=catalog.get_section_index(), archive=archive, max_generations=5)
+
+    return courses, pool, archive
+
+
+def test_replans_two_students_after_one_delta(catalog):
+    section_index = catalog.get_section_index()
+    students = [ plan(catalog, '3', '2'), plan(catalog, '2', '1') ]
+
+    course = catalog.get_courses()['MATH1411']
+    num_sections, num_indexed = len( course.get_sections() ), len(section_index)
+    removed = [ course.get_sections()[0] ]
+    added = { 'MATH1411': [ create_section('MATH1411-L-90', { 'Instructor': 'X', 'T': '08:00 - 09:15' }, time_masks=True) ] }
+
+    removed_ids = apply_section_delta(catalog.get_courses(), section_index, added, removed)
+
+    # The same delta again changes nothing
+    assert apply_section_delta(catalog.get_courses(), section_index, added, removed) == removed_ids
+    assert len( course.get_sections() ) == num_sections
+    assert len(section_index) == num_indexed + 1
+
+    for courses, pool, archive in students:
+        random.seed(1)
+        schedule, fitness, generations = reoptimize(archive, pool, courses, section_index, removed_ids)
+
+        assert generations <= 5
+        assert not any( section.get_id() in removed_ids for _, section in schedule )
+        assert not section_index.has_conflict( section for _, section in schedule )
+
+    assert len( course.get_sections() ) == num_sections
+    assert len(section_index) == num_indexed + 1
+
+
+def test_added_sections_update_the_conflicts_incrementally(catalog):
+    section_index = catalog.get_section_index()
+
+    for number, time in enumerate(['08:00 - 09:15', '08:30 - 09:45', '14:00 - 15:00'], start=90):
+        apply_section_delta(
+            catalog.get_courses(), section_index,
+            { 'ENCS2340': [ create_section(f'ENCS2340-L-{number}', { 'Instructor': 'X', 'S': time, 'M': time }) ] }
+        )
+
+    expected = build_conflict_matrix( section_index.get_sections() )
+
+    assert np.array_equal(section_index.get_conflict_matrix(), expected)
+
+    for section_id in range( len(section_index) ):
+        packed = int.from_bytes( np.packbits(expected[section_id], bitorder='little').tobytes(), 'little' )
+        assert section_index.get_conflict_row(section_id) == packed
@@ -0,0 +1,68 @@
+import time
+import pytest
+from batch import schedule_student
+from result_cache import ResultCache, make_result_key
+
+GA_OPTIONS = { 'max_generations': 5 }
+
+
+@pytest.fixture
+def result_cache(tmp_path, catalog):
+    cache = ResultCache( str(tmp_path / 'results.db') )
+    cache.set_browser_version( catalog.get_browser_version() )
+    yield cache
+    cache.close()
+
+
+def test_hit_returns_the_same_result(catalog, result_cache):
+    request = { 'id': 's1', 'year': 3, 'semester': 2, 'records': [], 'seed': 1 }
+
+    first = schedule_student(request, catalog, GA_OPTIONS, result_cache)
+    second = schedule_student(request, catalog, GA_OPTIONS, result_cache)
+
+    assert not first['cached'] and second['cached']
+    assert second['schedule'] == first['schedule'] and second['fitness'] == first['fitness']
+
+
+def test_passed_courses_are_part_of_the_key(catalog, result_cache):
+    # BUSA2302 has no prerequisites, so it stays in the pool of a student who passed it
+    without_record = { 'id': 'b', 'year': 3, 'semester': 2, 'records': [], 'seed': 7 }
+    with_record = { 'id': 'a', 'year': 3, 'semester': 2, 'records': ['BUSA2302=90'], 'seed': 7 }
+
+    schedule_student(without_record, catalog, GA_OPTIONS, result_cache)
+    cached = schedule_student(with_record, catalog, GA_OPTIONS, result_cache)
+    uncached = schedule_student(with_record, catalog, GA_OPTIONS)
+
+    assert not cached['cached']
+    assert cached['schedule'] == uncached['schedule']
+    assert 'BUSA2302' not in [ gene['course'] for gene in cached['schedule'] ]
+
+
+def test_make_result_key_depends_on_passed_courses():
+    pool = ['BUSA2302', 'ENCS2340']
+
+    assert make_result_key('v', 3, 2, pool, [], {}, 1) != make_result_key('v', 3, 2, pool, ['BUSA2302'], {}, 1)
+    assert make_result_key('v', 3, 2, pool, [], {}, 1) == make_result_key('v', 3, 2, pool[::-1], [], {}, 1)
+
+
+def test_new_browser_version_invalidates(tmp_path):
+    with ResultCache( str(tmp_path / 'results.db') ) as cache:
+        cache.set_browser_version('v1')
+        cache.put('key', { 'fitness': 1 })
+        cache.set_browser_version('v2')
+
+        assert cache.get('key') is None and len(cache) == 0
+
+
+def test_ttl_and_size_eviction(tmp_path):
+    with ResultCache( str(tmp_path / 'results.db'), ttl=0.05 ) as cache:
+        cache.put('key', { 'fitness': 1 })
+        time.sleep(0.1)
+
+        assert cache.get('key') is None
+
+    with ResultCache( str(tmp_path / 'sized.db'), max_entries=2 ) as cache:
+        for key in ['a', 'b', 'c']:
+            cache.put(key, { 'key': key })
+
+        assert len(cache) == 2 and cache.get('a') is None
@@ -0,0 +1,86 @@
+import random
+import numpy as np
+import pytest
+from datetime import timedelta
+from courses import SLOT_MINUTES, WEEK_DAYS, Section, SectionIndex, encode_time_mask, read_sections
+from studyplan import read_electives, read_study_plan
+
+
+@pytest.fixture
+def college_courses(catalog_files):
+    study_plan_file, electives_file, browser_file = catalog_files
+    study_plan, college_courses = read_study_plan(study_plan_file, 'Computer Engineering', 158, '3', '2')
+    college_courses = read_electives(electives_file, study_plan, college_courses)
+
+    return read_sections(browser_file, college_courses)
+
+
+def test_conflict_matrix_matches_section_overlaps(college_courses):
+    section_index = SectionIndex(college_courses)
+    sections = section_index.get_sections()
+    conflicts = section_index.get_conflict_matrix()
+
+    timed = [ i for i, section in enumerate(sections) if section.get_start_time() is not None ]
+    expected = np.zeros_like(conflicts)
+
+    # Section.has_conflict() misses a section containing the other one, so it is checked in both directions
+    for i in timed:
+        for j in timed:
+            expected[i, j] = bool( sections[i].has_conflict(sections[j]) or sections[j].has_conflict(sections[i]) )
+
+    assert len(timed) > 100
+    assert np.array_equal( conflicts[np.ix_(timed, timed)], expected[np.ix_(timed, timed)] )
+    assert not conflicts.diagonal().any()
+    assert conflicts.sum() > 0
+
+    # The packed rows and has_conflict() agree with the matrix
+    for i in timed[:50]:
+        row = section_index.get_conflict_row(i)
+        assert [ bool(row >> j & 1) for j in range(len(sections)) ] == conflicts[i].tolist()
+
+        for j in timed[:50]:
+            assert section_index.has_conflict( [ sections[i], sections[j] ] ) == bool( conflicts[i, j] )
+
+
+def overlaps(first, second):
+    return bool( first.get_days() & second.get_days() ) \
+        and first.get_start_time() < second.get_end_time() and second.get_start_time() < first.get_end_time()
+
+
+def test_time_masks_match_time_overlaps(catalog_files):
+    study_plan_file, electives_file, browser_file = catalog_files
+    study_plan, college_courses = read_study_plan(study_plan_file, 'Computer Engineering', 158, '3', '2')
+    college_courses = read_electives(electives_file, study_plan, college_courses)
+    college_courses = read_sections(browser_file, college_courses, time_masks=True)
+
+    sections = [
+        section for course in college_courses.values() for section in course.get_sections() if section.get_start_time() is not None
+    ]
+
+    for first in sections:
+        for second in sections:
+            if first is not second:
+                assert bool( first.get_time_mask() & second.get_time_mask() ) == overlaps(first, second)
+                assert bool( first.has_conflict(second) ) == overlaps(first, second)
+
+
+def test_random_time_masks_match_time_overlaps():
+    rng = random.Random(0)
+
+    def random_section():
+        section = Section(1, 'Lecture')
+        start = rng.randrange(8 * 60, 18 * 60, SLOT_MINUTES)
+
+        section.set_days( set( rng.sample(WEEK_DAYS, rng.randint(1, 3)) ) )
+        section.set_start_time( timedelta(minutes=start) )
+        section.set_end_time( timedelta(minutes=start + rng.randrange(SLOT_MINUTES, 4 * 60, SLOT_MINUTES)) )
+        section.set_time_mask( encode_time_mask( section.get_days(), section.get_start_time(), section.get_end_time() ) )
+
+        return section
+
+    sections = [ random_section() for _ in range(300) ]
+
+    for first in sections:
+        for second in sections:
+            if first is not second:
+                assert bool( first.get_time_mask() & second.get_time_mask() ) == overlaps(first, second)
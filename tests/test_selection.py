@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from selection import Selection, stochastic_universal_sampling, tournament
+
+
+def test_sus_selects_within_one_of_the_expected_count():
+    pop_fitness = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+    size = 20
+    expected = pop_fitness / pop_fitness.sum() * size
+
+    for seed in range(20):
+        counts = np.bincount( stochastic_universal_sampling(pop_fitness, size, np.random.default_rng(seed)), minlength=len(pop_fitness) )
+
+        assert counts.sum() == size
+        assert np.all( np.floor(expected) <= counts ) and np.all( counts <= np.ceil(expected) )
+
+
+def test_tournament_picks_the_best_of_each_group():
+    pop_fitness = np.array([4, 8, 1, 9, 3, 7, 2, 6])
+
+    for tournament_size in (1, 3, 5):
+        selected = tournament(pop_fitness, 50, tournament_size, np.random.default_rng(1))
+        contestants = np.random.default_rng(1).integers( 0, len(pop_fitness), (50, tournament_size) )
+
+        assert selected.tolist() == [ group[ np.argmax(pop_fitness[group]) ] for group in contestants ]
+
+    # Larger tournaments select more fitted chromosomes
+    means = [ pop_fitness[ tournament(pop_fitness, 1000, k, np.random.default_rng(2)) ].mean() for k in (1, 2, 4) ]
+
+    assert means == sorted(means)
+
+
+@pytest.mark.parametrize('method', ['roulette', 'sus', 'tournament'])
+def test_elitism_keeps_the_best(method):
+    pop_fitness = np.array([3, 0, 12, 5, 0, 9, 1, 0])
+    selection = Selection(method, elites=2)
+
+    for _ in range(10):
+        selected = selection.select(pop_fitness, 6)
+
+        assert len(selected) == 6
+        assert selected[:2].tolist() == [2, 5]
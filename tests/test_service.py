@@ -0,0 +1,67 @@
+import asyncio
+import json
+import pytest
+from service import ScheduleService, serve
+
+REQUEST = { 'year': 3, 'semester': 2, 'records': [], 'seed': 1 }
+
+
+@pytest.fixture
+def service(catalog):
+    with ScheduleService( catalog, workers=1, max_pending=8, ga_options={ 'max_generations': 3 } ) as service:
+        yield service
+
+
+async def send_lines(path, lines):
+    reader, writer = await asyncio.open_unix_connection(path)
+
+    for line in lines:
+        writer.write( line.encode() + b'\n' )
+
+    await writer.drain()
+    writer.write_eof()
+
+    results = []
+
+    while line := await reader.readline():
+        results.append( json.loads(line) )
+
+    writer.close()
+
+    return results
+
+
+def test_identical_requests_are_coalesced(service):
+    async def run():
+        return await asyncio.gather( *[ service.schedule( dict(REQUEST, id=i) ) for i in range(3) ] )
+
+    results = asyncio.run( run() )
+
+    assert [ result['id'] for result in results ] == [0, 1, 2]
+    assert all( result['schedule'] == results[0]['schedule'] for result in results )
+    assert service.get_stats()['computed'] == 1 and service.get_stats()['coalesced'] == 2
+
+
+def test_bad_requests_get_error_replies(service, tmp_path):
+    path = str(tmp_path / 'service.sock')
+    lines = [ 'not json', '[1, 2]', json.dumps({ 'id': 'bad', 'records': 5 }), json.dumps( dict(REQUEST, id='ok') ) ]
+
+    async def run():
+        server = asyncio.create_task( serve(service, unix_path=path) )
+
+        while not (tmp_path / 'service.sock').exists():
+            await asyncio.sleep(0.01)
+
+        try:
+            return await asyncio.wait_for( send_lines(path, lines), timeout=30 )
+        finally:
+            server.cancel()
+
+    results = asyncio.run( run() )
+    errors = [ result['error'] for result in results if 'error' in result ]
+
+    assert len(results) == len(lines)
+    assert any( error.startswith('JSONDecodeError') for error in errors )
+    assert 'Expected a JSON object, got list' in errors
+    assert any( result.get('id') == 'bad' and result['error'].startswith('TypeError') for result in results )
+    assert any( result.get('id') == 'ok' and 'schedule' in result for result in results )
@@ -0,0 +1,86 @@
+import json
+import pytest
+from courses import iter_course_browser, read_sections, read_sections_streaming
+from studyplan import read_electives, read_study_plan
+
+CHUNK_SIZES = [ 1, 2, 7, 64, 1000, 1 << 16 ]
+
+# Entries the regex fast path does not match: nested values, escapes, braces in strings and odd whitespace
+UNUSUAL_BROWSER = '''
+{
+  "ENCS2110-Lecture-1" :  { "Instructor": "A \\"quoted\\" name", "M": "08:00 - 09:15" },
+  "ENCS2110-Lab-2": {"Instructor": "Braces { } in a string", "T": "10:00 - 12:50"},
+  "ENCS\\u00332110-Lecture-3": {"W": "08:00 - 09:15"},
+  "COMP1310-Lecture-1": {"Instructor": "Nested", "Extra": {"Room": "Masri 101", "Seats": [30, 40]}},
+  "COMP1310-Lecture-2": {},
+  "MATH1411-Lecture-1":{"Instructor":"No spaces","S":"09:00 - 09:50"}
+}
+'''
+
+
+@pytest.fixture
+def unusual_browser(tmp_path):
+    filename = tmp_path / 'browser.json'
+    filename.write_text(UNUSUAL_BROWSER)
+
+    return filename
+
+
+def college_courses(catalog_files):
+    study_plan_file, electives_file, _ = catalog_files
+    study_plan, college_courses = read_study_plan(study_plan_file, 'Computer Engineering', 158, '3', '2')
+
+    return read_electives(electives_file, study_plan, college_courses)
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_streaming_matches_json_load(catalog_files, chunk_size):
+    browser_file = catalog_files[2]
+
+    with open(browser_file) as f:
+        expected = list( json.load(f).items() )
+
+    assert list( iter_course_browser(browser_file, chunk_size=chunk_size) ) == expected
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_streaming_matches_json_load_on_unusual_entries(unusual_browser, chunk_size):
+    expected = list( json.loads(UNUSUAL_BROWSER).items() )
+
+    assert list( iter_course_browser(unusual_browser, chunk_size=chunk_size) ) == expected
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_streaming_filters_course_codes(unusual_browser, chunk_size):
+    course_codes = { 'ENCS2110', 'COMP1310' }
+    expected = [ (key, value) for key, value in json.loads(UNUSUAL_BROWSER).items() if key.split('-')[0] in course_codes ]
+
+    assert list( iter_course_browser(unusual_browser, course_codes, chunk_size) ) == expected
+
+
+def test_streaming_rejects_truncated_browser(tmp_path):
+    filename = tmp_path / 'browser.json'
+    filename.write_text(UNUSUAL_BROWSER.rstrip()[:-1])
+
+    with pytest.raises(ValueError):
+        list( iter_course_browser(filename, chunk_size=16) )
+
+
+@pytest.mark.parametrize('chunk_size', [ 7, 1 << 16 ])
+def test_read_sections_streaming_matches_read_sections(catalog_files, chunk_size):
+    browser_file = catalog_files[2]
+
+    expected = read_sections(browser_file, college_courses(catalog_files), time_masks=True)
+    actual = read_sections_streaming(browser_file, college_courses(catalog_files), time_masks=True, chunk_size=chunk_size)
+
+    def describe(courses):
+        return {
+            code: [
+                (s.get_number(), s.get_type(), s.get_instructor(), sorted( s.get_days() ), s.get_start_time(), s.get_end_time(), s.get_time_mask())
+                for s in course.get_sections()
+            ]
+            for code, course in courses.items()
+        }
+
+    assert describe(actual) == describe(expected)
+    assert any( course.get_sections() for course in actual.values() )
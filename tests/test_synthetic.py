@@ -0,0 +1,83 @@
+import json
+from catalog import read_catalog
+from synthetic import (
+    PASSING_MARK, generate_course_browser, generate_electives, generate_student_records, generate_student_requests,
+    generate_study_plan
+)
+
+FILE_NAMES = [ 'studyPlan.txt', 'electives.txt', 'courseBrowser.json', 'records.txt', 'requests.jsonl' ]
+
+
+def generate(directory, seed):
+    """Writes a whole synthetic catalog and its students, and returns the files and what the generators returned."""
+    directory.mkdir()
+    files = [ str( directory / name ) for name in FILE_NAMES ]
+
+    plan = generate_study_plan(files[0], num_courses=40, seed=seed)
+    electives = generate_electives(files[1], plan, num_electives=10, seed=seed)
+    num_sections = generate_course_browser(files[2], [ course_code for _, _, course_code in plan ] + electives, seed=seed)
+    num_records = generate_student_records(files[3], plan, 3, 1, fail_rate=0.3, seed=seed)
+    generate_student_requests(files[4], plan, num_students=20, seed=seed)
+
+    return files, (plan, electives, num_sections, num_records)
+
+
+def read_files(files):
+    contents = []
+
+    for filename in files:
+        with open(filename) as f:
+            contents.append( f.read() )
+
+    return contents
+
+
+def test_same_seed_writes_the_same_files(tmp_path):
+    files, returned = generate(tmp_path / 'first', seed=7)
+    same_files, same_returned = generate(tmp_path / 'second', seed=7)
+    other_files, _ = generate(tmp_path / 'other', seed=8)
+
+    assert returned == same_returned
+    assert read_files(files) == read_files(same_files)
+
+    # Every generator depends on the seed
+    assert all( content != other for content, other in zip( read_files(files), read_files(other_files) ) )
+
+
+def test_same_seed_reads_the_same_catalog(tmp_path):
+    describe = lambda catalog: {
+        code: ( course.get_credit_hours(), course.get_prerequisites(), [ (s.get_instructor(), s.get_days(), s.get_start_time()) for s in course.get_sections() ] )
+        for code, course in catalog.get_courses().items()
+    }
+
+    files, (plan, electives, num_sections, _) = generate(tmp_path / 'first', seed=3)
+    same_files, _ = generate(tmp_path / 'second', seed=3)
+
+    catalog = read_catalog(*files[:3])
+
+    assert describe(catalog) == describe( read_catalog(*same_files[:3]) )
+    assert set( catalog.get_courses() ) == { course_code for _, _, course_code in plan } | set(electives)
+    assert sum( len( course.get_sections() ) for course in catalog.get_courses().values() ) == num_sections
+
+
+def test_generated_requests(tmp_path):
+    files, (plan, _, _, _) = generate(tmp_path / 'first', seed=0)
+    semesters = { ( int(year), int(semester) ) for year, semester, _ in plan }
+
+    with open(files[4]) as f:
+        requests = [ json.loads(line) for line in f ]
+
+    assert [ request['id'] for request in requests ] == [ f'student-{i}' for i in range(20) ]
+
+    for request in requests:
+        student = ( request['year'], request['semester'] )
+        taken = [ course_code for year, semester, course_code in plan if ( int(year), int(semester) ) < student ]
+
+        assert student in semesters
+        assert [ record.split('=')[0] for record in request['records'] ] == taken
+        assert all( 35 <= int( record.split('=')[1] ) <= 99 for record in request['records'] )
+
+    with open(files[3]) as f:
+        marks = [ int( line.split('=')[1] ) for line in f.read().split('\n') ]
+
+    assert any( mark < PASSING_MARK for mark in marks ) and any( mark >= PASSING_MARK for mark in marks )